@@ -1,8 +1,6 @@
 import os
 import sys
 
-from src.event_handlers import start_app
-
 # プロジェクトのルートディレクトリを特定し、sys.pathに追加
 # これは、他のモジュールが絶対パスでインポートされることを可能にする
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "."))
@@ -10,4 +8,14 @@ sys.path.insert(0, project_root)
 
 
 if __name__ == "__main__":
+    # プラグインのプロセスプール (spawn) を凍結された実行ファイルでも動かすため
+    import multiprocessing
+    multiprocessing.freeze_support()
+
+    if "--startup-profile" in sys.argv[1:]:
+        # 計測対象に含めるため、アプリケーションのインポートより前に有効化する
+        from src.utils import startup_profiler
+        startup_profiler.enable()
+
+    from src.event_handlers import start_app
     start_app()
@@ -8,13 +8,15 @@ from typing import TYPE_CHECKING, Any
 
 from src import event_handlers
 from src.core.base_application import ApplicationState, BaseApplication
+from src.core.event_dispatcher import PRIORITY_LOW
+from src.core.plugin_runner import PluginRunner
 from src.gui import menu_bar
 from src.gui.main_gui import ClipWatcherGUI
-from src.gui.windows.settings_window import SettingsWindow
+from src.utils import startup_profiler
 from src.utils.undo_manager import UndoManager
 
 if TYPE_CHECKING:
-    from src.core.clipboard_monitor import ClipboardMonitor
+    from src.core.clipboard_monitor import ClipboardMonitor, HistoryChange
     from src.core.config.settings_manager import SettingsManager
     from src.core.event_dispatcher import EventDispatcher
     from src.core.fixed_phrases_manager import FixedPhrasesManager
@@ -38,21 +40,27 @@ class MainApplication(BaseApplication):
         self.translator = translator
         self.app_status = app_status
         self.undo_manager = UndoManager(event_dispatcher)
+        # Text plugins run through the runner so that they never block the Tk thread
+        self.plugin_runner = PluginRunner()
         self.history_sort_ascending: bool = False
         self.menubar: tk.Menu | None = None
 
         event_handlers.register_class_based_handlers(self) # type: ignore
 
         self.gui = ClipWatcherGUI(master, self)
+        # Paint last session's first page right away; the full history is loaded after first paint
+        self.gui.show_warm_start(self.monitor.load_warm_start(), self.history_sort_ascending)
 
         self.monitor.set_gui_update_callback(self.update_gui)
         self.monitor.set_error_callback(self.show_error_message)
 
-        self._rebuild_menu(event=None) # Call with dummy event
+        self._create_menu()
 
         self.event_dispatcher.subscribe("HISTORY_TOGGLE_SORT", self.on_toggle_history_sort) # type: ignore
         self.event_dispatcher.subscribe("SETTINGS_CHANGED", self.on_settings_changed)
-        self.event_dispatcher.subscribe("LANGUAGE_CHANGED", self._rebuild_menu) # type: ignore
+        # Writing the startup script is file IO; keep it off the Tk thread
+        self.event_dispatcher.subscribe("SETTINGS_CHANGED", self._on_startup_setting_changed, priority=PRIORITY_LOW, on_worker=True)
+        self.event_dispatcher.subscribe("HISTORY_LOADED", self._on_history_loaded)
 
         self.master.bind("<FocusIn>", self.on_focus_in)
 
@@ -61,10 +69,23 @@ class MainApplication(BaseApplication):
         self._set_state(ApplicationState.READY)
         self.monitor.start()
         self._set_state(ApplicationState.RUNNING)
+        # Idle callbacks run after the pending redraws, i.e. after the first paint
+        self.master.after_idle(self._on_first_paint)
+
+    def _on_first_paint(self) -> None:
+        """Starts the deferred parts of startup once the main window is visible."""
+        startup_profiler.mark("first paint")
+        self.monitor.start_history_load()
+        self.gui.enable_plugin_tabs()
+
+    def _on_history_loaded(self, *args: Any) -> None:
+        startup_profiler.mark("history loaded")
+        startup_profiler.report()
 
     def shutdown(self) -> None:
         """Performs a clean shutdown of the application."""
         self.stop_monitor()
+        self.plugin_runner.shutdown()
         self.monitor.save_history_to_file()
 
     def on_closing(self) -> None:
@@ -72,19 +93,18 @@ class MainApplication(BaseApplication):
         self._set_state(ApplicationState.SHUTTING_DOWN)
         self.shutdown()
         self._set_state(ApplicationState.CLOSED)
+        self.event_dispatcher.detach_tk()
         self.master.destroy()
 
-    def _rebuild_menu(self, event: Any = None) -> None:
-        """Destroys and recreates the main menu bar, usually for language changes."""
-        if hasattr(self, 'menubar') and self.menubar: # type: ignore
-            self.menubar.destroy() # type: ignore
+    def _create_menu(self) -> None:
+        """Creates the main menu bar once; its labels follow language changes in place."""
         self.menubar = menu_bar.create_menu_bar(self.master, self) # type: ignore
         self.master.config(menu=self.menubar)
         self.theme_manager.set_menubar(self.menubar) # type: ignore
 
-    def update_gui(self, current_content: str, history: list[tuple[str, bool, float]]) -> None:
-        """Wrapper to pass sort order to the GUI."""
-        self.gui.update_clipboard_display(current_content, history, self.history_sort_ascending)
+    def update_gui(self, current_content: str, history: list[tuple[str, bool, float]], changes: list[HistoryChange] | None = None) -> None:
+        """Wrapper to pass sort order and the structural changes to the GUI."""
+        self.gui.update_clipboard_display(current_content, history, self.history_sort_ascending, changes)
 
     def on_focus_in(self, event: tk.Event | None = None) -> None:
         self.reassert_topmost()
@@ -105,6 +125,8 @@ class MainApplication(BaseApplication):
         if hasattr(self, 'always_on_top_var'): # type: ignore
             self.always_on_top_var.set(always_on_top) # type: ignore
 
+    def _on_startup_setting_changed(self, settings: dict[str, Any]) -> None:
+        """Runs on a worker thread (see the SETTINGS_CHANGED subscription)."""
         startup_enabled: bool = settings.get("startup_on_boot", False)
         self._manage_startup(startup_enabled)
 
@@ -165,7 +187,7 @@ class MainApplication(BaseApplication):
                     if os.path.exists(startup_script_path):
                         os.remove(startup_script_path)
             except Exception as e:
-                self.show_error_message("Startup Error", f"Failed to manage startup script: {e}")
+                self.event_dispatcher.call_in_main_thread(self.show_error_message, "Startup Error", f"Failed to manage startup script: {e}")
 
     def on_toggle_history_sort(self, event: Any = None) -> None:
         """Toggles the history sort order and refreshes the GUI."""
@@ -180,8 +202,14 @@ class MainApplication(BaseApplication):
         print(f"History sort order set to {'ascending' if self.history_sort_ascending else 'descending'}")
 
     def open_settings_window(self) -> None:
+        # Imported on first use to keep it off the startup path
+        from src.gui.windows.settings_window import SettingsWindow
         self.create_toplevel(SettingsWindow, self.settings_manager)
 
+    def open_diagnostics_window(self) -> None:
+        from src.gui.windows.diagnostics_window import DiagnosticsWindow
+        self.create_toplevel(DiagnosticsWindow)
+
     def create_toplevel(self, toplevel_class: type[tk.Toplevel], *args: Any, **kwargs: Any) -> tk.Toplevel:
         toplevel_window: tk.Toplevel = toplevel_class(self.master, self, *args, **kwargs) # type: ignore
 
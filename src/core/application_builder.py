@@ -133,6 +133,8 @@ class ApplicationBuilder:
             raise ConfigError("必要なコンポーネントが初期化されていません")
 
         try:
+            # Events raised off the Tk thread are delivered from master's event loop
+            self.event_dispatcher.attach_tk(master) # type: ignore
             from src.core.app_main import MainApplication
             app = MainApplication(
                 master=master,
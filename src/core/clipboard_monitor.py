@@ -5,11 +5,13 @@ import ctypes.wintypes
 import json
 import logging
 import os
+import queue
 import threading
 import time
 import tkinter as tk
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, cast
+from enum import Enum
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 try:
     import pywintypes
@@ -18,8 +20,12 @@ except ImportError:
     # このモジュールはオプションであり、利用可能性は外部から注入されるフラグによって制御されます。
     pass
 
+from src.utils.frame_scheduler import FrameScheduler
+
 from .event_dispatcher import EventDispatcher
+from .history_preview import HistoryPreview, make_preview
 from .notification_manager import NotificationManager
+from .warm_start import WarmStartRow, read_snapshot, write_snapshot
 
 if TYPE_CHECKING:
     pass  # For settings object
@@ -27,21 +33,62 @@ if TYPE_CHECKING:
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+
+class HistoryChangeKind(Enum):
+    """The kinds of structural change a history mutation can produce."""
+    INSERTED = "inserted"
+    MOVED = "moved"
+    UPDATED = "updated"
+    REMOVED = "removed"
+    RESET = "reset"
+
+
+class HistoryChange(NamedTuple):
+    """A single change to the history, identified by the item's ID (its timestamp)."""
+    kind: HistoryChangeKind
+    item_id: float | None = None
+
+
+# A chunk of loaded history items together with their precomputed previews
+_HistoryBatch = tuple[list[tuple[str, bool, float]], dict[float, HistoryPreview]]
+
+
 class ClipboardMonitor:
+    # Number of items the loader thread hands over per batch
+    LOAD_BATCH_SIZE = 200
+    # Batches merged per Tk tick, so the event loop stays responsive while loading
+    LOAD_BATCHES_PER_TICK = 4
+    LOAD_POLL_INTERVAL_MS = 15
+
     def __init__(self, tk_root: tk.Tk, event_dispatcher: EventDispatcher, history_file_path: str, win32_available: bool, history_limit: int = 50, excluded_apps: list[str] | None = None) -> None:
         self.tk_root = tk_root
         self.event_dispatcher = event_dispatcher
         self.win32_available = win32_available
         self.notification_manager = NotificationManager(None) # 設定はイベント経由で渡されます
-        self.update_callback: Callable[[str, list[tuple[str, bool, float]]], None] | None = None
+        self.update_callback: Callable[[str, list[tuple[str, bool, float]], list[HistoryChange]], None] | None = None
         self.error_callback: Callable[[str, str], None] | None = None
         self.last_clipboard_data: str = ""
         self._running: bool = False
         self.monitor_thread: threading.Thread | None = None
         self.history_file_path: str = history_file_path
-        self.history: list[tuple[str, bool, float]] = self._load_history_from_file()
+        # A first page of row previews, written at shutdown and painted before the history is loaded
+        self.warm_start_file_path: str = os.path.join(os.path.dirname(history_file_path), "warm_start.jsonl")
+        # The saved history is streamed in by start_history_load() after the first paint
+        self.history: list[tuple[str, bool, float]] = []
+        # Previews are computed once at ingest/edit and keyed by item ID
+        self.previews: dict[float, HistoryPreview] = {}
+        self.is_history_loaded: bool = False
+        # True if reading the history file stopped part-way; the file is then never overwritten
+        self.history_load_failed: bool = False
+        self._load_queue: queue.SimpleQueue[_HistoryBatch | None] = queue.SimpleQueue()
+        self._load_thread: threading.Thread | None = None
+        self._load_after_id: str | None = None
         self.history_limit: int = history_limit
         self.excluded_apps: list[str] = excluded_apps if excluded_apps is not None else []
+        self._pending_changes: list[HistoryChange] = []
+        self._changes_lock = threading.Lock()
+        # Mutations only mark the view dirty; the snapshot is taken once per frame
+        self._gui_refresh = FrameScheduler(tk_root, self._flush_gui_update)
 
         self.event_dispatcher.subscribe("SETTINGS_CHANGED", self.on_settings_changed)
 
@@ -49,7 +96,14 @@ class ClipboardMonitor:
         self.history_limit = settings.get("history_limit", 50)
         self.excluded_apps = settings.get("excluded_apps", [])
         self.notification_manager.update_settings(settings)
+        self._trim_to_limit()
+
+    def _trim_to_limit(self) -> None:
+        """Drops the oldest items beyond the history limit."""
         if len(self.history) > self.history_limit:
+            for _, _, item_id in self.history[self.history_limit:]:
+                self.previews.pop(item_id, None)
+                self._record_change(HistoryChangeKind.REMOVED, item_id)
             self.history = self.history[:self.history_limit]
             self._trigger_gui_update()
 
@@ -78,7 +132,7 @@ class ClipboardMonitor:
 
         return exe_name.value.decode(errors="ignore")
 
-    def set_gui_update_callback(self, callback: Callable[[str, list[tuple[str, bool, float]]], None]) -> None:
+    def set_gui_update_callback(self, callback: Callable[[str, list[tuple[str, bool, float]], list[HistoryChange]], None]) -> None:
         self.update_callback = callback
 
     def update_clipboard(self, text: str) -> None:
@@ -101,7 +155,13 @@ class ClipboardMonitor:
 
         # _check_clipboardのロジックを模倣して、履歴を直接更新します
         self.last_clipboard_data = text
+        self._add_or_move_to_top(text)
+
+        # GUIの更新をトリガーして新しい履歴を表示します
+        self._trigger_gui_update()
 
+    def _add_or_move_to_top(self, text: str) -> None:
+        """既存の項目を一番上に移動するか、新しい項目を追加し、その変更を記録します。"""
         existing_item_index = -1
         # The history tuple is now (content, is_pinned, timestamp)
         for i, (content, _, _) in enumerate(self.history):
@@ -110,27 +170,31 @@ class ClipboardMonitor:
                 break
 
         if existing_item_index != -1:
-            # 項目が存在する場合、一番上に移動します
+            # Preserve the existing item's data, including timestamp
             item_to_move = self.history.pop(existing_item_index)
             self.history.insert(0, item_to_move)
+            self._record_change(HistoryChangeKind.MOVED, item_to_move[2])
         else:
-            # 新しい項目の場合、一番上に追加します
-            self.history.insert(0, (text, False, time.time()))
+            # Add new item with a new timestamp
+            new_item = (text, False, time.time())
+            self.history.insert(0, new_item)
+            self.previews[new_item[2]] = make_preview(text)
+            self._record_change(HistoryChangeKind.INSERTED, new_item[2])
             # 制限を超えた場合、履歴を整理します
             if len(self.history) > self.history_limit:
                 # 削除するために最後のピン留めされていない項目を見つけます
                 unpinned_indices = [i for i, (_, is_pinned, _) in enumerate(self.history) if not is_pinned]
                 if unpinned_indices:
-                    del self.history[unpinned_indices[-1]]
-
-        # GUIの更新をトリガーして新しい履歴を表示します
-        self._trigger_gui_update()
+                    evicted = self.history.pop(unpinned_indices[-1])
+                    self.previews.pop(evicted[2], None)
+                    self._record_change(HistoryChangeKind.REMOVED, evicted[2])
 
     def _monitor_clipboard(self) -> None:
         logging.info("クリップボード監視を開始します")
         while self._running:
             try:
-                self.tk_root.after(0, self._check_clipboard)
+                # Tk はメインスレッドからのみ操作できるため、確認処理は Tk スレッドで実行する
+                self.event_dispatcher.call_in_main_thread(self._check_clipboard)
                 time.sleep(0.5)
             except RuntimeError as e:
                 logging.warning(f"Tkinterランタイムエラー: {e}")
@@ -205,26 +269,7 @@ class ClipboardMonitor:
             return
 
         # 既存の項目を一番上に移動するか、新しい項目を追加します
-        existing_item_index = -1
-        # The history tuple is now (content, is_pinned, timestamp)
-        for i, (content, _, _) in enumerate(self.history):
-            if content == clipboard_data:
-                existing_item_index = i
-                break
-
-        if existing_item_index != -1:
-            # Preserve the existing item's data, including timestamp
-            item_to_move = self.history.pop(existing_item_index)
-            self.history.insert(0, item_to_move)
-        else:
-            # Add new item with a new timestamp
-            self.history.insert(0, (clipboard_data, False, time.time()))
-            # 制限を超えた場合、履歴を整理します
-            if len(self.history) > self.history_limit:
-                # 削除するために最後のピン留めされていない項目を見つけます
-                unpinned_indices = [i for i, (_, is_pinned, _) in enumerate(self.history) if not is_pinned]
-                if unpinned_indices:
-                    del self.history[unpinned_indices[-1]]
+        self._add_or_move_to_top(clipboard_data)
 
         # GUIの更新をトリガーして新しい履歴を表示します
         self._trigger_gui_update()
@@ -264,16 +309,43 @@ class ClipboardMonitor:
                 is_last_item = (self.last_clipboard_data == content)
 
                 self.history[i] = (new_text, is_pinned, timestamp)
+                self.previews[timestamp] = make_preview(new_text)
 
                 if is_last_item:
                     self.last_clipboard_data = new_text
 
+                self._record_change(HistoryChangeKind.UPDATED, item_id)
                 self._trigger_gui_update()
                 return
 
+    def get_content_by_id(self, item_id: float) -> str | None:
+        """Returns the current content of an item, or None if it no longer exists."""
+        return next((item[0] for item in self.history if item[2] == item_id), None)
+
+    def get_preview(self, item_id: float, content: str | None = None) -> HistoryPreview:
+        """Returns the precomputed preview of an item, computing it if it is missing."""
+        preview = self.previews.get(item_id)
+        if preview is None:
+            if content is None:
+                content = next((item[0] for item in self.history if item[2] == item_id), "")
+            preview = self.previews[item_id] = make_preview(content)
+        return preview
+
+    def _record_change(self, kind: HistoryChangeKind, item_id: float | None = None) -> None:
+        """Queues a structural change to be delivered with the next GUI update."""
+        with self._changes_lock:
+            self._pending_changes.append(HistoryChange(kind, item_id))
+
     def _trigger_gui_update(self) -> None:
+        """Requests a GUI refresh; bursts of mutations are flushed together in the next frame."""
         if self.update_callback:
-            self.tk_root.after(0, self.update_callback, self.last_clipboard_data, self.get_history())
+            self._gui_refresh.request()
+
+    def _flush_gui_update(self) -> None:
+        with self._changes_lock:
+            changes, self._pending_changes = self._pending_changes, []
+        if self.update_callback:
+            self.update_callback(self.last_clipboard_data, self.get_history(), changes)
 
     def start(self) -> None:
         if not self._running:
@@ -283,6 +355,10 @@ class ClipboardMonitor:
 
     def stop(self) -> None:
         self._running = False
+        self._gui_refresh.cancel()
+        if self._load_after_id is not None:
+            self.tk_root.after_cancel(self._load_after_id)
+            self._load_after_id = None
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=2)
 
@@ -293,18 +369,26 @@ class ClipboardMonitor:
         return pinned + unpinned
 
     def clear_history(self) -> None:
+        # Batches still being loaded would otherwise bring the cleared items back
+        self.wait_for_history_load()
         self.history.clear()
+        self.previews.clear()
         self.last_clipboard_data = ""
+        self._record_change(HistoryChangeKind.RESET)
         self._trigger_gui_update()
 
     def delete_history_item_by_id(self, item_id: float) -> None:
         """Deletes a history item using its unique timestamp ID."""
+        # A batch still being loaded could hold the same content and re-add it
+        self.wait_for_history_load()
         original_len = len(self.history)
         self.history = [item for item in self.history if item[2] != item_id]
 
         if len(self.history) < original_len:
             if not self.history:
                 self.last_clipboard_data = ""
+            self.previews.pop(item_id, None)
+            self._record_change(HistoryChangeKind.REMOVED, item_id)
             self._trigger_gui_update()
             logging.info(f"ID {item_id} の履歴項目を削除しました。")
         else:
@@ -316,6 +400,7 @@ class ClipboardMonitor:
             if timestamp == item_id:
                 if not is_pinned:
                     self.history[i] = (content, True, timestamp)
+                    self._record_change(HistoryChangeKind.MOVED, item_id)
                     self._trigger_gui_update()
                 return
 
@@ -325,36 +410,24 @@ class ClipboardMonitor:
             if timestamp == item_id:
                 if is_pinned:
                     self.history[i] = (content, False, timestamp)
+                    self._record_change(HistoryChangeKind.MOVED, item_id)
                     self._trigger_gui_update()
                 return
 
     def delete_all_unpinned_history(self) -> None:
+        self.wait_for_history_load()
+        for _, is_pinned, item_id in self.history:
+            if not is_pinned:
+                self.previews.pop(item_id, None)
+                self._record_change(HistoryChangeKind.REMOVED, item_id)
         self.history = [item for item in self.history if item[1]]
         self._trigger_gui_update()
         logging.info("モニター: ピン留めされていないすべての履歴を削除しました。")
 
     def import_history(self, new_history_items: list[str]) -> None:
         for item_content in reversed(new_history_items):
-            # Check for existing item based on content
-            existing_item_index = -1
-            for i, (content, _, _) in enumerate(self.history):
-                if content == item_content:
-                    existing_item_index = i
-                    break
-
-            if existing_item_index != -1:
-                # If item exists, move it to the top
-                item_to_move = self.history.pop(existing_item_index)
-                self.history.insert(0, item_to_move)
-            else:
-                # If new, add with a timestamp
-                new_item = (item_content, False, time.time())
-                self.history.insert(0, new_item)
-                # Trim history if it exceeds the limit
-                if len(self.history) > self.history_limit:
-                    unpinned = [i for i, (_, is_pinned, _) in enumerate(self.history) if not is_pinned]
-                    if unpinned:
-                        del self.history[unpinned[-1]]
+            # If the item exists, move it to the top; otherwise add it with a timestamp
+            self._add_or_move_to_top(item_content)
         self._trigger_gui_update()
 
     def get_filtered_history(self, query: str) -> list[tuple[str, bool, float]]:
@@ -365,6 +438,98 @@ class ClipboardMonitor:
         unpinned = [item for item in filtered_raw if not item[1]]
         return pinned + unpinned
 
+    def start_history_load(self) -> None:
+        """
+        履歴ファイルをバックグラウンドスレッドで読み込み、バッチ単位でメインスレッドにマージします。
+        完了すると "HISTORY_LOADED" イベントが発行されます。
+        """
+        if self._load_thread is not None or self.is_history_loaded:
+            return
+        self._load_thread = threading.Thread(target=self._read_history_worker, daemon=True)
+        self._load_thread.start()
+        self._load_after_id = self.tk_root.after(self.LOAD_POLL_INTERVAL_MS, self._poll_history_load)
+
+    def _read_history_worker(self) -> None:
+        """Parses the history file and queues it in batches; None marks the end."""
+        try:
+            history = self._load_history_from_file()
+            for start in range(0, len(history), self.LOAD_BATCH_SIZE):
+                batch = history[start:start + self.LOAD_BATCH_SIZE]
+                self._load_queue.put((batch, {item[2]: make_preview(item[0]) for item in batch}))
+        except Exception:
+            self.history_load_failed = True
+            logging.error("履歴のバックグラウンド読み込み中に予期せぬエラーが発生しました。", exc_info=True)
+        finally:
+            self._load_queue.put(None)
+
+    def _poll_history_load(self) -> None:
+        self._load_after_id = None
+        for _ in range(self.LOAD_BATCHES_PER_TICK):
+            try:
+                batch = self._load_queue.get_nowait()
+            except queue.Empty:
+                break
+            if batch is None:
+                self._finish_history_load()
+                return
+            self._merge_loaded_batch(batch)
+        self._load_after_id = self.tk_root.after(self.LOAD_POLL_INTERVAL_MS, self._poll_history_load)
+
+    def _merge_loaded_batch(self, batch: _HistoryBatch) -> None:
+        """Appends loaded items below anything copied since startup, skipping duplicates."""
+        items, previews = batch
+        existing = {content for content, _, _ in self.history}
+        for item in items:
+            if item[0] in existing:
+                continue
+            existing.add(item[0])
+            self.history.append(item)
+            self.previews[item[2]] = previews[item[2]]
+            self._record_change(HistoryChangeKind.INSERTED, item[2])
+        self._trigger_gui_update()
+
+    def _finish_history_load(self) -> None:
+        self.is_history_loaded = True
+        self._load_thread = None
+        self._trim_to_limit()
+        self._trigger_gui_update()
+        logging.info(f"履歴の読み込みが完了しました ({len(self.history)} 件)。")
+        self.event_dispatcher.dispatch("HISTORY_LOADED")
+
+    def load_warm_start(self) -> list[WarmStartRow]:
+        """Returns the rows of the warm-start snapshot, or [] once the real history is loaded."""
+        if self.is_history_loaded:
+            return []
+        return read_snapshot(self.warm_start_file_path)
+
+    def flush_gui_update(self) -> None:
+        """Delivers a pending GUI update immediately instead of in the next frame."""
+        self._gui_refresh.flush_now()
+
+    def wait_for_history_load(self) -> bool:
+        """
+        Blocks until the saved history is loaded and merged (e.g. before saving
+        or deleting). If the background load has not started yet, the file is
+        read on the calling thread. Returns False if the file could only be
+        partly read.
+        """
+        if self.is_history_loaded:
+            return not self.history_load_failed
+        if self._load_after_id is not None:
+            self.tk_root.after_cancel(self._load_after_id)
+            self._load_after_id = None
+        if self._load_thread is None:
+            self._read_history_worker()
+        else:
+            self._load_thread.join()
+        while True:
+            batch = self._load_queue.get()
+            if batch is None:
+                break
+            self._merge_loaded_batch(batch)
+        self._finish_history_load()
+        return not self.history_load_failed
+
     def _load_history_from_file(self) -> list[tuple[str, bool, float]]:
         if os.path.exists(self.history_file_path):
             try:
@@ -386,7 +551,12 @@ class ClipboardMonitor:
         return []
 
     def save_history_to_file(self) -> None:
+        # 読み込み途中の履歴でファイルを上書きしないよう、読み込みの完了を待ちます
+        if not self.wait_for_history_load():
+            logging.error("履歴ファイルを読み込めなかったため、上書きしないよう保存を中止しました。")
+            return
         self._save_history_to_file()
+        self._save_warm_start()
 
     def _save_history_to_file(self) -> None:
         try:
@@ -396,3 +566,10 @@ class ClipboardMonitor:
             logging.error(f"履歴ファイルの保存に失敗しました: {e}", exc_info=True)
             if self.error_callback:
                 self.error_callback("履歴保存エラー", f"履歴ファイル '{self.history_file_path}' の保存に失敗しました。")
+
+    def _save_warm_start(self) -> None:
+        try:
+            write_snapshot(self.warm_start_file_path, self.get_history(), self.previews)
+        except OSError as e:
+            # 次回の起動が遅くなるだけなので、ユーザーには通知しません
+            logging.warning(f"ウォームスタート用スナップショットの保存に失敗しました: {e}")
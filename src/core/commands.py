@@ -18,3 +18,17 @@ class UpdateHistoryCommand(UndoableCommand):
     def undo(self) -> None:
         """Undoes the update, reverting the history item to the original text."""
         self.monitor.update_history_item_by_id(self.item_id, self.original_text)
+
+
+class CompoundCommand(UndoableCommand):
+    """Several commands executed, and undone, as a single step."""
+    def __init__(self, commands: list[UndoableCommand]):
+        self.commands = commands
+
+    def execute(self) -> None:
+        for command in self.commands:
+            command.execute()
+
+    def undo(self) -> None:
+        for command in reversed(self.commands):
+            command.undo()
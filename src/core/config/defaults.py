@@ -14,6 +14,8 @@ BUTTON_PADDING_Y = 5
 HISTORY_LIMIT_MIN = 10
 HISTORY_LIMIT_MAX = 1000
 HISTORY_LIMIT_INCREMENT = 10
+# Searches typed within this window run once with the latest query (ms)
+SEARCH_COALESCE_MS = 150
 
 # Default user settings dictionary
 DEFAULT_USER_SETTINGS = {
@@ -24,6 +26,11 @@ DEFAULT_USER_SETTINGS = {
     "excluded_apps": ["keepass.exe", "bitwarden.exe"],
     "startup_on_boot": False,
     "notification_sound_enabled": False,
+    "syntax_highlighting_enabled": True,
+    # Named plugin chains for the format dialog: {name: [plugin name, ...]}
+    "plugin_pipelines": {
+        "Clean Up Lines": ["Whitespace Normalizer", "Duplicate Line Remover", "Line Sorter"]
+    },
     "clipboard_content_font_family": "TkDefaultFont",
     "clipboard_content_font_size": 10,
     "history_font_family": "TkDefaultFont",
@@ -75,6 +82,18 @@ THEMES = {
         "menu_fg": "#212121",         # Text color for menus
         "active_menu_bg": "#E3F2FD",   # Background for active/hovered menu items
         "active_menu_fg": "#212121",   # Text color for active/hovered menu items
+
+        # Syntax highlighting of the clipboard content
+        "syntax_keyword": "#0033B3",
+        "syntax_string": "#067D17",
+        "syntax_number": "#1750EB",
+        "syntax_comment": "#8C8C8C",
+        "syntax_key": "#871094",
+        "syntax_tag": "#0033B3",
+        "syntax_timestamp": "#6A6A6A",
+        "syntax_error": "#D32F2F",
+        "syntax_warning": "#E65100",
+        "syntax_info": "#2E7D32",
     },
     "dark": {
         # General colors
@@ -110,5 +129,17 @@ THEMES = {
         "menu_fg": "#E0E0E0",         # Text color for menus
         "active_menu_bg": "#4A4A4A",   # Background for active/hovered menu items
         "active_menu_fg": "#FFFFFF",   # Text color for active/hovered menu items
+
+        # Syntax highlighting of the clipboard content
+        "syntax_keyword": "#CC7832",
+        "syntax_string": "#6A8759",
+        "syntax_number": "#6897BB",
+        "syntax_comment": "#808080",
+        "syntax_key": "#9876AA",
+        "syntax_tag": "#E8BF6A",
+        "syntax_timestamp": "#A9B7C6",
+        "syntax_error": "#FF6B68",
+        "syntax_warning": "#FFC66D",
+        "syntax_info": "#8BC34A",
     }
 }
@@ -1,54 +1,380 @@
+from __future__ import annotations
+
+import inspect
 import logging
+import queue
+import threading
+import time
+import tkinter as tk
 import traceback
-from collections import defaultdict
+import weakref
 from collections.abc import Callable
-from typing import Any
+from typing import Any, NamedTuple
 
+from src.utils import latency_stats
 from src.utils.error_handler import log_and_show_error
+from src.utils.latency_stats import LatencyRegistry
+from src.utils.tk_async import get_executor
 
 logger = logging.getLogger(__name__)
 
+# リスナーの優先度 (大きいほど先に呼び出される)
+PRIORITY_HIGH = 100
+PRIORITY_NORMAL = 0
+PRIORITY_LOW = -100
+
+
+class _Subscription(NamedTuple):
+    # 弱参照の購読では listener は None で、ref から解決する
+    listener: Callable[..., None] | None
+    priority: int
+    on_worker: bool
+    ref: weakref.ref[Callable[..., None]] | None
+
+    def resolve(self) -> Callable[..., None] | None:
+        return self.listener if self.ref is None else self.ref()
+
+
+# 保留中の引数と新しい引数を受け取り、配信する引数を返す関数
+MergeFunction = Callable[[tuple[Any, ...], tuple[Any, ...]], tuple[Any, ...]]
+
+
+class _CoalescingPolicy(NamedTuple):
+    window_ms: int
+    merge: MergeFunction | None
+
+
+class _PendingEvent:
+    """まとめられて配信を待っているイベント。"""
+    def __init__(self, args: tuple[Any, ...], kwargs: dict[str, Any], after_id: str) -> None:
+        self.args = args
+        self.kwargs = kwargs
+        self.after_id = after_id
+
+
 class EventDispatcher:
     """
     集中型イベントディスパッチャ。
     イベントの購読と発行を管理します。
+
+    attach_tk() の後は Tk スレッドを認識します。Tk スレッド以外から発行された
+    イベントはキューに入り、Tk のイベントループが1ティックごとにまとめて配信します。
+    キューの処理は空のキューに入った時にだけ予約されるため、アイドル中は起動しません。
+    on_worker=True で購読したリスナーはワーカースレッドプールで実行されます。
+
+    set_coalescing() を設定したイベントは、短時間に連続して発行されても
+    ウィンドウの終わりに1回だけ配信されます (最新の引数、またはマージした引数で)。
+
+    enable_profiling() でイベントごと・リスナーごとの処理時間を記録します。
+    計測は配信関数を差し替えて行うため、無効時のオーバーヘッドはありません。
     """
+    # キューに入ってから処理するまでの待ち時間 (約1フレーム)
+    DRAIN_INTERVAL_MS = 16
+
     def __init__(self) -> None:
-        self._listeners: dict[str, list[Callable[[Any], None]]] = defaultdict(list)
+        # 購読の変更はリストを置き換える (配信中のスナップショットは変更されない)
+        self._listeners: dict[str, list[_Subscription]] = {}
+        # 弱参照のコールバックは GC の途中 (ロックを保持したスレッド上) でも呼ばれるため RLock
+        self._listeners_lock = threading.RLock()
+        self._queue: queue.SimpleQueue[tuple[Callable[..., None], tuple[Any, ...], dict[str, Any]]] = queue.SimpleQueue()
+        # キューへの追加と、キューの処理が予約済みかどうかの確認をまとめて行うためのロック
+        self._queue_lock = threading.Lock()
+        self._drain_scheduled = False
+        self._tk_root: tk.Misc | None = None
+        self._tk_thread_id: int | None = None
+        self._drain_after_id: str | None = None
+        # 配信関数 (計測の有効/無効で差し替える)
+        self._deliver: Callable[..., None] = self._deliver_plain
+        self._run_on_worker: Callable[[str, Callable[..., None], tuple[Any, ...], dict[str, Any]], None] = self._run_on_worker_plain
+        # イベントタイプごとのまとめ方と、配信待ちのイベント (Tk スレッドからのみ操作する)
+        self._coalescing: dict[str, _CoalescingPolicy] = {}
+        self._pending: dict[str, _PendingEvent] = {}
+        self.event_stats = LatencyRegistry()
+        # イベントタイプごとのリスナーの処理時間
+        self.listener_stats: dict[str, LatencyRegistry] = {}
+
+    def attach_tk(self, tk_root: tk.Misc) -> None:
+        """
+        Tk スレッドからイベントを配信するためのキューの処理を開始します。
+        Tk のメインループを実行するスレッドから呼び出してください。
+        """
+        self._tk_root = tk_root
+        self._tk_thread_id = threading.get_ident()
+        # attach_tk() の前に予約された呼び出しを処理する
+        self._schedule_drain()
 
-    def subscribe(self, event_type: str, listener: Callable[[Any], None]) -> None:
+    def detach_tk(self) -> None:
+        """キューの処理を停止します。未配信のイベントは破棄されます。"""
+        if self._tk_root is not None:
+            for after_id in [self._drain_after_id] + [pending.after_id for pending in self._pending.values()]:
+                if after_id is None:
+                    continue
+                try:
+                    self._tk_root.after_cancel(after_id)
+                except tk.TclError:
+                    pass  # ルートウィンドウは既に破棄されている
+        self._drain_after_id = None
+        with self._queue_lock:
+            self._drain_scheduled = False
+        self._pending.clear()
+        self._tk_root = None
+        self._tk_thread_id = None
+
+    def is_tk_thread(self) -> bool:
+        """現在のスレッドが Tk スレッドかどうかを返します。attach_tk() の前は常に True です。"""
+        return self._tk_thread_id is None or self._tk_thread_id == threading.get_ident()
+
+    def subscribe(self, event_type: str, listener: Callable[..., None], priority: int = PRIORITY_NORMAL, on_worker: bool = False, weak: bool = False) -> None:
         """
         指定されたイベントタイプにリスナーを登録します。
 
         Args:
             event_type (str): 購読するイベントのタイプ。
-            listener (Callable[[Any], None]): イベント発生時に呼び出される関数。
+            listener (Callable[..., None]): イベント発生時に呼び出される関数。
+            priority (int): 優先度。大きいリスナーから順に呼び出されます (同じ優先度では登録順)。
+            on_worker (bool): True の場合、リスナーは Tk スレッドではなくワーカースレッドで実行されます。
+                Tk ウィジェットには触れず、必要なら call_in_main_thread() を使ってください。
+            weak (bool): True の場合、リスナーを弱参照で保持します。バインドメソッドは WeakMethod で
+                保持され、インスタンス (ウィジェットなど) が回収されると購読も自動的に削除されます。
+                ラムダなど他から参照されない関数は、すぐに回収されるため指定しないでください。
         """
-        self._listeners[event_type].append(listener)
+        if weak:
+            def prune(ref: weakref.ref[Any]) -> None:
+                self._remove(event_type, lambda s: s.ref is ref)
+            ref: weakref.ref[Callable[..., None]] = weakref.WeakMethod(listener, prune) if inspect.ismethod(listener) else weakref.ref(listener, prune)
+            subscription = _Subscription(None, priority, on_worker, ref)
+        else:
+            subscription = _Subscription(listener, priority, on_worker, None)
+        with self._listeners_lock:
+            subscriptions = list(self._listeners.get(event_type, ()))
+            index = len(subscriptions)
+            while index > 0 and subscriptions[index - 1].priority < priority:
+                index -= 1
+            subscriptions.insert(index, subscription)
+            self._listeners[event_type] = subscriptions
 
-    def unsubscribe(self, event_type: str, listener: Callable[[Any], None]) -> None:
+    def unsubscribe(self, event_type: str, listener: Callable[..., None]) -> None:
         """
         指定されたイベントタイプからリスナーの登録を解除します。
 
         Args:
             event_type (str): 登録解除するイベントのタイプ。
-            listener (Callable[[Any], None]): 登録解除する関数。
+            listener (Callable[..., None]): 登録解除する関数。
         """
-        if listener in self._listeners[event_type]:
-            self._listeners[event_type].remove(listener)
+        self._remove(event_type, lambda s: s.resolve() == listener)
+
+    def _remove(self, event_type: str, predicate: Callable[[_Subscription], bool]) -> None:
+        with self._listeners_lock:
+            subscriptions = self._listeners.get(event_type)
+            if subscriptions is None:
+                return
+            remaining = [s for s in subscriptions if not predicate(s)]
+            if remaining:
+                self._listeners[event_type] = remaining
+            else:
+                del self._listeners[event_type]
+
+    def listener_counts(self) -> dict[str, int]:
+        """デバッグ用に、イベントタイプごとの (回収されていない) リスナーの数を返します。"""
+        with self._listeners_lock:
+            listeners = list(self._listeners.items())
+        return {event_type: sum(1 for s in subscriptions if s.resolve() is not None) for event_type, subscriptions in sorted(listeners)}
 
     def dispatch(self, event_type: str, *args: Any, **kwargs: Any) -> None:
         """
         指定されたイベントタイプを発行し、登録されているすべてのリスナーを呼び出します。
+        Tk スレッド以外から呼び出された場合は、Tk スレッドでの配信を予約します。
 
         Args:
             event_type (str): 発行するイベントのタイプ。
             *args: リスナーに渡す位置引数。
             **kwargs: リスナーに渡すキーワード引数。
         """
-        for listener in self._listeners[event_type]:
+        if self.is_tk_thread():
+            self._route(event_type, *args, **kwargs)
+        else:
+            self._enqueue(self._route, (event_type, *args), kwargs)
+
+    def dispatch_async(self, event_type: str, *args: Any, **kwargs: Any) -> None:
+        """
+        イベントを Tk スレッドの次のティックで配信するよう予約し、すぐに戻ります。
+        どのスレッドからでも呼び出せます。attach_tk() の前は dispatch() と同じです。
+        """
+        if self._tk_thread_id is None:
+            self._route(event_type, *args, **kwargs)
+        else:
+            self._enqueue(self._route, (event_type, *args), kwargs)
+
+    def set_coalescing(self, event_type: str, window_ms: int, merge: MergeFunction | None = None) -> None:
+        """
+        連続して発行されるイベントをまとめて配信するよう設定します。
+
+        最初の発行から window_ms の間に発行されたイベントは、ウィンドウの終わりに
+        1回だけ配信されます。merge を省略すると最新の引数が使われ (latest-wins)、
+        指定すると merge(保留中の引数, 新しい引数) の結果が使われます。
+        キーワード引数は常に最新のものが使われます。attach_tk() の前は即座に配信されます。
+        """
+        self._coalescing[event_type] = _CoalescingPolicy(window_ms, merge)
+
+    def clear_coalescing(self, event_type: str) -> None:
+        """まとめる設定を解除します。配信待ちのイベントはすぐに配信されます。"""
+        self._coalescing.pop(event_type, None)
+        self.flush_coalesced(event_type)
+
+    def flush_coalesced(self, event_type: str | None = None) -> None:
+        """配信待ちのイベント (省略時はすべて) をすぐに配信します。Tk スレッドから呼び出してください。"""
+        event_types = [event_type] if event_type is not None else list(self._pending)
+        for pending_type in event_types:
+            pending = self._pending.get(pending_type)
+            if pending is not None and self._tk_root is not None:
+                self._tk_root.after_cancel(pending.after_id)
+                self._deliver_pending(pending_type)
+
+    def _route(self, event_type: str, *args: Any, **kwargs: Any) -> None:
+        """Tk スレッドで、まとめる設定に従ってイベントを配信または保留します。"""
+        policy = self._coalescing.get(event_type)
+        if policy is None or self._tk_root is None:
+            self._deliver(event_type, *args, **kwargs)
+            return
+        pending = self._pending.get(event_type)
+        if pending is None:
+            after_id = self._tk_root.after(policy.window_ms, self._deliver_pending, event_type)
+            self._pending[event_type] = _PendingEvent(args, kwargs, after_id)
+            return
+        pending.args = policy.merge(pending.args, args) if policy.merge is not None else args
+        pending.kwargs = kwargs
+
+    def _deliver_pending(self, event_type: str) -> None:
+        pending = self._pending.pop(event_type, None)
+        if pending is not None:
+            self._deliver(event_type, *pending.args, **pending.kwargs)
+
+    def call_in_main_thread(self, func: Callable[..., None], *args: Any, **kwargs: Any) -> None:
+        """
+        func を Tk スレッドで呼び出すよう予約します。どのスレッドからでも呼び出せます。
+        attach_tk() の前に予約した呼び出しは、attach_tk() の後に実行されます。
+        """
+        self._enqueue(func, args, kwargs)
+
+    def _enqueue(self, func: Callable[..., None], args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        self._queue.put((func, args, kwargs))
+        self._schedule_drain()
+
+    def _schedule_drain(self) -> None:
+        """キューの処理がまだ予約されていなければ予約します。どのスレッドからでも呼び出せます。"""
+        with self._queue_lock:
+            tk_root = self._tk_root
+            if self._drain_scheduled or tk_root is None or self._queue.empty():
+                return
+            self._drain_scheduled = True
+        try:
+            self._drain_after_id = tk_root.after(self.DRAIN_INTERVAL_MS, self._drain_queue)
+        except (RuntimeError, tk.TclError) as e:
+            # メインループの開始前や終了後。次に追加された時に再び予約する
+            with self._queue_lock:
+                self._drain_scheduled = False
+            logger.debug(f"Could not schedule the event queue: {e}")
+
+    def _drain_queue(self) -> None:
+        """ティックの開始時点でキューにあるものをまとめて処理します。"""
+        self._drain_after_id = None
+        pending = self._queue.qsize()
+        for _ in range(pending):
+            try:
+                func, args, kwargs = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                logger.error(f"Error in queued call {getattr(func, '__name__', func)}", exc_info=True)
+        # 処理中に追加されたものは次のティックで処理する
+        with self._queue_lock:
+            self._drain_scheduled = False
+        self._schedule_drain()
+
+    def _deliver_plain(self, event_type: str, *args: Any, **kwargs: Any) -> None:
+        for subscription in self._listeners.get(event_type, ()):
+            listener = subscription.resolve()
+            if listener is None:
+                continue  # 回収済み (購読は弱参照のコールバックで削除される)
+            if subscription.on_worker:
+                get_executor().submit(self._run_on_worker, event_type, listener, args, kwargs)
+                continue
             try:
                 listener(*args, **kwargs)
             except Exception:
                 # エラーハンドリングを強化することも可能
-                log_and_show_error("エラー",f"Error dispatching event {event_type} to listener {listener.__name__}: {traceback.format_exc()}", exc_info=True)
+                log_and_show_error("エラー", f"Error dispatching event {event_type} to listener {listener.__name__}: {traceback.format_exc()}", exc_info=True)
+
+    def _run_on_worker_plain(self, event_type: str, listener: Callable[..., None], args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        try:
+            listener(*args, **kwargs)
+        except Exception:
+            # メッセージボックスは Tk スレッドで表示する
+            self.call_in_main_thread(log_and_show_error, "エラー", f"Error dispatching event {event_type} to listener {listener.__name__}: {traceback.format_exc()}")
+
+    # --- 計測 ---
+
+    @property
+    def is_profiling(self) -> bool:
+        return self._deliver == self._deliver_timed
+
+    def enable_profiling(self) -> None:
+        """イベントとリスナーの処理時間の記録を開始します。"""
+        self._deliver = self._deliver_timed
+        self._run_on_worker = self._run_on_worker_timed
+
+    def disable_profiling(self) -> None:
+        """記録を停止します。記録済みの統計は reset_profiling() まで保持されます。"""
+        self._deliver = self._deliver_plain
+        self._run_on_worker = self._run_on_worker_plain
+
+    def reset_profiling(self) -> None:
+        self.event_stats.reset()
+        self.listener_stats.clear()
+
+    def latency_report(self) -> dict[str, Any]:
+        """
+        記録した統計を返します (時間はミリ秒)。
+        events のイベントの時間は Tk スレッドをブロックした時間で、ワーカーリスナーは含みません。
+        """
+        return {
+            "events": self.event_stats.summaries(),
+            "listeners": {event_type: registry.summaries() for event_type, registry in list(self.listener_stats.items())},
+            "listener_counts": self.listener_counts(),
+        }
+
+    def dump_latency_report(self, file_path: str) -> None:
+        """latency_report() を JSON ファイルに書き出します。"""
+        latency_stats.dump_json(self.latency_report(), file_path)
+
+    def _record_listener(self, event_type: str, listener: Callable[..., None], on_worker: bool, seconds: float) -> None:
+        registry = self.listener_stats.get(event_type)
+        if registry is None:
+            registry = self.listener_stats.setdefault(event_type, LatencyRegistry())
+        name = getattr(listener, "__qualname__", repr(listener))
+        registry.record(f"{name} (worker)" if on_worker else name, seconds)
+
+    def _deliver_timed(self, event_type: str, *args: Any, **kwargs: Any) -> None:
+        perf_counter = time.perf_counter
+        event_start = perf_counter()
+        for subscription in self._listeners.get(event_type, ()):
+            listener = subscription.resolve()
+            if listener is None:
+                continue
+            if subscription.on_worker:
+                get_executor().submit(self._run_on_worker, event_type, listener, args, kwargs)
+                continue
+            start = perf_counter()
+            try:
+                listener(*args, **kwargs)
+            except Exception:
+                log_and_show_error("エラー", f"Error dispatching event {event_type} to listener {listener.__name__}: {traceback.format_exc()}", exc_info=True)
+            self._record_listener(event_type, listener, False, perf_counter() - start)
+        self.event_stats.record(event_type, perf_counter() - event_start)
+
+    def _run_on_worker_timed(self, event_type: str, listener: Callable[..., None], args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        start = time.perf_counter()
+        self._run_on_worker_plain(event_type, listener, args, kwargs)
+        self._record_listener(event_type, listener, True, time.perf_counter() - start)
@@ -13,3 +13,15 @@ class ConfigError(ClipWatcherError):
 class PhraseError(ClipWatcherError):
     """定型文関連のエラー"""
     pass
+
+class PluginError(ClipWatcherError):
+    """プラグインの実行に関連するエラー"""
+    pass
+
+class PluginTimeoutError(PluginError):
+    """プラグインの処理が制限時間内に終わらなかった"""
+    pass
+
+class PluginCancelledError(PluginError):
+    """プラグインの処理がキャンセルされた"""
+    pass
@@ -0,0 +1,62 @@
+"""
+Bounded previews of history items.
+
+A preview is computed once when an item is added or edited, so list rows,
+menus and log lines never have to touch the (possibly very large) content.
+"""
+import re
+from typing import NamedTuple
+
+PREVIEW_LENGTH = 100
+
+# Each match is bounded, so a huge unbroken run of text is never copied.
+_WORD_PATTERN = re.compile(rf"\S{{1,{PREVIEW_LENGTH}}}")
+
+
+class HistoryPreview(NamedTuple):
+    """The display data of a history item."""
+    text: str  # First characters of the content, whitespace collapsed
+    truncated: bool
+    line_count: int
+    size: int  # UTF-8 size in bytes
+
+    @property
+    def badge(self) -> str:
+        """A short "lines / size" badge, empty for small single-line items."""
+        parts: list[str] = []
+        if self.line_count > 1:
+            parts.append(f"{self.line_count} lines")
+        if self.size >= 1024:
+            parts.append(format_size(self.size))
+        return f"[{', '.join(parts)}]" if parts else ""
+
+    def label(self) -> str:
+        """The preview text with an ellipsis if the content was cut."""
+        return f"{self.text}..." if self.truncated else self.text
+
+
+def format_size(size: int) -> str:
+    """Formats a byte count as B / KB / MB."""
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def make_preview(content: str, length: int = PREVIEW_LENGTH) -> HistoryPreview:
+    """Builds the preview of a content string, scanning only as far as needed."""
+    words: list[str] = []
+    collected = 0
+    last_end = 0
+    for match in _WORD_PATTERN.finditer(content):
+        words.append(match.group())
+        collected += len(words[-1]) + 1
+        last_end = match.end()
+        if collected - 1 >= length:
+            break
+
+    joined = " ".join(words)
+    truncated = len(joined) > length or _WORD_PATTERN.search(content, last_end) is not None
+    line_count = content.count("\n") + 1 if content else 0
+    return HistoryPreview(joined[:length], truncated, line_count, len(content.encode("utf-8", errors="replace")))
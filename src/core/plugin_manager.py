@@ -12,12 +12,18 @@ logger = logging.getLogger(__name__)
 
 class PluginManager:
     def __init__(self) -> None:
-        self.plugins: list[Plugin] = []
-        self.load_plugins()
+        # Plugin modules are imported on first use rather than at startup
+        self._plugins: list[Plugin] | None = None
+
+    @property
+    def plugins(self) -> list[Plugin]:
+        if self._plugins is None:
+            self.load_plugins()
+        return self._plugins # type: ignore[return-value]
 
     def load_plugins(self) -> None:
         """Dynamically load all plugins from the plugins package."""
-        self.plugins = []
+        self._plugins = []
         plugin_path = plugins_package.__path__
         plugin_prefix = plugins_package.__name__ + "."
 
@@ -26,7 +32,7 @@ class PluginManager:
                 module = importlib.import_module(name)
                 for class_name, obj in inspect.getmembers(module, inspect.isclass):
                     if issubclass(obj, Plugin) and obj is not Plugin:
-                        self.plugins.append(obj())
+                        self._plugins.append(obj())
                         logger.info(f"Successfully loaded plugin: {class_name}")
             except Exception as e:
                 logger.error(f"Failed to load plugin from {name}: {e}", exc_info=True)
@@ -40,7 +46,7 @@ class PluginManager:
         text_plugins: list[Plugin] = []
         for plugin in self.plugins:
             # A plugin is a text plugin if its `process` method is different from the base class's.
-            if plugin.process.__func__ is not Plugin.process.__func__: # type: ignore
+            if type(plugin).process is not Plugin.process:
                 text_plugins.append(plugin)
         return text_plugins
 
@@ -0,0 +1,141 @@
+"""
+Named chains of text plugins, saved as presets in the "plugin_pipelines" setting.
+
+A pipeline is itself a Plugin, so it runs as a single PluginRunner job and its
+result is committed as a single UpdateHistoryCommand. Intermediate results
+stay in memory, and consecutive line-oriented stages are fused: the text is
+split into lines once, every stage of the run works on the list, and the
+lines are joined once at the end. The result is the same as running each
+stage's process() in turn: joining and splitting again between two stages
+would drop a trailing empty line, so a fused run drops it as well. A pipeline of streaming stages streams,
+each stage pulling lines from the previous one.
+"""
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from src.core.exceptions import PluginError
+from src.plugins.base_plugin import Plugin
+
+if TYPE_CHECKING:
+    from src.core.config.settings_manager import SettingsManager
+
+logger = logging.getLogger(__name__)
+
+SETTING_KEY = "plugin_pipelines"
+
+
+class PluginPipeline(Plugin):
+    """Applies its stages in order."""
+    def __init__(self, name: str, stages: list[Plugin]) -> None:
+        if not stages:
+            raise PluginError(f"Pipeline '{name}' has no stages.")
+        self._name = name
+        self.stages = stages
+        # Worth a separate process as soon as one stage is
+        self.cpu_bound = any(stage.cpu_bound for stage in stages)
+        self.line_oriented = all(stage.line_oriented for stage in stages)
+        self.streaming = self.line_oriented and all(stage.streaming for stage in stages)
+        self.pure = all(stage.pure for stage in stages)
+        self._groups = _fuse_line_stages(stages)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return " → ".join(stage.name for stage in self.stages)
+
+    def cache_key(self) -> str | None:
+        # Keyed by the stages rather than the preset name, which can be edited
+        stage_keys = [stage.cache_key() for stage in self.stages]
+        if None in stage_keys:
+            return None
+        return "pipeline:" + "|".join(key for key in stage_keys if key is not None)
+
+    def process(self, text: str) -> str:
+        for group in self._groups:
+            if isinstance(group, list):
+                text = "\n".join(self._process_line_group(group, text.splitlines()))
+            else:
+                text = group.process(text)
+        return text
+
+    def process_lines(self, lines: list[str]) -> list[str]:
+        return self._process_line_group(self.stages, lines)
+
+    def process_stream(self, lines: Iterable[str]) -> Iterator[str]:
+        # Each stage pulls lines from the one before it
+        for index, stage in enumerate(self.stages):
+            lines = stage.process_stream(lines if index == 0 else _drop_trailing_empty_line(lines))
+        return iter(lines)
+
+    @staticmethod
+    def _process_line_group(stages: list[Plugin], lines: list[str]) -> list[str]:
+        for index, stage in enumerate(stages):
+            if index > 0 and lines and lines[-1] == "":
+                lines = lines[:-1]
+            lines = stage.process_lines(lines)
+        return lines
+
+
+def _drop_trailing_empty_line(lines: Iterable[str]) -> Iterator[str]:
+    """Yields the lines except a last empty one, as joining and splitting them again would."""
+    held_empty = False
+    for line in lines:
+        if held_empty:
+            yield ""
+        held_empty = line == ""
+        if not held_empty:
+            yield line
+
+
+def _fuse_line_stages(stages: list[Plugin]) -> list[Plugin | list[Plugin]]:
+    """Groups runs of consecutive line-oriented stages into lists."""
+    groups: list[Plugin | list[Plugin]] = []
+    for stage in stages:
+        if stage.line_oriented:
+            last = groups[-1] if groups else None
+            if isinstance(last, list):
+                last.append(stage)
+            else:
+                groups.append([stage])
+        else:
+            groups.append(stage)
+    return groups
+
+
+def build_pipeline(name: str, stage_names: list[str], plugins: list[Plugin]) -> PluginPipeline:
+    """Creates a pipeline from plugin names; raises PluginError for unknown names."""
+    plugins_by_name = {plugin.name: plugin for plugin in plugins}
+    missing = [stage_name for stage_name in stage_names if stage_name not in plugins_by_name]
+    if missing:
+        raise PluginError(f"Pipeline '{name}' uses unknown plugins: {', '.join(missing)}")
+    return PluginPipeline(name, [plugins_by_name[stage_name] for stage_name in stage_names])
+
+
+def get_presets(settings_manager: SettingsManager) -> dict[str, list[str]]:
+    """Returns the saved pipelines as {name: [plugin name, ...]}."""
+    presets: Any = settings_manager.get_setting(SETTING_KEY, {})
+    if not isinstance(presets, dict):
+        return {}
+    return {str(name): [str(stage) for stage in stages] for name, stages in presets.items() if isinstance(stages, list)}
+
+
+def save_presets(settings_manager: SettingsManager, presets: dict[str, list[str]]) -> None:
+    settings_manager.set_setting(SETTING_KEY, presets)
+    settings_manager.save_settings()
+
+
+def load_pipelines(settings_manager: SettingsManager, plugins: list[Plugin]) -> list[PluginPipeline]:
+    """Builds the saved pipelines, skipping those that reference missing plugins."""
+    pipelines: list[PluginPipeline] = []
+    for name, stage_names in get_presets(settings_manager).items():
+        try:
+            pipelines.append(build_pipeline(name, stage_names, plugins))
+        except PluginError as e:
+            logger.warning(f"Skipped pipeline preset: {e}")
+    return pipelines
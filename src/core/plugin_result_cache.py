@@ -0,0 +1,81 @@
+"""
+An LRU cache of text plugin results, bounded by the total size of the cached
+results.
+
+Entries are keyed by (Plugin.cache_key(), content hash), so only plugins that
+declare themselves pure are cached, and bumping a plugin's version or changing
+its options makes its old entries unreachable; they are evicted in LRU order.
+"""
+from __future__ import annotations
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.plugins.base_plugin import Plugin
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+CacheKey = tuple[str, str]
+
+
+def content_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8", errors="surrogatepass"), digest_size=16).hexdigest()
+
+
+class PluginResultCache:
+    """A thread-safe LRU of plugin results; results are stored on worker threads."""
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[CacheKey, str] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(plugin: Plugin, text: str) -> CacheKey | None:
+        """Returns the key of text processed by plugin, or None if the plugin is not cacheable."""
+        plugin_key = plugin.cache_key()
+        if plugin_key is None:
+            return None
+        return (plugin_key, content_hash(text))
+
+    def get(self, key: CacheKey) -> str | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: CacheKey, result: str) -> None:
+        size = sys.getsizeof(result)
+        if size > self.max_bytes:
+            return  # Would evict everything else and still not fit
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= sys.getsizeof(previous)
+            self._entries[key] = result
+            self._size_bytes += size
+            while self._size_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= sys.getsizeof(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
@@ -0,0 +1,318 @@
+"""
+Runs text plugins off the Tk thread.
+
+Plugins marked cpu_bound are run in a spawned process pool once the input is
+large enough to be worth the transfer, so they neither hold the GIL nor
+survive a cancel. Each such job gets a pool of its own, so cancelling or
+timing out one job terminates only its own processes. Other plugins run on
+the shared worker thread pool; a thread cannot be stopped, so a cancelled
+thread job finishes in the background and its result is discarded. Results
+are delivered on the Tk thread by polling with after().
+
+Large inputs of streaming plugins are processed line by line (see
+plugin_stream), and run_file() streams whole files from disk to disk.
+Results of pure plugins are looked up in a PluginResultCache first; texts
+that repeat within a batch are processed once.
+"""
+from __future__ import annotations
+
+import functools
+import logging
+import multiprocessing
+import multiprocessing.pool
+import os
+import threading
+import time
+import tkinter as tk
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+
+from src.core import plugin_stream
+from src.core.exceptions import PluginTimeoutError
+from src.core.plugin_result_cache import CacheKey, PluginResultCache
+from src.utils.tk_async import get_executor
+
+if TYPE_CHECKING:
+    from src.plugins.base_plugin import Plugin
+
+logger = logging.getLogger(__name__)
+
+# Inputs shorter than this are processed on a thread even by cpu_bound plugins
+PROCESS_MIN_CHARS = 1_000_000
+PROCESS_POOL_SIZE = 2
+DEFAULT_TIMEOUT_S = 60.0
+DEFAULT_BATCH_TIMEOUT_S = 300.0
+POLL_INTERVAL_MS = 50
+
+
+def _run_into(future: Future[str], func: Callable[..., str], *args: object) -> None:
+    """Runs on a worker thread; a job cancelled before the thread got to it is skipped."""
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        future.set_result(func(*args))
+    except BaseException as e:
+        future.set_exception(e)
+
+
+def _copy_outcome(target: Future[str], source: Future[str]) -> None:
+    """Gives the future of a repeated text the outcome of its first occurrence."""
+    if source.cancelled() or not target.set_running_or_notify_cancel():
+        return
+    error = source.exception()
+    if error is None:
+        target.set_result(source.result())
+    else:
+        target.set_exception(error)
+
+
+# The result of one text in a job: the processed text, or the exception raised for it
+ItemResult = str | BaseException
+
+
+class PluginJob:
+    """
+    A plugin processing one or more texts. Once every text is done,
+    on_done(results) is called on the Tk thread with one ItemResult per text,
+    in order; on_error(error) is called instead if the job times out. Neither
+    is called after cancel(). on_progress(done, total) reports completed texts.
+    """
+    def __init__(self, runner: PluginRunner, tk_widget: tk.Misc, plugin: Plugin, pool: multiprocessing.pool.Pool | None, timeout: float | None, on_done: Callable[[list[ItemResult]], None], on_error: Callable[[BaseException], None], on_progress: Callable[[int, int], None] | None = None) -> None:
+        self.runner = runner
+        self.tk_widget = tk_widget
+        self.plugin = plugin
+        self.pool = pool
+        self.timeout = timeout
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.started_at = time.monotonic()
+        # Set on cancel(); thread jobs that can stop early (process_file) watch it
+        self.cancel_event = threading.Event()
+        # A partial output file of a process job, removed once its pool is terminated
+        self.partial_path: str | None = None
+        self._futures: list[Future[str]] = []
+        self._done_count = 0
+        self._after_id: str | None = None
+        self._finished = False
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def in_process(self) -> bool:
+        return self.pool is not None
+
+    @property
+    def is_running(self) -> bool:
+        return not self._finished
+
+    @property
+    def total(self) -> int:
+        return len(self._futures)
+
+    @property
+    def done_count(self) -> int:
+        return self._done_count
+
+    def cancel(self) -> None:
+        """Stops waiting for the results; process jobs are also terminated."""
+        if self._finished:
+            return
+        self.cancel_event.set()
+        self._finish(terminate=True)
+        for future in self._futures:
+            future.cancel()
+        logger.info(f"Cancelled plugin '{self.plugin.name}' after {self.elapsed:.1f} s ({self._done_count}/{self.total} done)")
+
+    def _start(self, futures: list[Future[str]]) -> None:
+        self._futures = futures
+        self._after_id = self.tk_widget.after(POLL_INTERVAL_MS, self._poll)
+
+    def _finish(self, terminate: bool = False) -> None:
+        self._finished = True
+        if self._after_id is not None:
+            try:
+                self.tk_widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass  # The widget has already been destroyed
+            self._after_id = None
+        if self.pool is not None:
+            self.runner._release_pool(self.pool, terminate, self.partial_path)
+
+    def _poll(self) -> None:
+        self._after_id = None
+        if self._finished:
+            return
+        done_count = sum(1 for future in self._futures if future.done())
+        if done_count != self._done_count:
+            self._done_count = done_count
+            if self.on_progress is not None:
+                self.on_progress(done_count, self.total)
+        if done_count < self.total:
+            if self.timeout is not None and self.elapsed > self.timeout:
+                self.cancel()
+                self.on_error(PluginTimeoutError(f"'{self.plugin.name}' did not finish within {self.timeout:g} seconds."))
+                return
+            self._after_id = self.tk_widget.after(POLL_INTERVAL_MS, self._poll)
+            return
+        self._finish()
+        results: list[ItemResult] = []
+        for future in self._futures:
+            error = future.exception()
+            results.append(future.result() if error is None else error)
+        self.on_done(results)
+
+
+def _single_result(on_done: Callable[[str], None], on_error: Callable[[BaseException], None]) -> Callable[[list[ItemResult]], None]:
+    """Adapts the callbacks of a one-item job to the list of results."""
+    def on_results(results: list[ItemResult]) -> None:
+        result = results[0]
+        if isinstance(result, BaseException):
+            on_error(result)
+        else:
+            on_done(result)
+    return on_results
+
+
+class PluginRunner:
+    """Starts plugin jobs on the process pool or the worker threads."""
+    def __init__(self, process_min_chars: int = PROCESS_MIN_CHARS, cache: PluginResultCache | None = None) -> None:
+        self.process_min_chars = process_min_chars
+        self.cache = cache if cache is not None else PluginResultCache()
+        self._pools: set[multiprocessing.pool.Pool] = set()
+        self._pools_lock = threading.Lock()
+
+    def uses_process(self, plugin: Plugin, texts: list[str]) -> bool:
+        return plugin.cpu_bound and sum(len(text) for text in texts) >= self.process_min_chars
+
+    def run_batch(self, tk_widget: tk.Misc, plugin: Plugin, texts: list[str], on_done: Callable[[list[ItemResult]], None], on_error: Callable[[BaseException], None], on_progress: Callable[[int, int], None] | None = None, timeout: float | None = DEFAULT_BATCH_TIMEOUT_S) -> PluginJob:
+        """
+        Processes several texts with a plugin in parallel, one task per distinct
+        uncached text, on a process pool (cpu_bound plugins with enough input)
+        or the worker threads. Hashing the texts for the cache can take as long
+        as a fast plugin, so it is done on a worker thread as well.
+        """
+        pool = self._new_pool(len(texts)) if self.uses_process(plugin, texts) else None
+        job = PluginJob(self, tk_widget, plugin, pool, timeout, on_done, on_error, on_progress)
+        futures: list[Future[str]] = [Future() for _ in texts]
+        job._start(futures)
+        get_executor().submit(self._submit_batch, job, texts, futures)
+        return job
+
+    def _submit_batch(self, job: PluginJob, texts: list[str], futures: list[Future[str]]) -> None:
+        """Runs on a worker thread: serves repeated and cached texts and submits the rest."""
+        plugin = job.plugin
+        first_by_key: dict[CacheKey, Future[str]] = {}
+        submitted = 0
+        index = 0
+        try:
+            for index in range(len(texts)):
+                text, future = texts[index], futures[index]
+                if job.cancel_event.is_set():
+                    return
+                key = self.cache.make_key(plugin, text)
+                if key is not None:
+                    first = first_by_key.get(key)
+                    if first is not None:
+                        first.add_done_callback(functools.partial(_copy_outcome, future))
+                        continue
+                    first_by_key[key] = future
+                    cached = self.cache.get(key)
+                    if cached is not None:
+                        if future.set_running_or_notify_cancel():
+                            future.set_result(cached)
+                        continue
+                    future.add_done_callback(functools.partial(self._store, key))
+                # The plugin is pickled into the pool process along with the text
+                self._submit(future, job.pool, plugin_stream.process_text, plugin, text)
+                submitted += 1
+        except Exception as e:
+            # E.g. the pool was terminated by a cancel while the texts were being submitted
+            for future in futures[index:]:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        if submitted < len(texts):
+            logger.debug(f"'{plugin.name}': {len(texts) - submitted} of {len(texts)} texts served from the cache or repeated")
+
+    def run_file(self, tk_widget: tk.Misc, plugin: Plugin, input_path: str, output_path: str, on_done: Callable[[str], None], on_error: Callable[[BaseException], None], timeout: float | None = None) -> PluginJob:
+        """
+        Processes a file into another file in the background, streaming it
+        through line-oriented plugins; on_done(output_path) is called when done.
+        """
+        try:
+            in_process = plugin.cpu_bound and os.path.getsize(input_path) >= self.process_min_chars
+        except OSError:
+            in_process = False # process_file() reports the error
+        pool = self._new_pool(1) if in_process else None
+        job = PluginJob(self, tk_widget, plugin, pool, timeout, _single_result(on_done, on_error), on_error)
+        future: Future[str] = Future()
+        if pool is not None:
+            # A terminated process cannot clean up after itself; an Event cannot be sent to it either
+            job.partial_path = plugin_stream.partial_path_for(output_path)
+            self._submit(future, pool, plugin_stream.process_file, plugin, input_path, output_path)
+        else:
+            self._submit(future, pool, plugin_stream.process_file, plugin, input_path, output_path, plugin_stream.FILE_ENCODING, job.cancel_event)
+        job._start([future])
+        return job
+
+    def _submit(self, future: Future[str], pool: multiprocessing.pool.Pool | None, func: Callable[..., str], *args: object) -> None:
+        if pool is not None:
+            if not future.set_running_or_notify_cancel(): # The pool cannot drop a queued task
+                return
+            pool.apply_async(func, args, callback=future.set_result, error_callback=future.set_exception)
+        else:
+            get_executor().submit(_run_into, future, func, *args)
+
+    def _store(self, key: CacheKey, future: Future[str]) -> None:
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(key, future.result())
+
+    def _new_pool(self, task_count: int) -> multiprocessing.pool.Pool:
+        # spawn behaves the same on every platform and does not fork the Tk interpreter
+        pool = multiprocessing.get_context("spawn").Pool(processes=max(1, min(PROCESS_POOL_SIZE, task_count)))
+        with self._pools_lock:
+            self._pools.add(pool)
+        return pool
+
+    def _release_pool(self, pool: multiprocessing.pool.Pool, terminate: bool, partial_path: str | None = None) -> None:
+        """
+        Terminates the pool of a cancelled job and removes its partial output,
+        or lets the idle workers of a finished job exit.
+        """
+        with self._pools_lock:
+            self._pools.discard(pool)
+        if terminate:
+            _terminate_in_background(pool, partial_path)
+        else:
+            pool.close()
+
+    def shutdown(self) -> None:
+        """Terminates the process pools of the jobs still running."""
+        with self._pools_lock:
+            pools, self._pools = self._pools, set()
+        for pool in pools:
+            _terminate_in_background(pool)
+
+
+def _terminate_in_background(pool: multiprocessing.pool.Pool, partial_path: str | None = None) -> None:
+    """
+    Pool.terminate() kills the workers first but then joins the pool's task
+    thread, which never returns while that thread is stuck sending a large
+    input to a worker that is gone; so it runs on a daemon thread. The partial
+    output is removed once the workers that wrote it have exited.
+    """
+    def terminate() -> None:
+        pool.terminate()
+        if partial_path is not None:
+            try:
+                os.remove(partial_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not remove {partial_path}: {e}")
+
+    threading.Thread(target=terminate, name="PluginPoolTerminator", daemon=True).start()
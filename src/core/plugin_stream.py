@@ -0,0 +1,112 @@
+"""
+Streams text through line-oriented plugins.
+
+Instead of splitting the whole input into a list of lines and joining a second
+full copy of the output, the input is read in chunks, split one chunk at a
+time and fed to Plugin.process_stream(); the output lines are written in
+batches. Files are processed from disk to disk the same way, so apart from the
+plugin's own state (the unique lines of the Duplicate Line Remover, say) memory
+use does not grow with the input.
+"""
+from __future__ import annotations
+
+import functools
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from src.core.exceptions import PluginCancelledError
+
+if TYPE_CHECKING:
+    from src.plugins.base_plugin import Plugin
+
+CHUNK_CHARS = 1 << 20
+WRITE_BATCH_LINES = 4096
+# Shorter texts are processed with Plugin.process(), which is faster for them
+STREAM_MIN_CHARS = 1_000_000
+FILE_ENCODING = "utf-8"
+
+
+def iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Splits text arriving in chunks into lines exactly as str.splitlines() splits the whole text."""
+    pending: list[str] = []
+    for chunk in chunks:
+        # Split only up to the last "\n", which never pairs with the character after it
+        cut = chunk.rfind("\n") + 1
+        if cut == 0:
+            pending.append(chunk)
+            continue
+        pending.append(chunk[:cut])
+        yield from "".join(pending).splitlines()
+        pending = [chunk[cut:]]
+    yield from "".join(pending).splitlines()
+
+
+def iter_text_chunks(text: str, size: int = CHUNK_CHARS) -> Iterator[str]:
+    return (text[start:start + size] for start in range(0, len(text), size))
+
+
+def write_lines(write: Callable[[str], object], lines: Iterable[str]) -> None:
+    """Writes lines separated by "\\n" (as "\\n".join() would), a batch at a time."""
+    separator = ""
+    batch: list[str] = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= WRITE_BATCH_LINES:
+            write(separator + "\n".join(batch))
+            separator, batch = "\n", []
+    if batch:
+        write(separator + "\n".join(batch))
+
+
+def process_text(plugin: Plugin, text: str) -> str:
+    """
+    Processes text with a plugin, streaming large inputs through streaming
+    plugins. Runs on a worker thread or in a pool process.
+    """
+    if not (plugin.line_oriented and plugin.streaming and len(text) >= STREAM_MIN_CHARS):
+        return plugin.process(text)
+    parts: list[str] = []
+    write_lines(parts.append, plugin.process_stream(iter_lines(iter_text_chunks(text))))
+    return "".join(parts)
+
+
+def partial_path_for(output_path: str) -> str:
+    """The file process_file() writes before moving it to output_path."""
+    return output_path + ".part"
+
+
+def process_file(plugin: Plugin, input_path: str, output_path: str, encoding: str = FILE_ENCODING, cancel_event: threading.Event | None = None) -> str:
+    """
+    Processes a file into another one and returns output_path. Line-oriented
+    plugins are fed line by line; others get the whole text. The output is
+    written next to output_path first and moved into place when complete, so
+    the input and output may be the same file. Once cancel_event is set,
+    PluginCancelledError is raised at the next write and output_path is left
+    untouched.
+    """
+    partial_path = partial_path_for(output_path)
+
+    def check_cancelled() -> None:
+        if cancel_event is not None and cancel_event.is_set():
+            raise PluginCancelledError(f"Processing {input_path} was cancelled.")
+
+    try:
+        with open(input_path, encoding=encoding, newline="") as source, open(partial_path, "w", encoding=encoding, newline="") as target:
+            def write(text: str) -> None:
+                check_cancelled()
+                target.write(text)
+
+            if plugin.line_oriented:
+                chunks = iter(functools.partial(source.read, CHUNK_CHARS), "")
+                write_lines(write, plugin.process_stream(iter_lines(chunks)))
+            else:
+                write(plugin.process(source.read()))
+        check_cancelled()
+        os.replace(partial_path, output_path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+    return output_path
@@ -0,0 +1,60 @@
+"""
+Warm-start snapshot of the history list.
+
+At shutdown the first page of rows (ID, pin state and precomputed preview) is
+written to a small JSON Lines file, so the next launch can paint the list
+before the full history file has been parsed. The cost of reading it depends
+only on SNAPSHOT_ROWS, not on the size of the history.
+"""
+import json
+import logging
+import os
+from typing import NamedTuple
+
+from .history_preview import HistoryPreview, make_preview
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_ROWS = 100
+
+
+class WarmStartRow(NamedTuple):
+    """A history row as it was displayed at the last shutdown."""
+    item_id: float
+    is_pinned: bool
+    preview: HistoryPreview
+
+
+def write_snapshot(path: str, history: list[tuple[str, bool, float]], previews: dict[float, HistoryPreview], rows: int = SNAPSHOT_ROWS) -> None:
+    """
+    Writes the first rows of the history (in display order) to the snapshot file.
+    The file is replaced atomically; OSError is left to the caller.
+    """
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"version": SNAPSHOT_VERSION}) + "\n")
+        for content, is_pinned, item_id in history[:rows]:
+            preview = previews.get(item_id) or make_preview(content)
+            f.write(json.dumps([item_id, is_pinned, *preview], ensure_ascii=False) + "\n")
+    os.replace(temp_path, path)
+
+
+def read_snapshot(path: str) -> list[WarmStartRow]:
+    """Reads the snapshot rows. Returns an empty list if the file is missing, stale or corrupt."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            header = json.loads(f.readline() or "null")
+            if not isinstance(header, dict) or header.get("version") != SNAPSHOT_VERSION:
+                return []
+            rows: list[WarmStartRow] = []
+            for line in f:
+                item_id, is_pinned, text, truncated, line_count, size = json.loads(line)
+                preview = HistoryPreview(str(text), bool(truncated), int(line_count), int(size))
+                rows.append(WarmStartRow(float(item_id), bool(is_pinned), preview))
+            return rows
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable warm-start snapshot {path}: {e}")
+        return []
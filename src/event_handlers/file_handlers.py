@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from tkinter import filedialog, messagebox
 from typing import TYPE_CHECKING
 
@@ -19,6 +20,7 @@ class FileEventHandlers(BaseEventHandler):
         self.subscribe("FILE_QUIT", self.handle_quit)
         self.subscribe("FILE_EXPORT_HISTORY", self.handle_export_history)
         self.subscribe("FILE_IMPORT_HISTORY", self.handle_import_history)
+        self.subscribe("FILE_PROCESS_FILE", self.handle_process_file)
 
     def handle_quit(self) -> None:
         self.app.on_closing()
@@ -57,3 +59,28 @@ class FileEventHandlers(BaseEventHandler):
                 messagebox.showinfo("インポート完了", f"履歴を以下のファイルからインポートしました:\n{file_path}")
             except Exception as e:
                 messagebox.showerror("インポートエラー", f"履歴のインポート中にエラーが発生しました:\n{e}")
+
+    def handle_process_file(self) -> None:
+        """Runs a plugin over a file (line-oriented plugins stream it) and saves the result to another file."""
+        input_path: str = filedialog.askopenfilename(
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+            title="ファイルを処理 (Process File)"
+        )
+        if not input_path:
+            return
+        stem, extension = os.path.splitext(os.path.basename(input_path))
+        output_path: str = filedialog.asksaveasfilename(
+            initialdir=os.path.dirname(input_path),
+            initialfile=f"{stem}_processed{extension}",
+            defaultextension=extension or ".txt",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+            title="処理結果を保存 (Save Processed File)"
+        )
+        if not output_path:
+            return
+
+        from src.gui.dialogs.format_dialog import FormatDialog
+
+        self.app.create_toplevel(FormatDialog, self.app.settings_manager, # type: ignore
+                                 on_result=lambda plugin, scope, results: messagebox.showinfo("処理完了", f"{plugin.name} の結果を以下のファイルに保存しました:\n{results[0]}"),
+                                 files=(input_path, output_path))
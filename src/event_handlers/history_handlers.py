@@ -4,15 +4,16 @@ import logging
 from tkinter import messagebox
 from typing import TYPE_CHECKING, Any
 
-from src.core.commands import UpdateHistoryCommand
+from src.core.commands import CompoundCommand, UpdateHistoryCommand
 from src.core.event_dispatcher import EventDispatcher
 from src.utils.error_handler import log_and_show_error
-from src.utils.undo_manager import UndoManager
+from src.utils.undo_manager import UndoableCommand, UndoManager
 
 from .base_event_handler import BaseEventHandler
 
 if TYPE_CHECKING:
     from src.core.base_application import BaseApplication
+    from src.core.plugin_runner import ItemResult
     from src.gui.components.history_list_component import HistoryListComponent
     from src.plugins.base_plugin import Plugin
 
@@ -98,7 +99,7 @@ class HistoryEventHandlers(BaseEventHandler):
             if selected_item_content is not None:
                 self.app.master.clipboard_clear() # type: ignore
                 self.app.master.clipboard_append(selected_item_content) # type: ignore
-                logger.info(f"Copied from history: {selected_item_content[:50]}...")
+                logger.info(f"Copied from history: {self.app.monitor.get_preview(first_id, selected_item_content).label()}") # type: ignore
             else:
                 logger.warning(f"Could not find item with ID {first_id} to copy.")
         except Exception as e:
@@ -150,13 +151,14 @@ class HistoryEventHandlers(BaseEventHandler):
                 return
 
             content, is_pinned, _ = item_tuple
+            preview_text: str = self.app.monitor.get_preview(item_id, content).label() # type: ignore
 
             if is_pinned:
                 self.app.monitor.unpin_item_by_id(item_id) # type: ignore
-                logger.info(f"Unpinned: {content[:50]}...")
+                logger.info(f"Unpinned: {preview_text}")
             else:
                 self.app.monitor.pin_item_by_id(item_id) # type: ignore
-                logger.info(f"Pinned: {content[:50]}...")
+                logger.info(f"Pinned: {preview_text}")
         except Exception as e:
             logger.error(f"Error pinning/unpinning history: {e}", exc_info=True)
 
@@ -181,56 +183,68 @@ class HistoryEventHandlers(BaseEventHandler):
             logger.error(f"Error merging and copying selected history: {e}", exc_info=True)
 
     def format_selected_item(self) -> None:
+        """Opens the format dialog for the selected items (or, when searching, all matches)."""
         try:
-            selected_indices: tuple[int, ...] = self.app.gui.history_component.listbox.curselection() # type: ignore
-            if not selected_indices:
+            scopes: dict[str, list[tuple[float, str]]] = {"selected": self._get_selected_items()}
+            search_query: str = self.app.gui.search_entry.get() # type: ignore
+            if search_query:
+                scopes["search"] = [(item[2], item[0]) for item in self.app.monitor.get_filtered_history(search_query)] # type: ignore
+            if not any(scopes.values()):
                 return
 
             from src.gui.dialogs.format_dialog import FormatDialog
 
-            dialog: FormatDialog = self.app.create_toplevel(FormatDialog, self.app.settings_manager) # type: ignore
-            selected_plugin: Plugin | None = dialog.selected_plugin
-
-            if selected_plugin:
-                self.apply_plugin_to_selected_item(selected_plugin)
+            # The dialog runs the chosen plugin in the background and reports the results
+            self.app.create_toplevel(FormatDialog, self.app.settings_manager, # type: ignore
+                                     {key: [text for _, text in targets] for key, targets in scopes.items()},
+                                     on_result=lambda plugin, scope, results: self._commit_plugin_results(plugin, scopes[scope], results))
 
         except IndexError:
             log_and_show_error("エラー", "フォーマット対象の項目が選択されていません。", exc_info=True)
         except Exception as e:
             log_and_show_error("エラー", f"フォーマット中に予期せぬエラーが発生しました。\n\n{e}", exc_info=True)
 
-    def apply_plugin_to_selected_item(self, plugin_instance: Plugin) -> None:
-        try:
-            history_component: HistoryListComponent = self.app.gui.history_component # type: ignore
-            selected_indices: tuple[int, ...] = history_component.listbox.curselection() # type: ignore
-            if not selected_indices:
-                return
-
-            selected_index: int = selected_indices[0]
-
-            history_data: list[tuple[str, bool, float]] = history_component.history # type: ignore
-            if 0 <= selected_index < len(history_data):
-                original_text: str = history_data[selected_index][0]
-                item_id: float = history_data[selected_index][2] # Get item_id
-
-                processed_text: str = plugin_instance.process(original_text) # type: ignore
-
-                if processed_text != original_text:
-                    command = UpdateHistoryCommand(
-                        monitor=self.app.monitor, # type: ignore
-                        item_id=item_id, # Corrected argument
-                        original_text=original_text,
-                        new_text=processed_text
-                    )
-                    self.undo_manager.execute_command(command)
-                    logger.info(f"Executed format command for item with ID {item_id} with {plugin_instance.name}")
-                else:
-                    logger.warning(f"Plugin '{plugin_instance.name}' made no changes.")
-
-        except IndexError:
-            log_and_show_error("エラー", "フォーマット対象の項目が選択されていません。", exc_info=True)
-        except Exception as e:
-            log_and_show_error("エラー", f"プラグインの適用中にエラーが発生しました。\n\n{e}", exc_info=True)
+    def _get_selected_items(self) -> list[tuple[float, str]]:
+        """Returns the ID and content of every selected history item."""
+        history_component: HistoryListComponent = self.app.gui.history_component # type: ignore
+        selected_indices: tuple[int, ...] = history_component.listbox.curselection() # type: ignore
+        items: list[tuple[float, str]] = []
+        for item_id in history_component.get_ids_for_indices(selected_indices):
+            content = self.app.monitor.get_content_by_id(item_id) # type: ignore
+            if content is not None:
+                items.append((item_id, content))
+        return items
+
+    def _commit_plugin_results(self, plugin_instance: Plugin, targets: list[tuple[float, str]], results: list[ItemResult]) -> None:
+        """
+        Records the changed results as one undoable step. Items that changed or
+        were removed while the plugin ran are left alone.
+        """
+        commands: list[UndoableCommand] = []
+        failures: list[str] = []
+        for (item_id, original_text), result in zip(targets, results, strict=True):
+            if isinstance(result, BaseException):
+                failures.append(f"{type(result).__name__}: {result}")
+            elif result == original_text:
+                continue
+            elif self.app.monitor.get_content_by_id(item_id) != original_text: # type: ignore
+                logger.warning(f"Discarded the result of '{plugin_instance.name}': item {item_id} was changed or removed while it ran.")
+            else:
+                commands.append(UpdateHistoryCommand(
+                    monitor=self.app.monitor, # type: ignore
+                    item_id=item_id,
+                    original_text=original_text,
+                    new_text=result
+                ))
+
+        if commands:
+            # Every update only marks the list dirty, so the GUI refreshes once for the batch
+            self.undo_manager.execute_command(commands[0] if len(commands) == 1 else CompoundCommand(commands))
+            logger.info(f"Applied {plugin_instance.name} to {len(commands)} of {len(targets)} items")
+        else:
+            logger.warning(f"Plugin '{plugin_instance.name}' made no changes.")
+        if failures:
+            log_and_show_error("エラー", f"{len(failures)} 件の項目でプラグインの適用に失敗しました。\n\n" + "\n".join(failures[:5]))
 
     def handle_search_history(self, search_query: str) -> None:
         if search_query:
@@ -7,7 +7,6 @@ from typing import TYPE_CHECKING, Any
 
 from src.core.config import defaults
 from src.core.fixed_phrases_manager import FixedPhrasesManager
-from src.gui.windows.fixed_phrases_window import FixedPhrasesFrame
 from src.utils.error_handler import log_and_show_error
 
 if TYPE_CHECKING:
@@ -46,6 +45,7 @@ def handle_copy_fixed_phrase(gui_instance: Any, phrase: str) -> None:
         log_and_show_error("エラー",f"Error copying fixed phrase: {e}")
 
 def handle_manage_fixed_phrases(master: tk.Tk, fixed_phrases_manager: FixedPhrasesManager) -> None:
+    from src.gui.windows.fixed_phrases_window import FixedPhrasesFrame
     fixed_phrases_window = FixedPhrasesFrame(master, fixed_phrases_manager) # type: ignore
     fixed_phrases_window.grab_set() # type: ignore
     master.wait_window(fixed_phrases_window) # type: ignore
@@ -3,8 +3,6 @@ from __future__ import annotations
 import tkinter as tk
 from typing import TYPE_CHECKING, Any
 
-from src.core.config.defaults import THEMES
-
 if TYPE_CHECKING:
     from src.core.base_application import BaseApplication
 
@@ -16,9 +14,14 @@ class BaseToplevelGUI(tk.Toplevel):
         super().__init__(master, **kwargs)
         self.master = master
         self.app = app_instance
-        self.app.theme_manager.apply_theme_to_widget_tree( # type: ignore
-            self, THEMES[self.app.theme_manager.get_current_theme()] # type: ignore
-        )
+        self.app.theme_manager.register_widget(self) # type: ignore
+        # Subclasses build their children after this constructor returns, so
+        # the rest of the window is registered for theming once it is idle.
+        self.after_idle(self._register_theme_tree)
+
+    def _register_theme_tree(self) -> None:
+        if self.winfo_exists():
+            self.app.theme_manager.register_widget_tree(self) # type: ignore
 
     # Placeholder for common widget creation or layout methods
     def _create_common_widgets(self) -> None:
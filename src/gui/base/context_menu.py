@@ -4,12 +4,15 @@ import tkinter as tk
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, NamedTuple
 
+from src.gui.base.menu_translation import MenuTranslationRegistry
+
 if TYPE_CHECKING:
     from src.core.base_application import BaseApplication
     from src.core.event_dispatcher import EventDispatcher
     from src.gui.components.history_list_component import HistoryListComponent
     from src.gui.components.phrase_edit_component import PhraseEditComponent
     from src.gui.components.phrase_list_component import PhraseListComponent
+    from src.gui.custom_widgets import VirtualListbox
     from src.utils.i18n import Translator
 
 
@@ -32,7 +35,7 @@ class HistoryMenuStateProvider:
     def __init__(self, app: BaseApplication) -> None:
         self.app = app
 
-    def get_menu_state(self, listbox: tk.Listbox) -> MenuState:
+    def get_menu_state(self, listbox: VirtualListbox) -> MenuState:
         """Calculates and returns the current state of the menu."""
         history_component: HistoryListComponent = self.app.gui.history_component # type: ignore
         selected_indices: tuple[int, ...] = listbox.curselection()
@@ -64,26 +67,31 @@ class HistoryMenuStateProvider:
 # --- Base Classes ---
 
 class BaseContextMenu(ABC):
-    """Base class for context menus."""
+    """
+    Base class for context menus. Static menus are built once; entries added
+    through add_translated() are relabelled in place when the language changes.
+    """
     def __init__(self, master: tk.Misc, translator: Translator | None = None, dispatcher: EventDispatcher | None = None) -> None:
         self.master = master
         self.menu = tk.Menu(master, tearoff=0)
         self.translator = translator
         self.dispatcher = dispatcher
+        self.menu_translations: MenuTranslationRegistry | None = None
+        if self.translator and self.dispatcher:
+            self.menu_translations = MenuTranslationRegistry.shared(self.translator, self.dispatcher)
         self.build_menu()
 
-        if self.dispatcher:
-            self.dispatcher.subscribe("LANGUAGE_CHANGED", self._rebuild_menu)
-
     @abstractmethod
     def build_menu(self) -> None:
         """Build the menu items. Must be implemented by subclasses."""
         pass
 
-    def _rebuild_menu(self, *args: Any) -> None:
-        """Clears and rebuilds the menu, typically for language changes."""
-        self.menu.delete(0, tk.END)
-        self.build_menu()
+    def add_translated(self, key: str, **kwargs: Any) -> None:
+        """Adds a command whose label follows the current language."""
+        if self.menu_translations:
+            self.menu_translations.add(self.menu, "command", key, **kwargs)
+        else:
+            self.menu.add_command(label=self.translator(key) if self.translator else key, **kwargs)
 
     def show(self, event: tk.Event) -> None:
         """Show the context menu at the event's position."""
@@ -98,7 +106,7 @@ class HistoryContextMenu(BaseContextMenu):
     """Context menu for the history listbox, with state management separated."""
     def __init__(self, master: tk.Misc, app_instance: BaseApplication) -> None:
         self.app = app_instance
-        self.listbox: tk.Listbox | None = None
+        self.listbox: VirtualListbox | None = None
         self.state_provider = HistoryMenuStateProvider(app_instance)
         super().__init__(master, app_instance.translator, app_instance.event_dispatcher) # type: ignore
 
@@ -106,11 +114,7 @@ class HistoryContextMenu(BaseContextMenu):
         # Dynamic menu, built just before showing.
         pass
 
-    def _rebuild_menu(self, *args: Any) -> None:
-        # Dynamic menu, no action needed here.
-        pass
-
-    def _get_listbox(self) -> tk.Listbox:
+    def _get_listbox(self) -> VirtualListbox:
         if not self.listbox:
             self.listbox = self.app.gui.history_component.listbox # type: ignore
         return self.listbox
@@ -182,10 +186,10 @@ class PhraseListContextMenu(BaseContextMenu):
         super().__init__(master, app.translator, app.event_dispatcher) # type: ignore
 
     def build_menu(self) -> None:
-        self.menu.add_command(label=self.translator("copy"), command=self.edit_component._copy_phrase) # type: ignore
-        self.menu.add_command(label=self.translator("add"), command=self.edit_component._add_phrase) # type: ignore
-        self.menu.add_command(label=self.translator("edit"), command=self.edit_component._edit_phrase) # type: ignore
-        self.menu.add_command(label=self.translator("delete"), command=self.edit_component._delete_phrase) # type: ignore
+        self.add_translated("copy", command=self.edit_component._copy_phrase)
+        self.add_translated("add", command=self.edit_component._add_phrase)
+        self.add_translated("edit", command=self.edit_component._edit_phrase)
+        self.add_translated("delete", command=self.edit_component._delete_phrase)
 
     def show(self, event: tk.Event) -> None:
         try:
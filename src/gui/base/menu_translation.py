@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import tkinter as tk
+import weakref
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.core.event_dispatcher import EventDispatcher
+    from src.utils.i18n import Translator
+
+
+class MenuTranslationRegistry:
+    """
+    Binds translation keys to menu entries so that menus are built once.
+
+    A single LANGUAGE_CHANGED subscription relabels every registered entry in
+    place with entryconfig, instead of each menu owner subscribing and
+    rebuilding its menu. Menus are held weakly and dropped once destroyed.
+    """
+    _instances: weakref.WeakKeyDictionary[Translator, MenuTranslationRegistry] = weakref.WeakKeyDictionary()
+
+    def __init__(self, translator: Translator, event_dispatcher: EventDispatcher) -> None:
+        self.translator = translator
+        self._entries: weakref.WeakKeyDictionary[tk.Menu, dict[int, str]] = weakref.WeakKeyDictionary()
+        event_dispatcher.subscribe("LANGUAGE_CHANGED", self.retranslate, weak=True)
+
+    @classmethod
+    def shared(cls, translator: Translator, event_dispatcher: EventDispatcher) -> MenuTranslationRegistry:
+        """Returns the registry shared by every menu using the given translator."""
+        registry = cls._instances.get(translator)
+        if registry is None:
+            registry = cls._instances[translator] = cls(translator, event_dispatcher)
+        return registry
+
+    def add(self, parent_menu: tk.Menu, item_type: str, key: str, /, **kwargs: Any) -> int:
+        """
+        Adds a menu entry labelled with the translation of key and binds it.
+        item_type is a Menu.add() type: "command", "cascade", "checkbutton"...
+        """
+        parent_menu.add(item_type, label=self.translator(key), **kwargs)
+        index: int = parent_menu.index(tk.END) # type: ignore[assignment]
+        self.bind(parent_menu, index, key)
+        return index
+
+    def bind(self, menu: tk.Menu, index: int, key: str) -> None:
+        """Binds an existing entry's label to a translation key."""
+        self._entries.setdefault(menu, {})[index] = key
+
+    def unbind_menu(self, menu: tk.Menu) -> None:
+        """Forgets all entries of a menu, e.g. before it is cleared."""
+        self._entries.pop(menu, None)
+
+    def retranslate(self, *args: Any) -> None:
+        """Updates the labels of all registered entries to the current language."""
+        for menu, entries in list(self._entries.items()):
+            try:
+                for index, key in entries.items():
+                    menu.entryconfig(index, label=self.translator(key))
+            except tk.TclError:
+                # The menu was destroyed but is still referenced somewhere
+                self._entries.pop(menu, None)
@@ -1,10 +1,34 @@
 """
 This package contains various GUI components used in the Clip Watcher application.
+
+Components are imported lazily (PEP 562) so that, for example, the main window
+does not pull in the fixed-phrase editor and its dialogs at startup.
 """
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .history_list_component import HistoryListComponent
+    from .phrase_edit_component import PhraseEditComponent
+    from .phrase_list_component import PhraseListComponent
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "HistoryListComponent": ".history_list_component",
+    "PhraseEditComponent": ".phrase_edit_component",
+    "PhraseListComponent": ".phrase_list_component",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is not called again
+    return value
 
-from .history_list_component import HistoryListComponent
-from .phrase_edit_component import PhraseEditComponent
-from .phrase_list_component import PhraseListComponent
 
 __all__ = [
     "HistoryListComponent",
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import tkinter as tk
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
+from src.core.clipboard_monitor import HistoryChange, HistoryChangeKind
+from src.gui.custom_widgets import VirtualListbox
+
 if TYPE_CHECKING:
     from src.core.base_application import BaseApplication
+    from src.core.history_preview import HistoryPreview
+    from src.core.warm_start import WarmStartRow
     from src.gui.base.context_menu import HistoryContextMenu
 
 
@@ -13,17 +19,29 @@ class HistoryListComponent(tk.Frame):
         super().__init__(master)
         self.app = app_instance
         self.displayed_history: list[tuple[str, bool, float]] = []  # Will store the full (content, is_pinned, timestamp) tuples
+        self.pinned_bg_color: str | None = None
+        # Snapshot rows not matched by a loaded item yet, in snapshot order; they
+        # are displayed below the live history until the full history is loaded
+        self._warm_rows: dict[float, WarmStartRow] = {}
+        self._warm_ids_by_preview: dict[HistoryPreview, list[float]] = {}
+        # Loaded items already matched against the snapshot, so that each one stands for one row
+        self._warm_matched_ids: set[float] = set()
+        # IDs of the snapshot rows currently displayed in place of not yet loaded items
+        self._placeholder_ids: set[float] = set()
 
         self._create_widgets()
         self._bind_events()
 
     def _create_widgets(self) -> None:
-        self.listbox = tk.Listbox(self, height=10, selectmode=tk.EXTENDED)
+        # Only the visible rows are rendered; they are pulled from displayed_history on demand.
+        self.listbox = VirtualListbox(self, row_provider=self._render_row, height=10, selectmode=tk.EXTENDED)
         self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self.listbox.yview)
         self.listbox.config(yscrollcommand=self.scrollbar.set)
 
         self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # The pinned row color comes from the theme, so the default coloring is not enough
+        self.app.theme_manager.register_widget(self.listbox, self.apply_theme) # type: ignore
 
     def _bind_events(self) -> None:
         self.listbox.bind("<<ListboxSelect>>", self._on_history_select)
@@ -31,6 +49,7 @@ class HistoryListComponent(tk.Frame):
         from src.gui.base import context_menu
         history_context_menu: HistoryContextMenu = context_menu.HistoryContextMenu(self.master, self.app) # type: ignore
         self.listbox.bind("<Button-3>", history_context_menu.show)
+        self.app.event_dispatcher.subscribe("HISTORY_LOADED", self._on_history_loaded, weak=True) # type: ignore
 
     def _on_double_click(self, event: tk.Event) -> None:
         """Handler for double-click events to copy an item."""
@@ -45,6 +64,7 @@ class HistoryListComponent(tk.Frame):
             self.app.event_dispatcher.dispatch("HISTORY_COPY_SELECTED", item_ids) # type: ignore
 
     def _on_history_select(self, event: tk.Event) -> None:
+        self._resolve_placeholders(self.listbox.curselection())
         # This event is now handled by the parent (main_gui) to update the text widget
         self.app.event_dispatcher.dispatch("HISTORY_SELECTION_CHANGED", { # type: ignore
             "selected_indices": self.listbox.curselection()
@@ -52,34 +72,150 @@ class HistoryListComponent(tk.Frame):
 
     def get_ids_for_indices(self, indices: tuple[int, ...]) -> list[float]:
         """Translates listbox indices to unique history item IDs."""
+        self._resolve_placeholders(indices)
         return [self.displayed_history[i][2] for i in indices if 0 <= i < len(self.displayed_history)]
 
-    def update_history(self, history: list[tuple[str, bool, float]], theme: dict[str, str]) -> None:
+    def get_content_for_index(self, index: int, wait_for_load: bool = True) -> str | None:
+        """
+        Returns the full content of the item at a listbox index, looked up by ID.
+        A snapshot row finishes loading the history first unless wait_for_load
+        is False, in which case None is returned for it.
+        """
+        if wait_for_load:
+            self._resolve_placeholders((index,))
+        if not 0 <= index < len(self.displayed_history):
+            return None
+        return self.app.monitor.get_content_by_id(self.displayed_history[index][2]) # type: ignore
+
+    def _render_row(self, index: int) -> tuple[str, str | None]:
+        """Builds the label and background of a single visible row."""
+        content, is_pinned, item_id = self.displayed_history[index]
+        preview: HistoryPreview
+        if item_id in self._placeholder_ids:
+            preview = self._warm_rows[item_id].preview
+        else:
+            # Use the preview computed at ingest instead of touching the full content
+            preview = self.app.monitor.get_preview(item_id, content) # type: ignore
+        prefix = "📌 " if is_pinned else ""
+        badge = f"  {preview.badge}" if preview.badge else ""
+        # The displayed number is still based on visual order (1-based index)
+        return f"{prefix}{index+1}. {preview.label()}{badge}", self.pinned_bg_color if is_pinned else None
+
+    def show_warm_start(self, rows: list[WarmStartRow], theme: dict[str, str]) -> None:
+        """Paints the rows of the warm-start snapshot until the full history is loaded."""
+        self._warm_rows = {row.item_id: row for row in rows}
+        self._warm_ids_by_preview = {}
+        self._warm_matched_ids = set()
+        for row in rows:
+            self._warm_ids_by_preview.setdefault(row.preview, []).append(row.item_id)
+        self.update_history([], theme)
+
+    def _match_warm_rows(self, item_ids: Iterable[float]) -> None:
+        """
+        Drops the snapshot row each loaded item stands for: the row with the
+        same ID, or else the first remaining row with the same preview (distinct
+        items may share one, e.g. a long common first line). Only the given
+        items are checked, so each loaded batch costs O(batch size).
+        """
+        for item_id in item_ids:
+            if item_id in self._warm_matched_ids:
+                continue
+            self._warm_matched_ids.add(item_id)
+            row = self._warm_rows.pop(item_id, None)
+            preview: HistoryPreview = row.preview if row is not None else self.app.monitor.get_preview(item_id) # type: ignore
+            matching_ids = self._warm_ids_by_preview.get(preview)
+            if not matching_ids:
+                continue
+            if row is not None:
+                matching_ids.remove(item_id)
+            else:
+                self._warm_rows.pop(matching_ids.pop(0), None)
+            if not matching_ids:
+                del self._warm_ids_by_preview[preview]
+
+    def _with_warm_rows(self, history: list[tuple[str, bool, float]]) -> list[tuple[str, bool, float]]:
+        """
+        Appends the snapshot rows that have not been loaded yet below the live
+        history. Placeholder rows carry no content; it is resolved by ID once
+        the history is loaded (see get_content_for_index()).
+        """
+        self._placeholder_ids = set(self._warm_rows)
+        if not self._warm_rows:
+            return history
+        return history + [("", row.is_pinned, row.item_id) for row in self._warm_rows.values()]
+
+    def _resolve_placeholders(self, indices: tuple[int, ...] | list[int]) -> None:
+        """Finishes loading the history synchronously if a snapshot row is acted on."""
+        if not self._placeholder_ids:
+            return
+        if any(0 <= i < len(self.displayed_history) and self.displayed_history[i][2] in self._placeholder_ids for i in indices):
+            self.app.monitor.wait_for_history_load() # type: ignore
+            self.app.monitor.flush_gui_update() # type: ignore
+
+    def _on_history_loaded(self, *args: object) -> None:
+        # The next update replaces the snapshot rows with the loaded history
+        self._warm_rows = {}
+        self._warm_ids_by_preview = {}
+        self._warm_matched_ids = set()
+
+    def update_history(self, history: list[tuple[str, bool, float]], theme: dict[str, str], include_warm_rows: bool = True) -> None:
+        if include_warm_rows:
+            if self._warm_rows:
+                self._match_warm_rows(item[2] for item in history)
+            history = self._with_warm_rows(history)
+        else:
+            self._placeholder_ids = set()
         self.displayed_history = history  # Store the full data
+        self.pinned_bg_color = theme["pinned_bg"]
+        # Selection and scroll position are kept by the listbox itself (by item ID).
+        self.listbox.set_items([item[2] for item in history])
+
+    def apply_changes(self, history: list[tuple[str, bool, float]], changes: list[HistoryChange], theme: dict[str, str]) -> None:
+        """
+        Applies structural history changes as minimal list operations instead of
+        replacing the whole row model. Falls back to update_history() if the
+        result does not match the given history (e.g. after skipped updates).
+        """
+        if any(change.kind is HistoryChangeKind.RESET for change in changes):
+            self.update_history(history, theme)
+            return
+        if self._warm_rows or self._placeholder_ids:
+            # While snapshot rows are shown, only the changed items are matched
+            # against them and the rows are replaced as a whole
+            self._match_warm_rows(change.item_id for change in changes if change.kind is not HistoryChangeKind.REMOVED and change.item_id is not None)
+            self.displayed_history = self._with_warm_rows(history)
+            self.pinned_bg_color = theme["pinned_bg"]
+            self.listbox.set_items([item[2] for item in self.displayed_history])
+            return
 
-        selected_indices = self.listbox.curselection()
-        scroll_pos = self.listbox.yview()
-
-        self.listbox.delete(0, tk.END)
-
-        pinned_bg_color = theme["pinned_bg"]
-
-        for i, (content, is_pinned, _timestamp) in enumerate(history):
-            display_text = content.replace('\n', ' ').replace('\r', '')
-            prefix = "📌 " if is_pinned else ""
-            # The displayed number is still based on visual order (1-based index)
-            self.listbox.insert(tk.END, f"{prefix}{i+1}. {display_text[:100]}...")
-            if is_pinned:
-                self.listbox.itemconfig(i, {'bg': pinned_bg_color})
-
-        for index in selected_indices:
-            if index < self.listbox.size():
-                self.listbox.selection_set(index)
-        self.listbox.yview_moveto(scroll_pos[0])
+        self.displayed_history = history
+        self.pinned_bg_color = theme["pinned_bg"]
+        new_ids = [item[2] for item in history]
+        new_index_by_id = {item_id: i for i, item_id in enumerate(new_ids)}
+
+        removed: set[float] = set()
+        repositioned: set[float] = set()
+        for change in changes:
+            if change.kind is HistoryChangeKind.REMOVED:
+                removed.add(change.item_id)  # type: ignore[arg-type]
+            elif change.kind in (HistoryChangeKind.INSERTED, HistoryChangeKind.MOVED) and change.item_id in new_index_by_id:
+                repositioned.add(change.item_id)  # type: ignore[arg-type]
+
+        # Pull the repositioned rows out, then re-insert them in ascending target
+        # order; the remaining rows are already in their final relative order.
+        # The listbox does this in one pass, however many rows changed.
+        inserted = [(new_index_by_id[item_id], item_id) for item_id in sorted(repositioned, key=new_index_by_id.__getitem__)]
+        self.listbox.edit_items(removed | repositioned, inserted, keep_selection=repositioned)
+
+        if list(self.listbox.item_ids) != new_ids:
+            self.listbox.set_items(new_ids)
+        else:
+            self.listbox.refresh()
 
     def apply_theme(self, theme: dict[str, str]) -> None:
         self.listbox.config(bg=theme["listbox_bg"], fg=theme["listbox_fg"], selectbackground=theme["select_bg"], selectforeground=theme["select_fg"])
-        self.update_history(self.displayed_history, theme) # Re-apply pinned colors
+        self.pinned_bg_color = theme["pinned_bg"]
+        self.listbox.refresh() # Re-render the visible rows with the new pinned color
 
     def apply_font(self, font: tk.font.Font) -> None:
         self.listbox.config(font=font)
@@ -1,7 +1,12 @@
+import itertools
 import tkinter as tk
-from tkinter import Event
+from collections.abc import Callable, Collection, Hashable, Sequence
+from tkinter import Event, ttk
+from tkinter import font as tkfont
 from typing import Any
 
+from src.gui.base.menu_translation import MenuTranslationRegistry
+
 
 class ContextMenuMixin:
     """
@@ -24,33 +29,18 @@ class ContextMenuMixin:
         self._build_menu()
 
         self.bind("<Button-3>", self.show_context_menu)  # type: ignore
-        # Rebuild the menu if the language changes
-        self.app.event_dispatcher.subscribe("LANGUAGE_CHANGED", self._rebuild_menu)
-
-        # Unsubscribe when the widget is destroyed to prevent errors.
-        self.bind("<Destroy>", self._on_destroy)  # type: ignore
-
-    def _on_destroy(self, event: Event) -> None:
-        """Unsubscribes the listener when the widget is destroyed."""
-        if event.widget == self:
-            self.app.event_dispatcher.unsubscribe("LANGUAGE_CHANGED", self._rebuild_menu)
-
-    def _rebuild_menu(self, *args: Any) -> None:
-        """Clears and rebuilds the menu, typically for language changes."""
-        self.context_menu.delete(0, tk.END)
-        self._build_menu()
 
     def _build_menu(self) -> None:
-        """Builds the menu with translated labels."""
-        self.context_menu.add_command(label=self.translator("cut"), command=self.cut)
-        self.context_menu.add_command(label=self.translator("copy"), command=self.copy)
-        self.context_menu.add_command(
-            label=self.translator("paste"), command=self.paste
-        )
+        """
+        Builds the menu once. The labels are bound to translation keys in the
+        shared registry, which relabels them in place when the language changes.
+        """
+        menus = MenuTranslationRegistry.shared(self.translator, self.app.event_dispatcher)
+        menus.add(self.context_menu, "command", "cut", command=self.cut)
+        menus.add(self.context_menu, "command", "copy", command=self.copy)
+        menus.add(self.context_menu, "command", "paste", command=self.paste)
         self.context_menu.add_separator()
-        self.context_menu.add_command(
-            label=self.translator("select_all"), command=self.select_all
-        )
+        menus.add(self.context_menu, "command", "select_all", command=self.select_all)
 
     def show_context_menu(self, event: Event) -> None:
         """Display the context menu at the cursor's position."""
@@ -122,3 +112,553 @@ class CustomText(ContextMenuMixin, tk.Text):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
 
+
+class LazyText(CustomText):
+    """
+    A CustomText that shows large content progressively.
+
+    set_content() inserts a bounded head immediately and appends the rest in
+    chunks from after_idle callbacks, so Tk's text layout never has to handle
+    a megabyte of text in a single event. The widget is read-only until the
+    content is fully loaded; load_all() finishes the remaining chunks at once.
+    Setting the same content again is a no-op. on_content_changed is called with
+    the new content, or with None once the shown content has been invalidated.
+    """
+
+    HEAD_CHARS = 20_000
+    CHUNK_CHARS = 64_000
+
+    def __init__(self, *args: Any, on_load_state_changed: Callable[[bool], None] | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.on_load_state_changed = on_load_state_changed
+        self.on_content_changed: Callable[[str | None], None] | None = None
+        self._content: str | None = None
+        self._loaded_chars: int = 0
+        self._after_id: str | None = None
+        self.bind("<Destroy>", self._on_destroy, add="+")
+
+    @property
+    def is_fully_loaded(self) -> bool:
+        return self._after_id is None
+
+    @property
+    def content(self) -> str | None:
+        """The content last passed to set_content(), or None after invalidate_content()."""
+        return self._content
+
+    def set_content(self, content: str) -> None:
+        """Displays content, skipping the reinsert if it is already shown."""
+        if content is self._content or content == self._content:
+            return
+        self._cancel_loading()
+        self._content = content
+        self.config(state=tk.NORMAL)
+        self.delete("1.0", tk.END)
+        self._loaded_chars = min(len(content), self.HEAD_CHARS)
+        self.insert(tk.END, content[:self._loaded_chars])
+        if self._loaded_chars < len(content):
+            self.config(state=tk.DISABLED)
+            self._after_id = self.after_idle(self._load_next_chunk)
+            self._notify_load_state()
+        if self.on_content_changed:
+            self.on_content_changed(content)
+
+    def invalidate_content(self) -> None:
+        """Forgets the displayed content, e.g. after the user edited the text."""
+        if self.is_fully_loaded:
+            self._content = None
+            if self.on_content_changed:
+                self.on_content_changed(None)
+
+    def load_all(self) -> None:
+        """Inserts everything that has not been loaded yet."""
+        if self._content is None or self.is_fully_loaded:
+            return
+        self._cancel_loading()
+        self._append(len(self._content) - self._loaded_chars)
+        self._finish_loading()
+
+    def _on_destroy(self, event: Event) -> None:
+        if event.widget == self and self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _load_next_chunk(self) -> None:
+        self._after_id = None
+        if self._content is None:
+            return
+        self._append(self.CHUNK_CHARS)
+        if self._loaded_chars < len(self._content):
+            self._after_id = self.after_idle(self._load_next_chunk)
+        else:
+            self._finish_loading()
+
+    def _append(self, count: int) -> None:
+        assert self._content is not None
+        end = min(len(self._content), self._loaded_chars + count)
+        self.config(state=tk.NORMAL)
+        # Insert without moving the view so the user can keep reading the head
+        self.insert("end-1c", self._content[self._loaded_chars:end])
+        self.config(state=tk.DISABLED)
+        self._loaded_chars = end
+
+    def _finish_loading(self) -> None:
+        self.config(state=tk.NORMAL)
+        self._notify_load_state()
+
+    def _cancel_loading(self) -> None:
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+            self._notify_load_state()
+
+    def _notify_load_state(self) -> None:
+        if self.on_load_state_changed:
+            self.on_load_state_changed(self.is_fully_loaded)
+
+
+class SearchableCombobox(ttk.Combobox):
+    """
+    A Combobox over a long list of values that narrows its dropdown to the
+    entries containing the typed text (case-insensitive). Unlike an OptionMenu,
+    no menu entry is created per value. Like an OptionMenu, only the listed
+    values (and extra_values, which are accepted but not listed) are accepted:
+    typed text that matches none of them is reverted to the last accepted
+    value when the entry is committed (Return, focus out or commit()). Values
+    set from code should go through set_committed(), which accepts them as is.
+    """
+
+    def __init__(self, master: tk.Misc, values: Sequence[str] = (), extra_values: Collection[str] = (), **kwargs: Any) -> None:
+        super().__init__(master, values=tuple(values), **kwargs)
+        self._all_values: tuple[str, ...] = tuple(values)
+        self._extra_values = tuple(extra_values)
+        self._by_casefold = self._casefold_index()
+        self._last_valid = self.get()
+        self.bind("<KeyRelease>", self._on_key_release, add="+")
+        self.bind("<Return>", lambda event: self.commit(), add="+")
+        self.bind("<FocusOut>", lambda event: self.commit(), add="+")
+        self.bind("<<ComboboxSelected>>", lambda event: self.commit(), add="+")
+
+    def set_values(self, values: Sequence[str]) -> None:
+        self._all_values = tuple(values)
+        self._by_casefold = self._casefold_index()
+        self.configure(values=self._all_values)
+
+    def set_committed(self, value: str) -> None:
+        """Shows a value set from code (e.g. loaded settings) and accepts it even if it is not listed."""
+        self._last_valid = value
+        self.set(value)
+        self.configure(values=self._all_values)
+
+    def commit(self) -> str:
+        """Accepts the text if it names a listed value, otherwise restores the last accepted one."""
+        value = self._by_casefold.get(self.get().casefold())
+        if value is None:
+            value = self._last_valid
+        self._last_valid = value
+        if self.get() != value:
+            self.set(value)
+        self.configure(values=self._all_values)
+        return value
+
+    def _casefold_index(self) -> dict[str, str]:
+        return {value.casefold(): value for value in (*self._extra_values, *self._all_values)}
+
+    def _on_key_release(self, event: Event) -> None:
+        if event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        query = self.get().casefold()
+        if not query:
+            self.configure(values=self._all_values)
+            return
+        self.configure(values=[value for value in self._all_values if query in value.casefold()])
+
+
+class VirtualListbox(tk.Canvas):
+    """
+    A Canvas-based replacement for tk.Listbox that only materializes the
+    visible rows (plus a small overscan).
+
+    Rows are pulled from ``row_provider(index) -> (text, background | None)``
+    when they scroll into view, so redraw cost depends on the viewport height
+    rather than on the number of items. Selection is tracked by item ID, which
+    keeps it stable when the underlying model is reordered or refreshed.
+
+    The commonly used parts of the Listbox API (curselection, selection_set,
+    selection_clear, selection_includes, nearest, activate, see, size, yview)
+    are provided, and ``<<ListboxSelect>>`` is generated on user selection.
+    """
+
+    _LISTBOX_OPTIONS = ("fg", "foreground", "selectbackground", "selectforeground", "font", "yscrollcommand")
+
+    def __init__(
+        self,
+        master: tk.Misc,
+        row_provider: Callable[[int], tuple[str, str | None]],
+        overscan: int = 3,
+        selectmode: str = tk.EXTENDED,
+        height: int = 10,
+        **kwargs: Any,
+    ) -> None:
+        listbox_options = {key: kwargs.pop(key) for key in list(kwargs) if key in self._LISTBOX_OPTIONS}
+        kwargs.setdefault("highlightthickness", 0)
+        kwargs.setdefault("takefocus", 1)
+        kwargs.setdefault("background", "#FFFFFF")
+        super().__init__(master, **kwargs)
+
+        self._row_provider = row_provider
+        self._overscan = overscan
+        self._selectmode = selectmode
+        self._yscrollcommand: Callable[[float, float], Any] | None = None
+        self._font: tkfont.Font = tkfont.nametofont("TkDefaultFont")
+        self._row_height = self._font.metrics("linespace") + 4
+        self._fg = "#000000"
+        self._select_bg = "#C3C3C3"
+        self._select_fg = "#000000"
+
+        self._item_ids: list[Hashable] = []
+        self._index_by_id: dict[Hashable, int] | None = None
+        self._selected_ids: set[Hashable] = set()
+        self._anchor_id: Hashable | None = None
+        self._active_id: Hashable | None = None
+        self._top = 0  # Pixel offset of the viewport inside the virtual list
+        self._row_pool: list[tuple[int, int]] = []  # Reused (rectangle, text) canvas item pairs
+
+        self.configure(**listbox_options)
+        super().configure(height=height * self._row_height)
+        self._bind_events()
+
+    # --- Options ---
+
+    def configure(self, cnf: dict[str, Any] | None = None, **kw: Any) -> Any:  # type: ignore[override]
+        """Handles the Listbox-only options and forwards the rest to the Canvas."""
+        if cnf:
+            kw = {**cnf, **kw}
+        custom = {key: kw.pop(key) for key in list(kw) if key in self._LISTBOX_OPTIONS}
+        if "fg" in custom or "foreground" in custom:
+            self._fg = custom["fg"] if "fg" in custom else custom["foreground"]
+        if "selectbackground" in custom:
+            self._select_bg = custom["selectbackground"]
+        if "selectforeground" in custom:
+            self._select_fg = custom["selectforeground"]
+        if "yscrollcommand" in custom:
+            self._yscrollcommand = custom["yscrollcommand"]
+        if "font" in custom:
+            new_font = custom["font"]
+            self._font = new_font if isinstance(new_font, tkfont.Font) else tkfont.Font(font=new_font)
+            self._row_height = self._font.metrics("linespace") + 4
+
+        result = super().configure(**kw) if kw or not custom else None
+        if custom or kw:
+            self._redraw()
+        return result
+
+    config = configure  # type: ignore[assignment]
+
+    # --- Model ---
+
+    def set_items(self, item_ids: Sequence[Hashable]) -> None:
+        """Replaces the row model. Selection and scroll offset are kept by item ID."""
+        self._item_ids = list(item_ids)
+        self._index_by_id = None
+        if self._selected_ids:
+            index_by_id = self._get_index_by_id()
+            self._selected_ids = {item_id for item_id in self._selected_ids if item_id in index_by_id}
+        self._clamp_top()
+        self._redraw()
+
+    def refresh(self) -> None:
+        """Re-renders the visible rows, e.g. after row contents changed."""
+        self._redraw()
+
+    @property
+    def item_ids(self) -> Sequence[Hashable]:
+        """The current row model (item IDs in display order)."""
+        return self._item_ids
+
+    def edit_items(self, removed: Collection[Hashable], inserted: Sequence[tuple[int, Hashable]], keep_selection: Collection[Hashable] = ()) -> None:
+        """
+        Removes rows by ID, then inserts (index, ID) rows given in ascending index
+        order, in a single pass over the row model; call refresh() afterwards.
+        Rows removed or inserted above the viewport shift the offset so the
+        visible rows stay put. Removed rows stay selected if listed in
+        keep_selection (rows that are only being moved).
+        """
+        row_height = self._row_height
+        remaining = self._item_ids
+        if removed:
+            removed = set(removed)
+            index_by_id = self._get_index_by_id()
+            above = sum(1 for item_id in removed if item_id in index_by_id and index_by_id[item_id] * row_height < self._top)
+            self._top -= above * row_height
+            remaining = [item_id for item_id in self._item_ids if item_id not in removed]
+            self._selected_ids.difference_update(removed.difference(keep_selection))
+        if inserted:
+            # Merging is equivalent to inserting one by one in ascending index order
+            merged: list[Hashable] = []
+            source = iter(remaining)
+            for count, (index, item_id) in enumerate(inserted):
+                index = max(0, min(index, len(remaining) + count))
+                merged.extend(itertools.islice(source, max(0, index - len(merged))))
+                if self._top > 0 and index * row_height < self._top:
+                    self._top += row_height
+                merged.append(item_id)
+            merged.extend(source)
+            remaining = merged
+        self._item_ids = remaining
+        self._index_by_id = None
+
+    def size(self) -> int:  # type: ignore[override]
+        return len(self._item_ids)
+
+    def _get_index_by_id(self) -> dict[Hashable, int]:
+        if self._index_by_id is None:
+            self._index_by_id = {item_id: i for i, item_id in enumerate(self._item_ids)}
+        return self._index_by_id
+
+    def _normalize_index(self, index: int | str) -> int:
+        if index == tk.END or index == "end":
+            return len(self._item_ids) - 1
+        return int(index)
+
+    # --- Listbox-compatible selection API ---
+
+    def curselection(self) -> tuple[int, ...]:
+        if not self._selected_ids:
+            return ()
+        index_by_id = self._get_index_by_id()
+        return tuple(sorted(index_by_id[item_id] for item_id in self._selected_ids if item_id in index_by_id))
+
+    def selection_set(self, first: int | str, last: int | str | None = None) -> None:
+        start = self._normalize_index(first)
+        end = self._normalize_index(last) if last is not None else start
+        if start > end:
+            start, end = end, start
+        start, end = max(start, 0), min(end, len(self._item_ids) - 1)
+        self._selected_ids.update(self._item_ids[start:end + 1])
+        self._redraw()
+
+    def selection_clear(self, first: int | str, last: int | str | None = None) -> None:  # type: ignore[override]
+        start = self._normalize_index(first)
+        end = self._normalize_index(last) if last is not None else start
+        if start > end:
+            start, end = end, start
+        if start <= 0 and end >= len(self._item_ids) - 1:
+            self._selected_ids.clear()
+        else:
+            self._selected_ids.difference_update(self._item_ids[max(start, 0):end + 1])
+        self._redraw()
+
+    def selection_includes(self, index: int | str) -> bool:
+        i = self._normalize_index(index)
+        return 0 <= i < len(self._item_ids) and self._item_ids[i] in self._selected_ids
+
+    def nearest(self, y: int) -> int:
+        if not self._item_ids:
+            return -1
+        return max(0, min(len(self._item_ids) - 1, int((self._top + y) // self._row_height)))
+
+    def activate(self, index: int | str) -> None:
+        i = self._normalize_index(index)
+        if 0 <= i < len(self._item_ids):
+            self._active_id = self._item_ids[i]
+            self.see(i)
+
+    def see(self, index: int | str) -> None:
+        i = self._normalize_index(index)
+        if not 0 <= i < len(self._item_ids):
+            return
+        row_top = i * self._row_height
+        viewport_height = self.winfo_height()
+        if row_top < self._top:
+            self._top = row_top
+        elif row_top + self._row_height > self._top + viewport_height:
+            self._top = row_top + self._row_height - viewport_height
+        self._clamp_top()
+        self._redraw()
+
+    # --- Scrolling ---
+
+    def yview(self, *args: Any) -> tuple[float, float] | None:  # type: ignore[override]
+        """Scrollbar-compatible yview: query, 'moveto' and 'scroll' forms."""
+        if not args:
+            return self._view_fractions()
+        if args[0] == tk.MOVETO:
+            self._top = int(float(args[1]) * self._total_height())
+        elif args[0] == tk.SCROLL:
+            amount, what = int(args[1]), args[2]
+            step = self._row_height if what == tk.UNITS else max(self._row_height, int(self.winfo_height() * 0.9))
+            self._top += amount * step
+        self._clamp_top()
+        self._redraw()
+        return None
+
+    def yview_moveto(self, fraction: float) -> None:  # type: ignore[override]
+        self.yview(tk.MOVETO, fraction)
+
+    def _total_height(self) -> int:
+        return len(self._item_ids) * self._row_height
+
+    def _clamp_top(self) -> None:
+        max_top = max(0, self._total_height() - self.winfo_height())
+        self._top = max(0, min(self._top, max_top))
+
+    def _view_fractions(self) -> tuple[float, float]:
+        total = self._total_height()
+        if total <= 0:
+            return 0.0, 1.0
+        return self._top / total, min(1.0, (self._top + self.winfo_height()) / total)
+
+    # --- Rendering ---
+
+    def _redraw(self) -> None:
+        """Repositions and relabels the pooled canvas items for the visible rows only."""
+        count = len(self._item_ids)
+        width = self.winfo_width()
+        height = self.winfo_height()
+        row_height = self._row_height
+
+        first = max(0, self._top // row_height - self._overscan)
+        last = min(count, (self._top + height) // row_height + 1 + self._overscan)
+        needed = max(0, last - first)
+
+        while len(self._row_pool) < needed:
+            rect = self.create_rectangle(0, 0, 0, 0, outline="", width=0)
+            text = self.create_text(0, 0, anchor=tk.W)
+            self._row_pool.append((rect, text))
+
+        background = self.cget("background")
+        for slot, index in enumerate(range(first, last)):
+            rect, text = self._row_pool[slot]
+            label, row_bg = self._row_provider(index)
+            selected = self._item_ids[index] in self._selected_ids
+            y = index * row_height - self._top
+            self.coords(rect, 0, y, width, y + row_height)
+            self.itemconfigure(rect, fill=self._select_bg if selected else (row_bg or background), state=tk.NORMAL)
+            self.coords(text, 4, y + row_height / 2)
+            self.itemconfigure(text, text=label, font=self._font, fill=self._select_fg if selected else self._fg, state=tk.NORMAL)
+
+        for rect, text in self._row_pool[needed:]:
+            self.itemconfigure(rect, state=tk.HIDDEN)
+            self.itemconfigure(text, state=tk.HIDDEN)
+
+        if self._yscrollcommand:
+            self._yscrollcommand(*self._view_fractions())
+
+    # --- User interaction ---
+
+    def _bind_events(self) -> None:
+        self.bind("<Configure>", self._on_configure)
+        self.bind("<Button-1>", self._on_click)
+        self.bind("<Shift-Button-1>", self._on_shift_click)
+        self.bind("<Control-Button-1>", self._on_control_click)
+        self.bind("<B1-Motion>", self._on_drag)
+        self.bind("<Up>", lambda event: self._on_arrow_key(-1))
+        self.bind("<Down>", lambda event: self._on_arrow_key(1))
+        self.bind("<Shift-Up>", lambda event: self._on_arrow_key(-1, extend=True))
+        self.bind("<Shift-Down>", lambda event: self._on_arrow_key(1, extend=True))
+        self.bind("<Home>", lambda event: self._move_active(0))
+        self.bind("<End>", lambda event: self._move_active(len(self._item_ids) - 1))
+        self.bind("<Shift-Home>", lambda event: self._move_active(0, extend=True))
+        self.bind("<Shift-End>", lambda event: self._move_active(len(self._item_ids) - 1, extend=True))
+        self.bind("<Prior>", lambda event: self.yview(tk.SCROLL, -1, tk.PAGES))
+        self.bind("<Next>", lambda event: self.yview(tk.SCROLL, 1, tk.PAGES))
+        self.bind("<Control-a>", self._on_select_all)
+        self.bind("<<SelectAll>>", self._on_select_all)
+        self.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.bind("<Button-4>", lambda event: self.yview(tk.SCROLL, -3, tk.UNITS))
+        self.bind("<Button-5>", lambda event: self.yview(tk.SCROLL, 3, tk.UNITS))
+
+    def _on_configure(self, event: Event) -> None:
+        self._clamp_top()
+        self._redraw()
+
+    def _select_only(self, index: int) -> None:
+        item_id = self._item_ids[index]
+        self._selected_ids = {item_id}
+        self._anchor_id = item_id
+        self._active_id = item_id
+
+    def _on_click(self, event: Event) -> None:
+        self.focus_set()
+        index = self.nearest(event.y)
+        if index < 0:
+            return
+        self._select_only(index)
+        self._redraw()
+        self.event_generate("<<ListboxSelect>>")
+
+    def _on_shift_click(self, event: Event) -> None:
+        index = self.nearest(event.y)
+        if index < 0:
+            return
+        if self._selectmode not in (tk.EXTENDED, tk.MULTIPLE) or self._anchor_id is None:
+            self._on_click(event)
+            return
+        self._select_range_from_anchor(index)
+
+    def _on_control_click(self, event: Event) -> None:
+        index = self.nearest(event.y)
+        if index < 0:
+            return
+        if self._selectmode not in (tk.EXTENDED, tk.MULTIPLE):
+            self._on_click(event)
+            return
+        item_id = self._item_ids[index]
+        if item_id in self._selected_ids:
+            self._selected_ids.discard(item_id)
+        else:
+            self._selected_ids.add(item_id)
+        self._anchor_id = item_id
+        self._active_id = item_id
+        self._redraw()
+        self.event_generate("<<ListboxSelect>>")
+
+    def _on_drag(self, event: Event) -> None:
+        if self._selectmode != tk.EXTENDED or self._anchor_id is None:
+            return
+        self._select_range_from_anchor(self.nearest(event.y))
+
+    def _select_range_from_anchor(self, index: int) -> None:
+        anchor_index = self._get_index_by_id().get(self._anchor_id, index)  # type: ignore[arg-type]
+        start, end = sorted((anchor_index, index))
+        new_selection = set(self._item_ids[start:end + 1])
+        self._active_id = self._item_ids[index]
+        if new_selection != self._selected_ids:
+            self._selected_ids = new_selection
+            self._redraw()
+            self.event_generate("<<ListboxSelect>>")
+
+    def _on_arrow_key(self, step: int, extend: bool = False) -> str:
+        if not self._item_ids:
+            return "break"
+        current = self._get_index_by_id().get(self._active_id, -1 if step > 0 else len(self._item_ids))  # type: ignore[arg-type]
+        return self._move_active(current + step, extend)
+
+    def _move_active(self, index: int, extend: bool = False) -> str:
+        """Moves the active row by keyboard; extend grows the selection from the anchor (Shift)."""
+        if not self._item_ids:
+            return "break"
+        index = max(0, min(len(self._item_ids) - 1, index))
+        if extend and self._selectmode == tk.EXTENDED and self._anchor_id is not None:
+            self._select_range_from_anchor(index)
+        else:
+            self._select_only(index)
+            self.event_generate("<<ListboxSelect>>")
+        self.see(index)
+        return "break"
+
+    def _on_select_all(self, event: Event) -> str:
+        if self._selectmode in (tk.EXTENDED, tk.MULTIPLE) and self._item_ids:
+            self._selected_ids = set(self._item_ids)
+            self._redraw()
+            self.event_generate("<<ListboxSelect>>")
+        return "break"
+
+    def _on_mouse_wheel(self, event: Event) -> None:
+        # Windows reports multiples of 120 per notch; macOS reports small deltas
+        if abs(event.delta) >= 120:
+            notches = int(event.delta / 120)
+        else:
+            notches = (event.delta > 0) - (event.delta < 0)
+        self.yview(tk.SCROLL, -notches * 3, tk.UNITS)
@@ -1,25 +1,48 @@
 from __future__ import annotations
 
+import os
 import tkinter as tk
+from collections.abc import Callable
 from tkinter import ttk
 from typing import TYPE_CHECKING
 
+from src.core import plugin_pipeline, plugin_runner
 from src.gui.base.base_toplevel_gui import BaseToplevelGUI
+from src.utils.error_handler import log_and_show_error
 
 if TYPE_CHECKING:
     from src.core.base_application import BaseApplication
     from src.core.config.settings_manager import SettingsManager
+    from src.core.plugin_runner import ItemResult, PluginJob
     from src.plugins.base_plugin import Plugin
 
+ELAPSED_UPDATE_MS = 200
+SCOPE_LABELS = {"selected": "Selected items", "search": "All search matches"}
+
 
 class FormatDialog(BaseToplevelGUI):
-    def __init__(self, master: tk.Misc, app_instance: BaseApplication, settings_manager: SettingsManager) -> None:
+    """
+    Lets the user pick a plugin or pipeline. When scopes ({scope key: texts},
+    see SCOPE_LABELS) and on_result are given, the chosen plugin is run on the
+    texts of the chosen scope in the background while the dialog shows its
+    progress and can cancel it; on_result(plugin, scope key, results) is called
+    once every result has arrived. With files (input path, output path) instead
+    of scopes, the input file is streamed through the plugin into the output
+    file and on_result(plugin, "file", [output path]) is called. Without
+    either, the dialog only records selected_plugin.
+    """
+    def __init__(self, master: tk.Misc, app_instance: BaseApplication, settings_manager: SettingsManager, scopes: dict[str, list[str]] | None = None, on_result: Callable[[Plugin, str, list[ItemResult]], None] | None = None, files: tuple[str, str] | None = None) -> None:
         super().__init__(master, app_instance)
         self.title("Select Formatter")
         self.selected_plugin: Plugin | None = None
         self.settings_manager = settings_manager
+        self.scopes = {key: texts for key, texts in (scopes or {}).items() if texts}
+        self.on_result = on_result
+        self.files = files
+        self.job: PluginJob | None = None
+        self._elapsed_after_id: str | None = None
 
-        self.geometry("350x300") # Adjusted height for buttons
+        self.geometry("350x520") # Adjusted height for plugins, pipelines and progress
         self.grab_set()
 
         self._create_widgets()
@@ -34,15 +57,47 @@ class FormatDialog(BaseToplevelGUI):
         label = ttk.Label(main_frame, text="Choose a plugin to apply:")
         label.pack(pady=5)
 
+        # Which items the plugin is applied to
+        self.scope_var = tk.StringVar(value="file" if self.files is not None else next(iter(self.scopes), ""))
+        if self.files is not None:
+            ttk.Label(main_frame, text=f"Applies to {os.path.basename(self.files[0])}").pack()
+        elif len(self.scopes) > 1:
+            scope_frame = ttk.Frame(main_frame)
+            scope_frame.pack(fill=tk.X)
+            for key, texts in self.scopes.items():
+                ttk.Radiobutton(scope_frame, text=f"{SCOPE_LABELS[key]} ({len(texts)})", variable=self.scope_var, value=key).pack(anchor=tk.W)
+        elif self.scopes:
+            count = len(next(iter(self.scopes.values())))
+            if count > 1:
+                ttk.Label(main_frame, text=f"Applies to {count} items").pack()
+
         # Frame for plugin buttons
         plugin_button_frame = ttk.Frame(main_frame)
         plugin_button_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
+        self.plugin_buttons: list[ttk.Button] = []
         self.plugins: list[Plugin] = self.app.plugin_manager.get_available_plugins() # type: ignore
         for plugin in self.plugins:
             button = ttk.Button(plugin_button_frame, text=plugin.name,
                                 command=lambda p=plugin: self._on_plugin_select(p)) # type: ignore
             button.pack(fill=tk.X, pady=2) # Pack buttons vertically
+            self.plugin_buttons.append(button)
+
+        # Saved plugin chains; each runs as one job and one undo step
+        self.pipeline_frame = ttk.LabelFrame(main_frame, text="Pipelines", padding=5)
+        self.pipeline_frame.pack(fill=tk.X, pady=5)
+        self.pipeline_buttons_frame = ttk.Frame(self.pipeline_frame)
+        self.pipeline_buttons_frame.pack(fill=tk.X)
+        self.edit_pipelines_button = ttk.Button(self.pipeline_frame, text="Edit Pipelines...", command=self._edit_pipelines)
+        self.edit_pipelines_button.pack(anchor=tk.E, pady=(2, 0))
+        self._create_pipeline_buttons()
+
+        # Shown while a plugin is running
+        self.progress_frame = ttk.Frame(main_frame)
+        self.progress_bar = ttk.Progressbar(self.progress_frame, mode="indeterminate")
+        self.progress_bar.pack(fill=tk.X)
+        self.status_label = ttk.Label(self.progress_frame, text="")
+        self.status_label.pack(anchor=tk.W, pady=(2, 0))
 
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=5)
@@ -50,10 +105,90 @@ class FormatDialog(BaseToplevelGUI):
         cancel_button = ttk.Button(button_frame, text="Cancel", command=self._on_cancel)
         cancel_button.pack(side=tk.RIGHT)
 
+    def _create_pipeline_buttons(self) -> None:
+        for child in self.pipeline_buttons_frame.winfo_children():
+            child.destroy()
+        self.pipeline_buttons: list[ttk.Button] = []
+        for pipeline in plugin_pipeline.load_pipelines(self.settings_manager, self.plugins):
+            button = ttk.Button(self.pipeline_buttons_frame, text=f"{pipeline.name} ({len(pipeline.stages)} steps)",
+                                command=lambda p=pipeline: self._on_plugin_select(p)) # type: ignore
+            button.pack(fill=tk.X, pady=2)
+            self.pipeline_buttons.append(button)
+
+    def _edit_pipelines(self) -> None:
+        from src.gui.dialogs.pipeline_editor_dialog import PipelineEditorDialog
+        self.app.create_toplevel(PipelineEditorDialog, self.settings_manager) # type: ignore
+        if self.winfo_exists():
+            self.grab_set() # The editor took the grab while it was open
+            self._create_pipeline_buttons()
+
     def _on_plugin_select(self, plugin: Plugin) -> None:
         self.selected_plugin = plugin
+        if self.on_result is not None and self.files is not None:
+            self._set_running(True)
+            input_path, output_path = self.files
+            self.job = self.app.plugin_runner.run_file(self, plugin, input_path, output_path, on_done=lambda path: self._on_done([path]), on_error=self._on_error) # type: ignore
+            self._update_elapsed()
+            return
+        if not self.scopes or self.on_result is None:
+            self.destroy()
+            return
+        self._set_running(True)
+        texts = self.scopes[self.scope_var.get()]
+        timeout = plugin_runner.DEFAULT_TIMEOUT_S if len(texts) == 1 else plugin_runner.DEFAULT_BATCH_TIMEOUT_S
+        self.job = self.app.plugin_runner.run_batch(self, plugin, texts, on_done=self._on_done, on_error=self._on_error, on_progress=self._on_progress, timeout=timeout) # type: ignore
+        if len(texts) > 1:
+            self.progress_bar.stop()
+            self.progress_bar.config(mode="determinate", maximum=len(texts), value=0)
+        self._update_elapsed()
+
+    def _set_running(self, running: bool) -> None:
+        for button in [*self.plugin_buttons, *self.pipeline_buttons, self.edit_pipelines_button]:
+            button.config(state=tk.DISABLED if running else tk.NORMAL)
+        if running:
+            self.progress_frame.pack(fill=tk.X, pady=5)
+            self.progress_bar.config(mode="indeterminate")
+            self.progress_bar.start()
+        else:
+            self.progress_bar.stop()
+            self.progress_frame.pack_forget()
+            if self._elapsed_after_id is not None:
+                self.after_cancel(self._elapsed_after_id)
+                self._elapsed_after_id = None
+
+    def _update_elapsed(self) -> None:
+        self._elapsed_after_id = None
+        if self.job is None or not self.job.is_running:
+            return
+        where = "separate processes" if self.job.in_process else "background"
+        done = f" {self.job.done_count}/{self.job.total} done," if self.job.total > 1 else ""
+        self.status_label.config(text=f"Running {self.job.plugin.name} in the {where}...{done} {self.job.elapsed:.1f} s")
+        self._elapsed_after_id = self.after(ELAPSED_UPDATE_MS, self._update_elapsed)
+
+    def _on_progress(self, done: int, total: int) -> None:
+        if total > 1:
+            self.progress_bar.config(value=done)
+
+    def _on_done(self, results: list[ItemResult]) -> None:
+        plugin, self.job = self.selected_plugin, None
+        scope = self.scope_var.get()
+        self._set_running(False)
+        if len(results) == 1 and isinstance(results[0], BaseException):
+            self._on_error(results[0])
+            return
         self.destroy()
+        if plugin is not None and self.on_result is not None:
+            self.on_result(plugin, scope, results)
+
+    def _on_error(self, error: BaseException) -> None:
+        self.job = None
+        self._set_running(False)
+        self.selected_plugin = None
+        log_and_show_error("Format Failed", f"The plugin could not process the text.\n\n{type(error).__name__}: {error}")
 
     def _on_cancel(self) -> None:
+        if self.job is not None:
+            self.job.cancel()
+            self.job = None
         self.selected_plugin = None
         self.destroy()
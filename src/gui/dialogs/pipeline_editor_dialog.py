@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import messagebox, ttk
+from typing import TYPE_CHECKING
+
+from src.core import plugin_pipeline
+from src.gui.base.base_toplevel_gui import BaseToplevelGUI
+
+if TYPE_CHECKING:
+    from src.core.base_application import BaseApplication
+    from src.core.config.settings_manager import SettingsManager
+
+
+class PipelineEditorDialog(BaseToplevelGUI):
+    """Creates, edits and deletes the saved plugin pipelines."""
+    def __init__(self, master: tk.Misc, app_instance: BaseApplication, settings_manager: SettingsManager) -> None:
+        super().__init__(master, app_instance)
+        self.title("Edit Pipelines")
+        self.settings_manager = settings_manager
+        self.presets = plugin_pipeline.get_presets(settings_manager)
+        self.plugin_names: list[str] = [plugin.name for plugin in self.app.plugin_manager.get_text_plugins()] # type: ignore
+        self.stages: list[str] = []
+
+        self.geometry("520x380")
+        self.grab_set()
+        self._create_widgets()
+        self._select_preset(next(iter(self.presets), ""))
+
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+        self.wait_window(self)
+
+    def _create_widgets(self) -> None:
+        main_frame = ttk.Frame(self, padding=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        preset_frame = ttk.Frame(main_frame)
+        preset_frame.pack(fill=tk.X)
+        ttk.Label(preset_frame, text="Pipeline:").pack(side=tk.LEFT)
+        self.name_var = tk.StringVar()
+        self.name_combo = ttk.Combobox(preset_frame, textvariable=self.name_var, values=list(self.presets))
+        self.name_combo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.name_combo.bind("<<ComboboxSelected>>", lambda event: self._select_preset(self.name_var.get()))
+        ttk.Button(preset_frame, text="Delete", command=self._delete_preset).pack(side=tk.LEFT)
+
+        lists_frame = ttk.Frame(main_frame)
+        lists_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+
+        available_frame = ttk.LabelFrame(lists_frame, text="Plugins")
+        available_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.available_listbox = tk.Listbox(available_frame, exportselection=False)
+        self.available_listbox.pack(fill=tk.BOTH, expand=True)
+        for name in self.plugin_names:
+            self.available_listbox.insert(tk.END, name)
+        self.available_listbox.bind("<Double-1>", lambda event: self._add_stage())
+
+        buttons_frame = ttk.Frame(lists_frame)
+        buttons_frame.pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons_frame, text="Add →", command=self._add_stage).pack(fill=tk.X, pady=2)
+        ttk.Button(buttons_frame, text="Remove", command=self._remove_stage).pack(fill=tk.X, pady=2)
+        ttk.Button(buttons_frame, text="Up", command=lambda: self._move_stage(-1)).pack(fill=tk.X, pady=2)
+        ttk.Button(buttons_frame, text="Down", command=lambda: self._move_stage(1)).pack(fill=tk.X, pady=2)
+
+        stages_frame = ttk.LabelFrame(lists_frame, text="Stages (in order)")
+        stages_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.stages_listbox = tk.Listbox(stages_frame, exportselection=False)
+        self.stages_listbox.pack(fill=tk.BOTH, expand=True)
+
+        bottom_frame = ttk.Frame(main_frame)
+        bottom_frame.pack(fill=tk.X)
+        ttk.Button(bottom_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT)
+        ttk.Button(bottom_frame, text="Save", command=self._save_preset).pack(side=tk.RIGHT, padx=5)
+
+    def _select_preset(self, name: str) -> None:
+        self.name_var.set(name)
+        self.stages = list(self.presets.get(name, []))
+        self._refresh_stages()
+
+    def _refresh_stages(self, selected: int | None = None) -> None:
+        self.stages_listbox.delete(0, tk.END)
+        for stage in self.stages:
+            self.stages_listbox.insert(tk.END, stage)
+        if selected is not None:
+            self.stages_listbox.selection_set(selected)
+
+    def _add_stage(self) -> None:
+        for index in self.available_listbox.curselection():
+            self.stages.append(self.plugin_names[index])
+        self._refresh_stages()
+
+    def _remove_stage(self) -> None:
+        selection = self.stages_listbox.curselection()
+        if selection:
+            del self.stages[selection[0]]
+            self._refresh_stages()
+
+    def _move_stage(self, offset: int) -> None:
+        selection = self.stages_listbox.curselection()
+        if not selection:
+            return
+        index = selection[0]
+        target = index + offset
+        if 0 <= target < len(self.stages):
+            self.stages[index], self.stages[target] = self.stages[target], self.stages[index]
+            self._refresh_stages(target)
+
+    def _save_preset(self) -> None:
+        name = self.name_var.get().strip()
+        if not name:
+            messagebox.showwarning("Save Pipeline", "Enter a name for the pipeline.", parent=self)
+            return
+        if not self.stages:
+            messagebox.showwarning("Save Pipeline", "Add at least one plugin to the pipeline.", parent=self)
+            return
+        self.presets[name] = list(self.stages)
+        plugin_pipeline.save_presets(self.settings_manager, self.presets)
+        self.name_combo.config(values=list(self.presets))
+
+    def _delete_preset(self) -> None:
+        name = self.name_var.get().strip()
+        if name not in self.presets:
+            return
+        if messagebox.askyesno("Delete Pipeline", f"Delete the pipeline '{name}'?", parent=self):
+            del self.presets[name]
+            plugin_pipeline.save_presets(self.settings_manager, self.presets)
+            self.name_combo.config(values=list(self.presets))
+            self._select_preset(next(iter(self.presets), ""))
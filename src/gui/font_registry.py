@@ -0,0 +1,54 @@
+import functools
+from tkinter import font as tkfont
+
+
+class FontRegistry:
+    """
+    Keeps one named Tk font per role (e.g. "history") and reuses it.
+
+    Widgets that use a named font follow it automatically when it is
+    reconfigured, so a settings change only has to touch the font itself,
+    and only when the family or size actually differs.
+    """
+    def __init__(self, prefix: str = "ClipWatcher") -> None:
+        self.prefix = prefix
+        self._fonts: dict[str, tkfont.Font] = {}
+        self._specs: dict[str, tuple[str, int]] = {}
+
+    def get_font(self, role: str, family: str, size: int) -> tuple[tkfont.Font, bool]:
+        """
+        Returns the font for a role, creating or reconfiguring it as needed.
+        The flag is True when the font is new or its metrics changed, i.e.
+        when widgets that cache metrics (such as VirtualListbox) must update.
+        """
+        named_font = self._fonts.get(role)
+        if named_font is None:
+            name = f"{self.prefix}{role.title().replace('_', '')}Font"
+            if name in tkfont.names():
+                # Created by an earlier registry on the same interpreter
+                named_font = tkfont.nametofont(name)
+                named_font.configure(family=family, size=size)
+            else:
+                named_font = tkfont.Font(name=name, family=family, size=size, exists=False)
+            self._fonts[role] = named_font
+            self._specs[role] = (family, size)
+            return named_font, True
+
+        if self._specs[role] == (family, size):
+            return named_font, False
+        named_font.configure(family=family, size=size)
+        self._specs[role] = (family, size)
+        return named_font, True
+
+
+font_registry = FontRegistry()
+
+
+@functools.cache
+def get_font_families() -> tuple[str, ...]:
+    """
+    Returns the sorted system font families. Enumerating fonts is slow on
+    font-heavy systems, so this is computed once per process on first use.
+    """
+    # '@'-prefixed entries are vertical-writing variants on Windows
+    return tuple(sorted({family for family in tkfont.families() if not family.startswith("@")}))
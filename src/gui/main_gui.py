@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import tkinter as tk
-from tkinter import font, ttk
+from tkinter import ttk
 from typing import TYPE_CHECKING, Any
 
 from src.core.config import defaults as config
@@ -10,11 +10,14 @@ from src.gui.base.base_frame_gui import BaseFrameGUI
 from src.gui.components import HistoryListComponent
 
 # from src.core.config.tool_config import TOOL_COMPONENTS
-from src.gui.custom_widgets import CustomEntry, CustomText
-from src.gui.windows.fixed_phrases_window import FixedPhrasesFrame
+from src.gui.custom_widgets import CustomEntry, LazyText
+from src.gui.font_registry import font_registry
+from src.gui.syntax_highlighter import SyntaxHighlighter
 
 if TYPE_CHECKING:
     from src.core.base_application import BaseApplication
+    from src.core.clipboard_monitor import HistoryChange
+    from src.core.warm_start import WarmStartRow
     from src.plugins.base_plugin import Plugin
 
 
@@ -44,13 +47,21 @@ class ClipWatcherGUI(BaseFrameGUI):
         self.undo_button = ttk.Button(self.current_clipboard_frame, text="⟲", command=lambda: self.app.event_dispatcher.dispatch("REQUEST_UNDO_LAST_ACTION"), state=tk.DISABLED) # type: ignore
         self.undo_button.pack(side=tk.RIGHT, padx=config.BUTTON_PADDING_X)
 
+        self.show_all_button = ttk.Button(self.current_clipboard_frame, text="", state=tk.DISABLED) # Text set in _update_widget_text
+        self.show_all_button.pack(side=tk.RIGHT, padx=config.BUTTON_PADDING_X)
+
         self.clipboard_text_scrollbar = ttk.Scrollbar(self.current_clipboard_frame, orient="vertical")
         self.clipboard_text_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.clipboard_text_widget = CustomText(self.current_clipboard_frame, wrap=tk.WORD, height=5, relief=tk.FLAT, yscrollcommand=self.clipboard_text_scrollbar.set, app=self.app)
+        # Large items are shown head-first and loaded in chunks while idle
+        self.clipboard_text_widget = LazyText(self.current_clipboard_frame, wrap=tk.WORD, height=5, relief=tk.FLAT, yscrollcommand=self.clipboard_text_scrollbar.set, app=self.app, on_load_state_changed=self._on_content_load_state_changed)
+        self.show_all_button.config(command=self.clipboard_text_widget.load_all)
         self.clipboard_text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         self.clipboard_text_scrollbar.config(command=self.clipboard_text_widget.yview)
+        # Tokenized on a worker thread; only the visible lines are tagged
+        self.syntax_highlighter = SyntaxHighlighter(self.clipboard_text_widget, enabled=self.app.settings_manager.get_setting("syntax_highlighting_enabled", True)) # type: ignore
+        self.app.theme_manager.register_widget(self.clipboard_text_widget, self.syntax_highlighter.apply_theme) # type: ignore
 
         self.clipboard_text_widget.config(state=tk.NORMAL)
         # Bind focus events to control editing state
@@ -68,6 +79,8 @@ class ClipWatcherGUI(BaseFrameGUI):
 
         self.search_entry = CustomEntry(self.search_frame, app=self.app)
         self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=config.BUTTON_PADDING_X)
+        # Typing bursts are collapsed into one search with the latest query
+        self.app.event_dispatcher.set_coalescing("HISTORY_SEARCH", config.SEARCH_COALESCE_MS) # type: ignore
         self.search_entry.bind("<KeyRelease>", lambda event: self.app.event_dispatcher.dispatch("HISTORY_SEARCH", self.search_entry.get())) # type: ignore
 
         self.history_container_frame = ttk.LabelFrame(history_area_frame, text="") # Text set in _update_widget_text
@@ -92,20 +105,25 @@ class ClipWatcherGUI(BaseFrameGUI):
 
         self.fixed_phrases_tab_frame = ttk.Frame(self.notebook, padding=config.FRAME_PADDING)
         self.notebook.add(self.fixed_phrases_tab_frame, text="") # Text set in _update_widget_text
-        self.fixed_phrases_frame = FixedPhrasesFrame(self.fixed_phrases_tab_frame, self.app)
-        self.fixed_phrases_frame.pack(fill=tk.BOTH, expand=True)
+        self.fixed_phrases_frame: tk.Misc | None = None # Created when the tab is first selected
 
-        self.plugin_tab_frames: list[tk.Frame] = [] # Keep track of created frames
+        # Placeholder tab frames by plugin name; the real component is created on first selection
+        self.plugin_tab_frames: dict[str, ttk.Frame] = {}
+        self.plugin_tab_plugins: dict[str, Plugin] = {}
+        self.materialized_plugin_tabs: set[str] = set()
+        self.plugin_tabs_enabled: bool = False # Plugin tabs are added after the first paint
 
-        self.app.event_dispatcher.subscribe("UNDO_REDO_STACK_CHANGED", self._update_undo_redo_buttons) # type: ignore
-        self.app.event_dispatcher.subscribe("SETTINGS_CHANGED", self.on_settings_changed) # type: ignore
-        self.app.event_dispatcher.subscribe("HISTORY_SELECTION_CHANGED", self._on_history_selection_changed) # type: ignore
-        self.app.event_dispatcher.subscribe("LANGUAGE_CHANGED", self._update_widget_text) # type: ignore
+        self.app.event_dispatcher.subscribe("UNDO_REDO_STACK_CHANGED", self._update_undo_redo_buttons, weak=True) # type: ignore
+        self.app.event_dispatcher.subscribe("SETTINGS_CHANGED", self.on_settings_changed, weak=True) # type: ignore
+        self.app.event_dispatcher.subscribe("HISTORY_SELECTION_CHANGED", self._on_history_selection_changed, weak=True) # type: ignore
+        self.app.event_dispatcher.subscribe("LANGUAGE_CHANGED", self._update_widget_text, weak=True) # type: ignore
 
         self.on_font_settings_changed(self.app.settings_manager.settings) # type: ignore
-        self._create_plugin_tabs()
         self._update_widget_text() # Initial text setup
+        # Non-ttk widgets are registered once; theme changes only touch the registry
+        self.app.theme_manager.register_widget_tree(self.master) # type: ignore
         self.notebook.bind("<Button-1>", self.handle_global_click, add="+")
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_notebook_tab_changed, add="+")
 
     def handle_global_click(self, event: tk.Event) -> None:
         """
@@ -123,6 +141,8 @@ class ClipWatcherGUI(BaseFrameGUI):
     def start_editing(self, event: tk.Event) -> None:
         """User starts editing the text area."""
         self.is_user_editing = True
+        # The widget may diverge from the last set content from here on
+        self.clipboard_text_widget.invalidate_content()
 
     def finish_editing(self, event: tk.Event) -> None:
         """
@@ -134,6 +154,9 @@ class ClipWatcherGUI(BaseFrameGUI):
             return
 
         self.is_user_editing = False
+        if not self.clipboard_text_widget.is_fully_loaded:
+            # Only a partial copy is in the widget; never commit it as an edit
+            return
         edited_text: str = self.clipboard_text_widget.get("1.0", "end-1c")
 
         if not edited_text:
@@ -142,10 +165,11 @@ class ClipWatcherGUI(BaseFrameGUI):
         selected_indices: tuple[int, ...] = self.history_component.listbox.curselection()
 
         if selected_indices:
-            index: int = selected_indices[0]
+            item_ids = self.history_component.get_ids_for_indices(selected_indices[:1])
+            original_text = self.app.monitor.get_content_by_id(item_ids[0]) if item_ids else None # type: ignore
 
-            if 0 <= index < len(self.history_data):
-                original_text, _, item_id = self.history_data[index]
+            if original_text is not None:
+                item_id = item_ids[0]
 
                 if edited_text != original_text:
                     from src.core.commands import UpdateHistoryCommand
@@ -165,6 +189,7 @@ class ClipWatcherGUI(BaseFrameGUI):
         self.master.title(translator("app_title")) # type: ignore
         self.notebook.tab(self.clipboard_tab_frame, text=translator("clipboard_tab"))
         self.current_clipboard_frame.config(text=translator("current_clipboard_content_label"))
+        self.show_all_button.config(text=translator("show_all_button"))
 
         if not self.clipboard_text_widget.get("1.0", "end-1c"):
             self.clipboard_text_widget.insert(tk.END, translator("waiting_for_clipboard_content"))
@@ -179,32 +204,78 @@ class ClipWatcherGUI(BaseFrameGUI):
         self.format_button.config(text=translator("format_button"))
         self.quit_button.config(text=translator("quit_button"))
         self.notebook.tab(self.fixed_phrases_tab_frame, text=translator("fixed_phrases_tab"))
+        for name, frame in self.plugin_tab_frames.items():
+            self.notebook.tab(frame, text=translator(name))
 
-    def _destroy_plugin_tabs(self) -> None:
-        for frame in self.plugin_tab_frames:
-            self.notebook.forget(frame)
-            frame.destroy()
-        self.plugin_tab_frames = []
+    def enable_plugin_tabs(self) -> None:
+        """Adds the plugin tabs; deferred until after startup so plugin modules are not imported before the first paint."""
+        self.plugin_tabs_enabled = True
+        self._sync_plugin_tabs()
 
-    def _create_plugin_tabs(self) -> None:
-        """Dynamically creates GUI tabs from plugins based on settings."""
-        self._destroy_plugin_tabs() # Clear existing plugin tabs
+    def _sync_plugin_tabs(self) -> None:
+        """
+        Shows or hides plugin tabs according to their visibility settings.
+        Only tabs whose flag changed are touched; hidden tabs keep their
+        component (and its state) so that showing them again is cheap.
+        """
         gui_plugins: list[Plugin] = self.app.plugin_manager.get_gui_plugins() # type: ignore
         for plugin in gui_plugins:
             setting_key = f"show_{plugin.name.lower().replace(' ', '_')}_tab"
-            if self.app.settings_manager.get_setting(setting_key, True): # type: ignore
-                try:
-                    component_frame: tk.Frame | None = plugin.create_gui_component(self.notebook, self.app) # type: ignore
-                    if component_frame:
-                        self.plugin_tab_frames.append(component_frame) # Track the frame
-                        tab_text: str = self.app.translator(plugin.name) # type: ignore
-                        self.notebook.add(component_frame, text=tab_text)
-                except Exception as e:
-                    print(f"Failed to create GUI component for plugin '{plugin.name}': {e}")
+            visible: bool = self.app.settings_manager.get_setting(setting_key, True) # type: ignore
+            frame = self.plugin_tab_frames.get(plugin.name)
+
+            if frame is None:
+                if visible:
+                    frame = ttk.Frame(self.notebook)
+                    self.plugin_tab_frames[plugin.name] = frame
+                    self.plugin_tab_plugins[plugin.name] = plugin
+                    self.notebook.add(frame, text=self.app.translator(plugin.name)) # type: ignore
+                continue
+
+            is_shown: bool = self.notebook.tab(frame, "state") != "hidden"
+            if visible and not is_shown:
+                self.notebook.add(frame) # Re-adding a hidden tab restores it in place
+            elif not visible and is_shown:
+                self.notebook.hide(frame)
+
+    def _on_notebook_tab_changed(self, event: tk.Event) -> None:
+        selected: str = self.notebook.select()
+        if selected == str(self.fixed_phrases_tab_frame):
+            self._materialize_fixed_phrases_tab()
+            return
+        for name, frame in self.plugin_tab_frames.items():
+            if str(frame) == selected:
+                self._materialize_plugin_tab(name)
+                break
+
+    def _materialize_fixed_phrases_tab(self) -> None:
+        if self.fixed_phrases_frame is not None:
+            return
+        from src.gui.windows.fixed_phrases_window import FixedPhrasesFrame
+        self.fixed_phrases_frame = FixedPhrasesFrame(self.fixed_phrases_tab_frame, self.app)
+        self.fixed_phrases_frame.pack(fill=tk.BOTH, expand=True)
+        self.app.theme_manager.register_widget_tree(self.fixed_phrases_frame) # type: ignore
+
+    def _materialize_plugin_tab(self, name: str) -> None:
+        """Creates the real GUI component inside a placeholder tab on first use."""
+        if name in self.materialized_plugin_tabs:
+            return
+        self.materialized_plugin_tabs.add(name)
+        plugin = self.plugin_tab_plugins[name]
+        frame = self.plugin_tab_frames[name]
+        try:
+            component_frame: tk.Misc | None = plugin.create_gui_component(frame, self.app) # type: ignore
+            if component_frame:
+                component_frame.pack(fill=tk.BOTH, expand=True) # type: ignore
+                self.app.theme_manager.register_widget_tree(component_frame) # type: ignore
+        except Exception as e:
+            print(f"Failed to create GUI component for plugin '{plugin.name}': {e}")
 
     def on_settings_changed(self, settings: dict[str, Any]) -> None:
         self.on_font_settings_changed(settings)
-        self._create_plugin_tabs() # Re-create tabs based on new settings
+        self.syntax_highlighter.set_enabled(settings.get("syntax_highlighting_enabled", True))
+        if self.plugin_tabs_enabled:
+            self._sync_plugin_tabs() # Add or hide only the tabs whose visibility changed
 
     def on_font_settings_changed(self, settings: dict[str, Any]) -> None:
         self.apply_font_settings(
@@ -218,29 +289,40 @@ class ClipWatcherGUI(BaseFrameGUI):
         self.undo_button.config(state=tk.NORMAL if data['can_undo'] else tk.DISABLED)
         self.redo_button.config(state=tk.NORMAL if data['can_redo'] else tk.DISABLED)
 
+    def _on_content_load_state_changed(self, is_fully_loaded: bool) -> None:
+        self.show_all_button.config(state=tk.DISABLED if is_fully_loaded else tk.NORMAL)
+
     def _on_history_selection_changed(self, data: dict[str, Any]) -> None:
         selected_indices: tuple[int, ...] = data["selected_indices"]
-        self.clipboard_text_widget.config(state=tk.NORMAL)
-        self.clipboard_text_widget.delete(1.0, tk.END)
 
         if selected_indices:
             self.format_button.config(state=tk.NORMAL)
-            index: int = selected_indices[0]
-            if 0 <= index < len(self.history_data):
-                content, _, _ = self.history_data[index]
-                self.clipboard_text_widget.insert(tk.END, content)
+            # Looked up by ID: the row may be a search result or a snapshot row
+            content = self.history_component.get_content_for_index(selected_indices[0])
+            self.clipboard_text_widget.set_content(content or "")
         else:
             self.format_button.config(state=tk.DISABLED)
-            self.clipboard_text_widget.insert(tk.END, self.app.monitor.last_clipboard_data) # type: ignore
-            self.clipboard_text_widget.config(state=tk.NORMAL)
+            self.clipboard_text_widget.set_content(self.app.monitor.last_clipboard_data) # type: ignore
 
     def apply_font_settings(self, clipboard_content_font_family: str, clipboard_content_font_size: int, history_font_family: str, history_font_size: int) -> None:
-        clipboard_font = font.Font(family=clipboard_content_font_family, size=clipboard_content_font_size)
-        history_font = font.Font(family=history_font_family, size=history_font_size)
-        self.clipboard_text_widget.config(font=clipboard_font)
-        self.history_component.apply_font(history_font)
+        # Named fonts are reused; widgets are only touched when a font actually changed
+        clipboard_font, clipboard_font_changed = font_registry.get_font("clipboard_content", clipboard_content_font_family, clipboard_content_font_size)
+        history_font, history_font_changed = font_registry.get_font("history", history_font_family, history_font_size)
+        if clipboard_font_changed:
+            self.clipboard_text_widget.config(font=clipboard_font)
+        if history_font_changed:
+            self.history_component.apply_font(history_font)
+
+    def show_warm_start(self, rows: list[WarmStartRow], sort_ascending: bool = False) -> None:
+        """Paints the snapshot rows of the last session while the history is still loading."""
+        if not rows:
+            return
+        if sort_ascending:
+            rows = [row for row in reversed(rows) if row.is_pinned] + [row for row in reversed(rows) if not row.is_pinned]
+        theme = THEMES.get(self.app.theme_manager.get_current_theme(), THEMES['light']) # type: ignore
+        self.history_component.show_warm_start(rows, theme)
 
-    def update_clipboard_display(self, current_content: str, history: list[tuple[str, bool, float]], sort_ascending: bool = False) -> None:
+    def update_clipboard_display(self, current_content: str, history: list[tuple[str, bool, float]], sort_ascending: bool = False, changes: list[HistoryChange] | None = None) -> None:
         if self.is_user_editing:
             return
 
@@ -257,27 +339,25 @@ class ClipWatcherGUI(BaseFrameGUI):
         theme = THEMES.get(theme_name, THEMES['light'])
         if search_query:
             filtered_history: list[tuple[str, bool, float]] = self.app.monitor.get_filtered_history(search_query) # type: ignore
-            self.history_component.update_history(filtered_history, theme)
+            # Search results only cover the loaded history, so snapshot rows are left out
+            self.history_component.update_history(filtered_history, theme, include_warm_rows=False)
+        elif changes is not None:
+            # Apply only what changed so selection and scroll position are kept naturally
+            self.history_component.apply_changes(history, changes, theme)
         else:
             self.history_component.update_history(history, theme)
 
+        # set_content() is a no-op when the shown content did not change
         selected_indices: tuple[int, ...] = self.history_component.listbox.curselection()
-        self.clipboard_text_widget.config(state=tk.NORMAL)
-        self.clipboard_text_widget.delete(1.0, tk.END)
         if selected_indices:
-            index: int = selected_indices[0]
-            if 0 <= index < len(self.history_data):
-                content, _, _ = self.history_data[index]
-                self.clipboard_text_widget.insert(tk.END, content)
+            # Snapshot rows are not resolved here; that would re-enter this update
+            content = self.history_component.get_content_for_index(selected_indices[0], wait_for_load=False)
+            self.clipboard_text_widget.set_content(content or "")
         else:
-            self.clipboard_text_widget.insert(tk.END, current_content)
-            self.clipboard_text_widget.config(state=tk.NORMAL)
+            self.clipboard_text_widget.set_content(current_content)
 
     def select_tool_tab(self, plugin_name: str) -> None:
-        """Selects a notebook tab corresponding to the given plugin name."""
-        for i, tab_id in enumerate(self.notebook.tabs()):
-            tab_text = self.notebook.tab(tab_id, "text")
-            translated_plugin_name: str = self.app.translator(plugin_name) # type: ignore
-            if tab_text == translated_plugin_name:
-                self.notebook.select(i)
-                break
+        """Selects the notebook tab of the given plugin if it is shown."""
+        frame = self.plugin_tab_frames.get(plugin_name)
+        if frame is not None and self.notebook.tab(frame, "state") != "hidden":
+            self.notebook.select(frame) # Materializes the tab via <<NotebookTabChanged>>
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import tkinter as tk
+from typing import TYPE_CHECKING
+
+from src.gui.theme_manager import ThemeManager
+from src.utils import syntax_lexers
+from src.utils.syntax_lexers import HighlightResult
+from src.utils.tk_async import BackgroundTask, run_in_background
+
+if TYPE_CHECKING:
+    from src.gui.custom_widgets import LazyText
+
+TAG_PREFIX = "syntax_"
+
+
+class SyntaxHighlighter:
+    """
+    Highlights the content of a LazyText in the background.
+
+    The content is tokenized on a worker thread (results are cached by content
+    hash), and only the lines currently visible in the widget are tagged; more
+    lines are tagged as the view scrolls or as LazyText loads further chunks.
+    Showing other content cancels the pending highlight. The highlighter hooks
+    itself into the widget's on_content_changed and yscrollcommand.
+    """
+    def __init__(self, text_widget: LazyText, enabled: bool = True) -> None:
+        self.text_widget = text_widget
+        self.enabled = enabled
+        self._task: BackgroundTask[HighlightResult | None] | None = None
+        self._result: HighlightResult | None = None
+        self._tagged_lines: set[int] = set()
+        self._tag_after_id: str | None = None
+
+        # Tag the newly visible lines whenever the view moves
+        self._yscrollcommand = text_widget.cget("yscrollcommand")
+        text_widget.config(yscrollcommand=self._on_yscroll)
+        text_widget.on_content_changed = self.highlight
+        text_widget.bind("<Destroy>", self._on_destroy, add="+")
+
+    def set_enabled(self, enabled: bool) -> None:
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if enabled:
+            self.highlight(self.text_widget.content)
+        else:
+            self.clear()
+
+    def highlight(self, content: str | None) -> None:
+        """
+        Starts highlighting new content, cancelling any highlight in progress.
+        None (the user is editing) only stops highlighting; existing tags move with the edits.
+        """
+        if content is None:
+            self._stop()
+            return
+        self.clear()
+        if not self.enabled or not content:
+            return
+        self._task = run_in_background(self.text_widget, syntax_lexers.highlight, content, on_done=self._on_tokenized, pass_cancel_check=True)
+
+    def clear(self) -> None:
+        """Cancels a pending highlight and removes all syntax tags."""
+        self._stop()
+        self._tagged_lines.clear()
+        for token_type in syntax_lexers.TOKEN_TYPES:
+            self.text_widget.tag_remove(TAG_PREFIX + token_type, "1.0", tk.END)
+
+    def _stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._tag_after_id is not None:
+            self.text_widget.after_cancel(self._tag_after_id)
+            self._tag_after_id = None
+        self._result = None
+
+    def apply_theme(self, theme: dict[str, str]) -> None:
+        ThemeManager.apply_default_colors(self.text_widget, theme)
+        for token_type in syntax_lexers.TOKEN_TYPES:
+            self.text_widget.tag_configure(TAG_PREFIX + token_type, foreground=theme[f"syntax_{token_type}"])
+
+    def _on_tokenized(self, result: HighlightResult | None) -> None:
+        self._task = None
+        if result is None or not result.lines:
+            return
+        self._result = result
+        self._tag_visible_lines()
+
+    def _on_yscroll(self, first: float | str, last: float | str) -> None:
+        if self._yscrollcommand:
+            self.text_widget.tk.call(self._yscrollcommand, first, last)
+        if self._result is not None and self._tag_after_id is None:
+            self._tag_after_id = self.text_widget.after_idle(self._tag_visible_lines)
+
+    def _tag_visible_lines(self) -> None:
+        self._tag_after_id = None
+        if self._result is None:
+            return
+        widget = self.text_widget
+        first_line = int(widget.index("@0,0").split(".")[0])
+        last_line = int(widget.index(f"@0,{widget.winfo_height()}").split(".")[0])
+        # A line that is still being loaded is tagged once it is complete
+        loaded_lines = int(widget.index("end-1c").split(".")[0])
+        if not widget.is_fully_loaded:
+            loaded_lines -= 1
+        for line in range(first_line, min(last_line, loaded_lines) + 1):
+            if line in self._tagged_lines:
+                continue
+            self._tagged_lines.add(line)
+            for token_type, start, end in self._result.lines.get(line, ()):
+                widget.tag_add(TAG_PREFIX + token_type, f"{line}.{start}", f"{line}.{end}")
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        if event.widget == self.text_widget:
+            self._stop()
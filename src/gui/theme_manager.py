@@ -1,28 +1,54 @@
 import tkinter as tk
+import weakref
+from collections.abc import Callable
 from tkinter import Tk, Toplevel, ttk
-from typing import Any
 
 from src.core.config.defaults import THEMES
+from src.gui.custom_widgets import VirtualListbox
+
+ThemeApplier = Callable[[dict[str, str]], None]
 
 
 class ThemeManager:
+    """
+    Applies themes to ttk styles, the menubar and a registry of non-ttk widgets.
+
+    ttk widgets follow the shared style automatically, so only classic Tk
+    widgets that need manual colors are registered. Registration happens once
+    when a widget tree is created; a theme change then updates just the
+    registered widgets instead of walking the whole widget tree.
+    """
     def __init__(self, root: Tk) -> None:
         self.root = root
         self.current_theme = "light"
         self.menubar: tk.Menu | None = None
+        self._style: ttk.Style | None = None
+        self._applied_theme: str | None = None
+        # Entries disappear automatically once a destroyed widget is released.
+        # None means the default per-class coloring; custom appliers are held
+        # weakly too so that they never keep their widget alive.
+        self._themed_widgets: weakref.WeakKeyDictionary[tk.Misc, weakref.WeakMethod[ThemeApplier] | None] = weakref.WeakKeyDictionary()
 
     def set_menubar(self, menubar: tk.Menu) -> None:
         self.menubar = menubar
+        if self._applied_theme is not None:
+            self._apply_theme_to_menu(menubar, THEMES[self.current_theme])
 
-    def apply_theme(self, theme_name: str) -> None:
+    def apply_theme(self, theme_name: str, force: bool = False) -> None:
+        """Applies a theme. Does nothing if it is already applied, unless forced."""
         if theme_name not in THEMES:
             print(f"Theme '{theme_name}' not found. Falling back to 'light'.")
             theme_name = "light"
+        if theme_name == self._applied_theme and not force:
+            return
         self.current_theme = theme_name
+        self._applied_theme = theme_name
         theme = THEMES[theme_name]
 
         # 1. Configure ttk styles
-        style = ttk.Style(self.root)
+        if self._style is None:
+            self._style = ttk.Style(self.root)
+        style = self._style
         if theme_name == 'dark':
             style.theme_use('clam')
         else:
@@ -57,8 +83,9 @@ class ThemeManager:
         style.map('Treeview', background=[('selected', theme["select_bg"])], foreground=[('selected', theme["select_fg"])])
         style.configure('Treeview.Heading', background=theme["button_bg"], foreground=theme["button_fg"])
 
-        # 2. Recursively apply theme to non-ttk widgets
-        self.apply_theme_to_widget_tree(self.root, theme)
+        # 2. Apply theme to the registered non-ttk widgets
+        for widget, applier_ref in list(self._themed_widgets.items()):
+            self._apply_to_widget(widget, applier_ref, theme)
 
         # 3. Apply theme to menubar
         if self.menubar:
@@ -90,29 +117,64 @@ class ThemeManager:
             # This can fail on some systems or if the menu is torn off
             pass
 
-    def apply_theme_to_widget_tree(self, widget: tk.Misc, theme: dict[str, Any]) -> None:
-        try:
-            if isinstance(widget, (tk.Tk, tk.Toplevel, tk.Frame, tk.LabelFrame)):
-                 widget.config(bg=theme["bg"])
-            elif isinstance(widget, (tk.Text, tk.Listbox)):
-                widget.config(bg=theme["listbox_bg"], fg=theme["listbox_fg"], selectbackground=theme["select_bg"], selectforeground=theme["select_fg"])
-            elif isinstance(widget, tk.Button):
-                widget.config(bg=theme["button_bg"], fg=theme["button_fg"], activebackground=theme["select_bg"], activeforeground=theme["select_fg"])
-            elif isinstance(widget, (tk.Checkbutton, tk.Radiobutton)):
-                widget.config(bg=theme["button_bg"], fg=theme["button_fg"], activebackground=theme["select_bg"], activeforeground=theme["select_fg"], selectcolor=theme["frame_bg"])
-            elif isinstance(widget, tk.Label):
-                widget.config(bg=theme["bg"], fg=theme["label_fg"])
+    def register_widget(self, widget: tk.Misc, applier: ThemeApplier | None = None) -> None:
+        """
+        Registers a widget whose colors must be set manually and themes it now.
+        A custom applier (a bound method) replaces the default per-class coloring.
+        """
+        if applier is None and not self._is_manually_themed(widget):
+            return
+        self._themed_widgets[widget] = weakref.WeakMethod(applier) if applier is not None else None # type: ignore[arg-type]
+        if self._applied_theme is not None:
+            self._apply_to_widget(widget, self._themed_widgets[widget], THEMES[self.current_theme])
+
+    def register_widget_tree(self, widget: tk.Misc) -> None:
+        """
+        Registers every non-ttk widget in a newly created subtree (a Toplevel or
+        a plugin tab). Widgets that were already registered keep their applier.
+        """
+        if widget not in self._themed_widgets:
+            self.register_widget(widget)
+        for child in widget.winfo_children():
+            self.register_widget_tree(child)
 
-        except (tk.TclError, AttributeError):
+    def _apply_to_widget(self, widget: tk.Misc, applier_ref: weakref.WeakMethod[ThemeApplier] | None, theme: dict[str, str]) -> None:
+        try:
+            if applier_ref is None:
+                self.apply_default_colors(widget, theme)
+            else:
+                applier = applier_ref()
+                if applier is None:
+                    self._themed_widgets.pop(widget, None)
+                else:
+                    applier(theme)
+        except tk.TclError:
+            # The widget has been destroyed but is still referenced somewhere
+            self._themed_widgets.pop(widget, None)
+        except AttributeError:
             pass # Ignore errors for widgets that don't support these properties
 
-        for child in widget.winfo_children():
-            self.apply_theme_to_widget_tree(child, theme)
+    @staticmethod
+    def _is_manually_themed(widget: tk.Misc) -> bool:
+        return isinstance(widget, (tk.Tk, tk.Toplevel, tk.Frame, tk.LabelFrame, tk.Text, tk.Listbox, VirtualListbox, tk.Button, tk.Checkbutton, tk.Radiobutton, tk.Label))
+
+    @staticmethod
+    def apply_default_colors(widget: tk.Misc, theme: dict[str, str]) -> None:
+        """Colors a single classic Tk widget according to its class."""
+        if isinstance(widget, (tk.Tk, tk.Toplevel, tk.Frame, tk.LabelFrame)):
+            widget.config(bg=theme["bg"])
+        elif isinstance(widget, (tk.Text, tk.Listbox, VirtualListbox)):
+            widget.config(bg=theme["listbox_bg"], fg=theme["listbox_fg"], selectbackground=theme["select_bg"], selectforeground=theme["select_fg"])
+        elif isinstance(widget, tk.Button):
+            widget.config(bg=theme["button_bg"], fg=theme["button_fg"], activebackground=theme["select_bg"], activeforeground=theme["select_fg"])
+        elif isinstance(widget, (tk.Checkbutton, tk.Radiobutton)):
+            widget.config(bg=theme["button_bg"], fg=theme["button_fg"], activebackground=theme["select_bg"], activeforeground=theme["select_fg"], selectcolor=theme["frame_bg"])
+        elif isinstance(widget, tk.Label):
+            widget.config(bg=theme["bg"], fg=theme["label_fg"])
 
     def apply_theme_to_toplevel(self, toplevel_window: Toplevel) -> None:
-        """Applies the current theme to a Toplevel window and its children."""
-        theme = THEMES[self.current_theme]
-        self.apply_theme_to_widget_tree(toplevel_window, theme)
+        """Registers a Toplevel window and its children so they follow the theme."""
+        self.register_widget_tree(toplevel_window)
 
     def get_current_theme(self) -> str:
         return self.current_theme
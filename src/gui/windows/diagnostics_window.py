@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+from typing import TYPE_CHECKING, Any
+
+from src.gui.base.base_toplevel_gui import BaseToplevelGUI
+from src.utils.error_handler import log_and_show_error
+
+if TYPE_CHECKING:
+    from src.core.base_application import BaseApplication
+    from src.core.event_dispatcher import EventDispatcher
+
+COLUMNS = ("count", "total_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")
+HEADINGS = {"count": "Count", "total_ms": "Total (ms)", "p50_ms": "p50", "p95_ms": "p95", "p99_ms": "p99", "max_ms": "Max"}
+REFRESH_INTERVAL_MS = 1000
+
+
+class DiagnosticsWindow(BaseToplevelGUI):
+    """
+    Shows the event bus timings: one row per event type (with its current
+    listener count) and its listeners nested below. The table refreshes every
+    second while timing is enabled.
+    """
+    def __init__(self, master: tk.Misc, app_instance: BaseApplication) -> None:
+        super().__init__(master, app_instance)
+        self.title("Event Diagnostics")
+        self.geometry("760x420")
+        self.event_dispatcher: EventDispatcher = self.app.event_dispatcher # type: ignore
+        self.profiling_var = tk.BooleanVar(value=self.event_dispatcher.is_profiling)
+        self._refresh_after_id: str | None = None
+        self._create_widgets()
+        self.refresh()
+        self.bind("<Destroy>", self._on_destroy, add="+")
+
+    def _create_widgets(self) -> None:
+        top_frame = ttk.Frame(self)
+        top_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
+        ttk.Checkbutton(top_frame, text="Record event timings", variable=self.profiling_var, command=self._toggle_profiling).pack(side=tk.LEFT)
+        ttk.Label(top_frame, text="Event rows show time spent on the UI thread; worker listeners are listed separately.").pack(side=tk.LEFT, padx=10)
+
+        tree_frame = ttk.Frame(self)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=10)
+        self.tree = ttk.Treeview(tree_frame, columns=COLUMNS, show="tree headings")
+        self.tree.heading("#0", text="Event / Listener")
+        self.tree.column("#0", width=260)
+        for column in COLUMNS:
+            self.tree.heading(column, text=HEADINGS[column])
+            self.tree.column(column, width=80, anchor=tk.E)
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        button_frame = ttk.Frame(self)
+        button_frame.pack(fill=tk.X, padx=10, pady=10)
+        ttk.Button(button_frame, text="Refresh", command=self.refresh).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Reset", command=self._reset).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Save as JSON...", command=self._save_json).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT)
+
+    def refresh(self) -> None:
+        """Rebuilds the table from the dispatcher's statistics, keeping expanded rows open."""
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+        expanded = {item for item in self.tree.get_children() if self.tree.item(item, "open")}
+        self.tree.delete(*self.tree.get_children())
+
+        report = self.event_dispatcher.latency_report()
+        listeners: dict[str, dict[str, dict[str, Any]]] = report["listeners"]
+        counts: dict[str, int] = report["listener_counts"]
+        event_types = list(report["events"]) + [event_type for event_type in listeners if event_type not in report["events"]]
+        for event_type in event_types:
+            summary = report["events"].get(event_type)
+            values = self._format_row(summary) if summary is not None else ("",) * len(COLUMNS)
+            text = f"{event_type} ({counts.get(event_type, 0)} listeners)"
+            item = self.tree.insert("", tk.END, iid=event_type, text=text, values=values, open=event_type in expanded)
+            for listener_name, listener_summary in listeners.get(event_type, {}).items():
+                self.tree.insert(item, tk.END, text=listener_name, values=self._format_row(listener_summary))
+
+        if self.event_dispatcher.is_profiling:
+            self._refresh_after_id = self.after(REFRESH_INTERVAL_MS, self.refresh)
+
+    @staticmethod
+    def _format_row(summary: dict[str, Any]) -> tuple[str, ...]:
+        return (str(summary["count"]),) + tuple(f"{summary[column]:.2f}" for column in COLUMNS[1:])
+
+    def _toggle_profiling(self) -> None:
+        if self.profiling_var.get():
+            self.event_dispatcher.enable_profiling()
+        else:
+            self.event_dispatcher.disable_profiling()
+        self.refresh()
+
+    def _reset(self) -> None:
+        self.event_dispatcher.reset_profiling()
+        self.refresh()
+
+    def _save_json(self) -> None:
+        filepath: str | None = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            title="Save Event Timings"
+        )
+        if not filepath:
+            return
+        try:
+            self.event_dispatcher.dump_latency_report(filepath)
+            messagebox.showinfo("Saved", f"Event timings saved to {filepath}", parent=self)
+        except OSError as e:
+            log_and_show_error("Save Failed", f"Could not save event timings: {e}")
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        if event.widget == self and self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import copy
 import tkinter as tk
-from tkinter import filedialog, font, messagebox, simpledialog, ttk
+from tkinter import filedialog, messagebox, simpledialog, ttk
+from tkinter import font as tkfont
 from typing import TYPE_CHECKING
 
 from src.core.config import defaults as config
 from src.gui.base.base_toplevel_gui import BaseToplevelGUI
+from src.gui.custom_widgets import SearchableCombobox
+from src.gui.font_registry import get_font_families
 from src.utils.error_handler import log_and_show_error
 
 if TYPE_CHECKING:
@@ -57,6 +60,9 @@ class SettingsWindow(BaseToplevelGUI):
         self.notification_sound_enabled_var = tk.BooleanVar(
             value=self.settings_manager.get_setting("notification_sound_enabled")
         )
+        self.syntax_highlighting_enabled_var = tk.BooleanVar(
+            value=self.settings_manager.get_setting("syntax_highlighting_enabled")
+        )
 
         self.clipboard_content_font_family_var = tk.StringVar(
             value=self.settings_manager.get_setting("clipboard_content_font_family")
@@ -140,6 +146,9 @@ class SettingsWindow(BaseToplevelGUI):
         language_menu = ttk.OptionMenu(appearance_frame, self.language_var, self.language_var.get(), *language_options)
         language_menu.grid(row=1, column=1, sticky=tk.W, padx=config.BUTTON_PADDING_X, pady=config.BUTTON_PADDING_Y)
 
+        syntax_highlighting_check = ttk.Checkbutton(appearance_frame, text="Syntax Highlighting (JSON, SQL, Python, XML, Logs)", variable=self.syntax_highlighting_enabled_var)
+        syntax_highlighting_check.grid(row=2, column=0, columnspan=2, sticky=tk.W, padx=config.BUTTON_PADDING_X, pady=config.BUTTON_PADDING_Y)
+
         window_behavior_frame = ttk.LabelFrame(general_frame, text="Window Behavior", padding=config.FRAME_PADDING)
         window_behavior_frame.pack(fill=tk.X, pady=config.BUTTON_PADDING_Y, padx=config.BUTTON_PADDING_X)
 
@@ -207,9 +216,12 @@ class SettingsWindow(BaseToplevelGUI):
         clipboard_content_font_label = ttk.Label(clipboard_font_frame, text="Clipboard Content Font:")
         clipboard_content_font_label.grid(row=0, column=0, sticky=tk.W, padx=config.BUTTON_PADDING_X, pady=config.BUTTON_PADDING_Y)
 
-        font_families = sorted(font.families())
-        clipboard_content_font_family_menu = ttk.OptionMenu(clipboard_font_frame, self.clipboard_content_font_family_var, self.clipboard_content_font_family_var.get(), *font_families)
-        clipboard_content_font_family_menu.grid(row=0, column=1, sticky=tk.W, padx=config.BUTTON_PADDING_X, pady=config.BUTTON_PADDING_Y)
+        # The family list is enumerated once per process and shared by both comboboxes;
+        # named fonts such as the default "TkDefaultFont" are accepted as well
+        font_families = get_font_families()
+        named_fonts = tkfont.names()
+        self.clipboard_content_font_family_menu = SearchableCombobox(clipboard_font_frame, values=font_families, extra_values=named_fonts, textvariable=self.clipboard_content_font_family_var, width=30)
+        self.clipboard_content_font_family_menu.grid(row=0, column=1, sticky=tk.W, padx=config.BUTTON_PADDING_X, pady=config.BUTTON_PADDING_Y)
 
         clipboard_content_font_size_label = ttk.Label(clipboard_font_frame, text="Size:")
         clipboard_content_font_size_label.grid(row=1, column=0, sticky=tk.W, padx=config.BUTTON_PADDING_X, pady=config.BUTTON_PADDING_Y)
@@ -223,8 +235,8 @@ class SettingsWindow(BaseToplevelGUI):
         history_font_label = ttk.Label(history_font_frame, text="History Font:")
         history_font_label.grid(row=0, column=0, sticky=tk.W, padx=config.BUTTON_PADDING_X, pady=config.BUTTON_PADDING_Y)
 
-        history_font_family_menu = ttk.OptionMenu(history_font_frame, self.history_font_family_var, self.history_font_family_var.get(), *font_families)
-        history_font_family_menu.grid(row=0, column=1, sticky=tk.W, padx=config.BUTTON_PADDING_X, pady=config.BUTTON_PADDING_Y)
+        self.history_font_family_menu = SearchableCombobox(history_font_frame, values=font_families, extra_values=named_fonts, textvariable=self.history_font_family_var, width=30)
+        self.history_font_family_menu.grid(row=0, column=1, sticky=tk.W, padx=config.BUTTON_PADDING_X, pady=config.BUTTON_PADDING_Y)
 
         history_font_size_label = ttk.Label(history_font_frame, text="Size:")
         history_font_size_label.grid(row=1, column=0, sticky=tk.W, padx=config.BUTTON_PADDING_X, pady=config.BUTTON_PADDING_Y)
@@ -284,6 +296,10 @@ class SettingsWindow(BaseToplevelGUI):
         self.settings_manager.set_setting("notification_content_length", self.notification_content_length_var.get())
         self.settings_manager.set_setting("notification_show_app_name", self.notification_show_app_name_var.get())
         self.settings_manager.set_setting("notification_sound_enabled", self.notification_sound_enabled_var.get())
+        self.settings_manager.set_setting("syntax_highlighting_enabled", self.syntax_highlighting_enabled_var.get())
+        # Typed text that is not an installed family is reverted before saving
+        self.clipboard_content_font_family_menu.commit()
+        self.history_font_family_menu.commit()
         self.settings_manager.set_setting("clipboard_content_font_family", self.clipboard_content_font_family_var.get())
         self.settings_manager.set_setting("clipboard_content_font_size", self.clipboard_content_font_size_var.get())
         self.settings_manager.set_setting("history_font_family", self.history_font_family_var.get())
@@ -319,9 +335,11 @@ class SettingsWindow(BaseToplevelGUI):
         self.notification_content_length_var.set(self.settings_manager.get_setting("notification_content_length"))
         self.notification_show_app_name_var.set(self.settings_manager.get_setting("notification_show_app_name"))
         self.notification_sound_enabled_var.set(self.settings_manager.get_setting("notification_sound_enabled"))
-        self.clipboard_content_font_family_var.set(self.settings_manager.get_setting("clipboard_content_font_family"))
+        self.syntax_highlighting_enabled_var.set(self.settings_manager.get_setting("syntax_highlighting_enabled"))
+        # Restored or imported families are kept even if they are not installed here
+        self.clipboard_content_font_family_menu.set_committed(self.settings_manager.get_setting("clipboard_content_font_family"))
         self.clipboard_content_font_size_var.set(self.settings_manager.get_setting("clipboard_content_font_size"))
-        self.history_font_family_var.set(self.settings_manager.get_setting("history_font_family"))
+        self.history_font_family_menu.set_committed(self.settings_manager.get_setting("history_font_family"))
         self.history_font_size_var.set(self.settings_manager.get_setting("history_font_size"))
 
         for tool_name, var in self.tool_tab_vars.items():
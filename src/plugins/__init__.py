@@ -1,18 +1,54 @@
 """
 This package dynamically loads all converter plugins from the current directory.
+
+Plugin modules are imported lazily (PEP 562): importing the package is cheap,
+and a plugin class is only imported when it is first accessed as an attribute
+or when the PluginManager loads the plugins.
 """
-from .base64_converter_plugin import Base64ConverterPlugin
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .base_plugin import Plugin
-from .csv_formatter_plugin import CSVFormatterPlugin
-from .duplicate_line_remover_plugin import DuplicateLineRemoverPlugin
-from .general_case_converter_plugin import GeneralCaseConverterPlugin
-from .html_escape_plugin import HTMLEscapePlugin
-from .json_formatter_plugin import JSONFormatterPlugin
-from .line_sorter_plugin import LineSorterPlugin
-from .table_formatter_plugin import TableFormatterPlugin
-from .uppercase_converter_plugin import UppercaseConverterPlugin
-from .url_converter_plugin import URLConverterPlugin
-from .whitespace_normalizer_plugin import WhitespaceNormalizerPlugin
+
+if TYPE_CHECKING:
+    from .base64_converter_plugin import Base64ConverterPlugin
+    from .csv_formatter_plugin import CSVFormatterPlugin
+    from .duplicate_line_remover_plugin import DuplicateLineRemoverPlugin
+    from .general_case_converter_plugin import GeneralCaseConverterPlugin
+    from .html_escape_plugin import HTMLEscapePlugin
+    from .json_formatter_plugin import JSONFormatterPlugin
+    from .line_sorter_plugin import LineSorterPlugin
+    from .table_formatter_plugin import TableFormatterPlugin
+    from .uppercase_converter_plugin import UppercaseConverterPlugin
+    from .url_converter_plugin import URLConverterPlugin
+    from .whitespace_normalizer_plugin import WhitespaceNormalizerPlugin
+
+# Maps each exported plugin class to the module that defines it.
+_LAZY_EXPORTS: dict[str, str] = {
+    "Base64ConverterPlugin": ".base64_converter_plugin",
+    "CSVFormatterPlugin": ".csv_formatter_plugin",
+    "DuplicateLineRemoverPlugin": ".duplicate_line_remover_plugin",
+    "GeneralCaseConverterPlugin": ".general_case_converter_plugin",
+    "HTMLEscapePlugin": ".html_escape_plugin",
+    "JSONFormatterPlugin": ".json_formatter_plugin",
+    "LineSorterPlugin": ".line_sorter_plugin",
+    "TableFormatterPlugin": ".table_formatter_plugin",
+    "UppercaseConverterPlugin": ".uppercase_converter_plugin",
+    "URLConverterPlugin": ".url_converter_plugin",
+    "WhitespaceNormalizerPlugin": ".whitespace_normalizer_plugin",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is not called again
+    return value
+
 
 # List of all plugin classes to be dynamically loaded by the PluginManager.
 # The PluginManager will instantiate these classes.
@@ -4,6 +4,8 @@ from .base_plugin import Plugin
 
 
 class Base64ConverterPlugin(Plugin):
+    pure = True
+
     @property
     def name(self) -> str:
         return "Base64 Encode/Decode"
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import tkinter as tk
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from tkinter import ttk
 from typing import TYPE_CHECKING
 
@@ -13,6 +15,20 @@ class Plugin(ABC):
     A base class for all plugins.
     Plugins can either process text or provide a GUI component, or both.
     """
+    # True if process() is pure and CPU-bound: large inputs are then processed
+    # in a separate process, so the plugin instance must be picklable.
+    cpu_bound: bool = False
+    # True if process(text) equals "\n".join(process_lines(text.splitlines())):
+    # consecutive line-oriented stages of a pipeline share one split and join.
+    line_oriented: bool = False
+    # True if a line-oriented plugin overrides process_stream() so that it does
+    # not hold the whole input: large inputs and files are then fed line by line.
+    streaming: bool = False
+    # True if process() depends only on its input: results are then cached by
+    # content hash. Bump version whenever the output for a given input changes.
+    pure: bool = False
+    version: int = 1
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -32,6 +48,27 @@ class Plugin(ABC):
         """
         raise NotImplementedError
 
+    def process_lines(self, lines: list[str]) -> list[str]:
+        """
+        Process a list of lines (without line endings); used when line_oriented is True.
+        """
+        raise NotImplementedError
+
+    def process_stream(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Lazily process lines (without line endings), yielding the same lines as
+        process_lines(). The default collects the whole input first.
+        """
+        return iter(self.process_lines(list(lines)))
+
+    def cache_key(self) -> str | None:
+        """
+        Identifies the plugin, its version and its options in the result cache;
+        None if the results must not be cached. Plugins with options that
+        affect process() should include them.
+        """
+        return f"{self.name}@{self.version}" if self.pure else None
+
     def has_gui_component(self) -> bool:
         """
         Returns True if this plugin provides a GUI component.
@@ -39,9 +76,11 @@ class Plugin(ABC):
         """
         return False
 
-    def create_gui_component(self, parent: ttk.Notebook, app_instance: BaseApplication) -> ttk.Frame | None:
+    def create_gui_component(self, parent: tk.Misc, app_instance: BaseApplication) -> ttk.Frame | None:
         """
         Creates and returns the GUI component for this plugin.
         This method should be overridden by plugins that provide a GUI.
+        It is called lazily, the first time the plugin's tab is selected;
+        parent is the (initially empty) tab frame the component is packed into.
         """
         return None
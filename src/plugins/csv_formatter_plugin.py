@@ -5,6 +5,9 @@ from .base_plugin import Plugin
 
 
 class CSVFormatterPlugin(Plugin):
+    cpu_bound = True
+    pure = True
+
     @property
     def name(self) -> str:
         return "CSV/TSV Formatter"
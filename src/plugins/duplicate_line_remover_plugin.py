@@ -1,7 +1,14 @@
+from collections.abc import Iterable, Iterator
+
 from .base_plugin import Plugin
 
 
 class DuplicateLineRemoverPlugin(Plugin):
+    cpu_bound = True
+    line_oriented = True
+    streaming = True
+    pure = True
+
     @property
     def name(self) -> str:
         return "Duplicate Line Remover"
@@ -13,11 +20,16 @@ class DuplicateLineRemoverPlugin(Plugin):
     def process(self, text: str) -> str:
         if not isinstance(text, str):
             return text
+        return '\n'.join(self.process_lines(text.splitlines()))
+
+    def process_lines(self, lines: list[str]) -> list[str]:
+        # dict keeps the first occurrence of each line in order
+        return list(dict.fromkeys(lines))
 
-        seen_lines = set()
-        unique_lines = []
-        for line in text.splitlines():
-            if line not in seen_lines:
-                unique_lines.append(line)
-                seen_lines.add(line)
-        return '\n'.join(unique_lines)
+    def process_stream(self, lines: Iterable[str]) -> Iterator[str]:
+        # Only the unique lines are kept in memory
+        seen: set[str] = set()
+        for line in lines:
+            if line not in seen:
+                seen.add(line)
+                yield line
@@ -18,6 +18,8 @@ def to_kebab_case(name: str) -> str:
     return to_snake_case(name).replace('_', '-')
 
 class GeneralCaseConverterPlugin(Plugin):
+    pure = True
+
     @property
     def name(self) -> str:
         return "Case Converter"
@@ -2,22 +2,299 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import mmap
+import os
+import re
+import threading
 import tkinter as tk
-from tkinter import Event, ttk
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from tkinter import Event, filedialog, messagebox, ttk
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from src.core.config import defaults as config
+from src.core.history_preview import format_size
 from src.gui.base.base_frame_gui import BaseFrameGUI
 from src.plugins.base_plugin import Plugin
+from src.utils.tk_async import BackgroundTask, run_in_background
 
 if TYPE_CHECKING:
     from src.core.base_application import BaseApplication
 
 
+# Algorithms offered as "also compute" checkboxes; the first three are checked by default
+MULTI_ALGORITHMS = ("md5", "sha1", "sha256", "sha512", "blake2b", "sha3_256")
+DEFAULT_SELECTED_ALGORITHMS = ("md5", "sha1", "sha256")
+# Length of the variable-size SHAKE digests, in bytes
+SHAKE_DIGEST_BYTES = 32
+# Delay after the last keystroke before hashing while typing
+DEBOUNCE_MS = 300
+# Chunks at least this large are fed to the hashers in parallel; hashlib
+# releases the GIL for large buffers, so the algorithms really run concurrently
+PARALLEL_MIN_BYTES = 64 * 1024
+DIGEST_CACHE_SIZE = 16
+# Files are hashed in views of this size, so memory use does not depend on the file size
+FILE_CHUNK_BYTES = 8 * 1024 * 1024
+# Number of files hashed concurrently
+FILE_HASH_WORKERS = 4
+PROGRESS_POLL_MS = 100
+# The *sum tools do not name the algorithm; it follows from the digest length
+CHECKSUM_ALGORITHMS_BY_LENGTH = {32: "md5", 40: "sha1", 64: "sha256", 128: "sha512"}
+
+_GNU_CHECKSUM_LINE = re.compile(r"^\\?([0-9a-fA-F]+) [ *](.+)$")
+_BSD_CHECKSUM_LINE = re.compile(r"^([\w-]+) \((.+)\) = ([0-9a-fA-F]+)$")
+
+_hash_executor: ThreadPoolExecutor | None = None
+_hash_executor_lock = threading.Lock()
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    global _hash_executor
+    with _hash_executor_lock:
+        if _hash_executor is None:
+            _hash_executor = ThreadPoolExecutor(max_workers=len(MULTI_ALGORITHMS), thread_name_prefix="hash-calculator")
+        return _hash_executor
+
+
+def _hexdigest(hasher: Any) -> str:
+    digest: str = hasher.hexdigest(SHAKE_DIGEST_BYTES) if hasher.name.startswith("shake_") else hasher.hexdigest()
+    return digest
+
+
+def compute_digests(chunks: Iterable[bytes | memoryview], algorithms: Iterable[str], is_cancelled: Callable[[], bool] | None = None) -> dict[str, str] | None:
+    """
+    Hashes the data with several algorithms in a single pass over the chunks.
+    Unknown algorithms map to an "Error: ..." string. Returns None if cancelled.
+    """
+    digests: dict[str, str] = {}
+    hashers: dict[str, Any] = {}
+    for algorithm in algorithms:
+        try:
+            hashers[algorithm] = hashlib.new(algorithm)
+        except ValueError as e:
+            digests[algorithm] = f"Error: {e}"
+
+    for chunk in chunks:
+        if is_cancelled is not None and is_cancelled():
+            return None
+        if len(hashers) > 1 and len(chunk) >= PARALLEL_MIN_BYTES:
+            # Each hasher reads the same buffer; list() waits for all of them
+            list(_get_hash_executor().map(lambda hasher, data=chunk: hasher.update(data), hashers.values()))
+        else:
+            for hasher in hashers.values():
+                hasher.update(chunk)
+
+    for algorithm, hasher in hashers.items():
+        digests[algorithm] = _hexdigest(hasher)
+    return digests
+
+
+class DigestCache:
+    """A small thread-safe LRU of {algorithm: digest} per content key."""
+    def __init__(self, size: int = DIGEST_CACHE_SIZE) -> None:
+        self.size = size
+        self._entries: OrderedDict[str, dict[str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict[str, str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return {}
+            self._entries.move_to_end(key)
+            return dict(entry)
+
+    def update(self, key: str, digests: dict[str, str]) -> None:
+        with self._lock:
+            self._entries.setdefault(key, {}).update(digests)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+
+def content_key(data: bytes) -> str:
+    """A cheap key identifying the hashed data in the digest cache."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def hash_text(text: str, algorithms: list[str], cache: DigestCache, is_cancelled: Callable[[], bool] | None = None) -> tuple[str, dict[str, str]] | None:
+    """
+    Returns (content key, digests) for text, computing only the algorithms
+    that are not cached for this content yet. Runs on a worker thread.
+    """
+    data = text.encode("utf-8")
+    key = content_key(data)
+    digests = cache.get(key)
+    missing = [algorithm for algorithm in algorithms if algorithm not in digests]
+    if missing:
+        computed = compute_digests((data,), missing, is_cancelled)
+        if computed is None:
+            return None
+        cache.update(key, computed)
+        digests.update(computed)
+    return key, digests
+
+
+def iter_file_chunks(path: str, chunk_size: int = FILE_CHUNK_BYTES) -> Iterator[bytes | memoryview]:
+    """
+    Yields the content of a file in chunks without loading it into memory.
+    The file is memory-mapped, so the OS pages it in on demand; files that
+    cannot be mapped (empty or special files) are read in chunks instead.
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            while chunk := f.read(chunk_size):
+                yield chunk
+            return
+        with mapped, memoryview(mapped) as view:
+            for start in range(0, len(mapped), chunk_size):
+                # Released right after use so the map can be closed
+                with view[start:start + chunk_size] as chunk_view:
+                    yield chunk_view
+
+
+def collect_files(paths: Iterable[str], is_cancelled: Callable[[], bool] | None = None) -> list[tuple[str, int]] | None:
+    """
+    Expands directories recursively and returns (path, size) for every file.
+    Returns None if cancelled.
+    """
+    files: list[tuple[str, int]] = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                if is_cancelled is not None and is_cancelled():
+                    return None
+                dirs.sort()
+                files.extend(_with_size(os.path.join(root, name)) for name in sorted(names))
+        else:
+            files.append(_with_size(path))
+    return files
+
+
+def _with_size(path: str) -> tuple[str, int]:
+    try:
+        return path, os.path.getsize(path)
+    except OSError:
+        return path, 0  # The error is reported when the file is hashed
+
+
+class ChecksumEntry(NamedTuple):
+    """An expected digest from a checksum list."""
+    name: str
+    algorithm: str
+    digest: str
+
+
+def parse_checksum_list(text: str) -> list[ChecksumEntry]:
+    """
+    Parses checksum lists as written by sha256sum and friends ("<digest>  <file>")
+    and the BSD style ("SHA256 (<file>) = <digest>"). Other lines are ignored.
+    """
+    entries: list[ChecksumEntry] = []
+    for line in text.splitlines():
+        line = line.strip()
+        if match := _BSD_CHECKSUM_LINE.match(line):
+            algorithm = match.group(1).lower().replace("-", "_")
+            if algorithm.startswith("sha_"):
+                algorithm = algorithm.replace("_", "", 1)
+            entries.append(ChecksumEntry(match.group(2), algorithm, match.group(3).lower()))
+        elif (match := _GNU_CHECKSUM_LINE.match(line)) and len(match.group(1)) in CHECKSUM_ALGORITHMS_BY_LENGTH:
+            entries.append(ChecksumEntry(match.group(2), CHECKSUM_ALGORITHMS_BY_LENGTH[len(match.group(1))], match.group(1).lower()))
+    return entries
+
+
+def find_checksum_entry(path: str, entries: list[ChecksumEntry]) -> ChecksumEntry | None:
+    """Finds the entry for a file; names are matched against the end of the path."""
+    normalized_path = path.replace(os.sep, "/")
+    for entry in entries:
+        name = entry.name.replace("\\", "/").removeprefix("./")
+        if normalized_path == name or normalized_path.endswith("/" + name):
+            return entry
+    return None
+
+
+class FileHashResult(NamedTuple):
+    path: str
+    size: int
+    digests: dict[str, str]
+    error: str | None = None
+
+
+class FileHashJob:
+    """
+    Hashes files concurrently on its own worker pool.
+
+    Progress counters are updated by the workers and read from the Tk thread;
+    cancel() stops the running files at the next chunk and drops the queued ones.
+    """
+    def __init__(self, files: list[tuple[str, int]], algorithms: list[str], workers: int = FILE_HASH_WORKERS) -> None:
+        self.files = files
+        self.algorithms = algorithms
+        self.total_bytes = sum(size for _, size in files)
+        self._done_bytes = 0
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="file-hash")
+        self.futures: list[Future[FileHashResult]] = [self._executor.submit(self._hash_file, path, size) for path, size in files]
+        self._executor.shutdown(wait=False)
+
+    @property
+    def done_bytes(self) -> int:
+        with self._lock:
+            return self._done_bytes
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def is_done(self) -> bool:
+        return all(future.done() for future in self.futures)
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        for future in self.futures:
+            future.cancel()
+
+    def result(self, index: int) -> FileHashResult:
+        """The result of a finished file; cancelled files get an error result."""
+        path, size = self.files[index]
+        try:
+            return self.futures[index].result(timeout=0)
+        except CancelledError:
+            return FileHashResult(path, size, {}, "Cancelled")
+        except Exception as e:
+            return FileHashResult(path, size, {}, f"Error: {e}")
+
+    def _hash_file(self, path: str, size: int) -> FileHashResult:
+        if self.is_cancelled():
+            return FileHashResult(path, size, {}, "Cancelled")
+        try:
+            digests = compute_digests(self._counted(iter_file_chunks(path)), self.algorithms, self.is_cancelled)
+        except OSError as e:
+            return FileHashResult(path, size, {}, str(e))
+        if digests is None:
+            return FileHashResult(path, size, {}, "Cancelled")
+        return FileHashResult(path, size, digests)
+
+    def _counted(self, chunks: Iterator[bytes | memoryview]) -> Iterator[bytes | memoryview]:
+        for chunk in chunks:
+            yield chunk
+            with self._lock:
+                self._done_bytes += len(chunk)
+
+
 # The GUI Component implementation, moved from gui/components
 class HashCalculatorComponent(BaseFrameGUI):
     """
     A GUI component for calculating hash values of text.
+
+    Hashing runs on a worker thread, debounced while typing. The selected
+    algorithms are computed together and all digests are shown at once;
+    digests are cached per content, so switching the algorithm is instant.
+    The Files tab streams files and whole folders through a FileHashJob and
+    can verify them against a pasted checksum list.
     """
     def __init__(self, master: tk.Misc, app_instance: BaseApplication) -> None:
         super().__init__(master, app_instance)
@@ -26,64 +303,337 @@ class HashCalculatorComponent(BaseFrameGUI):
 
         self.hash_algorithms = sorted(hashlib.algorithms_available)
         self.algorithm_var = tk.StringVar(value='sha256')
+        self.live_var = tk.BooleanVar(value=True)
+        self.selected_algorithm_vars: dict[str, tk.BooleanVar] = {
+            algorithm: tk.BooleanVar(value=algorithm in DEFAULT_SELECTED_ALGORITHMS) for algorithm in MULTI_ALGORITHMS
+        }
+        self.digest_cache = DigestCache()
+        # Key of the text the current digests belong to; None once the text changed
+        self._content_key: str | None = None
+        self._debounce_after_id: str | None = None
+        self._task: BackgroundTask[tuple[str, dict[str, str]] | None] | None = None
+
+        # Files tab state; rows are keyed by path
+        self.file_sizes: dict[str, int] = {}
+        self.file_results: dict[str, FileHashResult] = {}
+        self._collect_task: BackgroundTask[list[tuple[str, int]] | None] | None = None
+        self._file_job: FileHashJob | None = None
+        self._reported_files: set[int] = set()
+        self._progress_after_id: str | None = None
+        self.file_status_var = tk.StringVar(value="Add files or a folder to hash.")
 
         self._create_widgets()
+        self.bind("<Destroy>", self._on_destroy, add="+")
 
     def _create_widgets(self) -> None:
+        # Algorithm selection, shared by both modes
+        algorithm_frame = ttk.Frame(self)
+        algorithm_frame.pack(fill=tk.X, padx=5, pady=5)
+
+        ttk.Label(algorithm_frame, text="Algorithm:").pack(side=tk.LEFT, padx=(0, 5))
+        algorithm_combo = ttk.Combobox(algorithm_frame, textvariable=self.algorithm_var, values=self.hash_algorithms, width=15)
+        algorithm_combo.pack(side=tk.LEFT)
+        algorithm_combo.bind("<<ComboboxSelected>>", self._calculate_hash)
+
+        algorithms_frame = ttk.LabelFrame(self, text="Also Compute")
+        algorithms_frame.pack(fill=tk.X, padx=5, pady=5)
+        for algorithm, var in self.selected_algorithm_vars.items():
+            check = ttk.Checkbutton(algorithms_frame, text=algorithm, variable=var, command=self._calculate_hash)
+            check.pack(side=tk.LEFT, padx=5)
+
+        notebook = ttk.Notebook(self)
+        notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        text_tab = ttk.Frame(notebook)
+        files_tab = ttk.Frame(notebook)
+        notebook.add(text_tab, text="Text")
+        notebook.add(files_tab, text="Files")
+        self._create_text_widgets(text_tab)
+        self._create_file_widgets(files_tab)
+
+    def _create_text_widgets(self, parent: ttk.Frame) -> None:
         # Input frame
-        input_frame = ttk.LabelFrame(self, text="Input Text")
+        input_frame = ttk.LabelFrame(parent, text="Input Text")
         input_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         self.input_text = tk.Text(input_frame, wrap=tk.WORD, height=10)
         self.input_text.pack(fill=tk.BOTH, expand=True)
 
         # Control frame
-        control_frame = ttk.Frame(self)
+        control_frame = ttk.Frame(parent)
         control_frame.pack(fill=tk.X, padx=5, pady=5)
 
-        ttk.Label(control_frame, text="Algorithm:").pack(side=tk.LEFT, padx=(0, 5))
-        algorithm_combo = ttk.Combobox(control_frame, textvariable=self.algorithm_var, values=self.hash_algorithms, width=15)
-        algorithm_combo.pack(side=tk.LEFT)
-        algorithm_combo.bind("<<ComboboxSelected>>", self._calculate_hash)
-
         calculate_button = ttk.Button(control_frame, text="Calculate", command=self._calculate_hash)
-        calculate_button.pack(side=tk.LEFT, padx=5)
+        calculate_button.pack(side=tk.LEFT)
 
-        self.input_text.bind("<KeyRelease>", self._on_text_change)
+        live_check = ttk.Checkbutton(control_frame, text="Calculate while typing", variable=self.live_var)
+        live_check.pack(side=tk.LEFT, padx=5)
 
+        self.input_text.bind("<KeyRelease>", self._on_text_change)
 
         # Output frame
-        output_frame = ttk.LabelFrame(self, text="Hash Output")
+        output_frame = ttk.LabelFrame(parent, text="Hash Output")
         output_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         self.output_text = tk.Text(output_frame, wrap=tk.WORD, height=5, state=tk.DISABLED)
         self.output_text.pack(fill=tk.BOTH, expand=True)
 
+    def _create_file_widgets(self, parent: ttk.Frame) -> None:
+        button_frame = ttk.Frame(parent)
+        button_frame.pack(fill=tk.X, padx=5, pady=5)
+        ttk.Button(button_frame, text="Add Files...", command=self._add_files).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Add Folder...", command=self._add_folder).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Clear", command=self._clear_files).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Copy Results", command=self._copy_file_results).pack(side=tk.RIGHT)
+        self.cancel_files_button = ttk.Button(button_frame, text="Cancel", command=self._cancel_file_hashing, state=tk.DISABLED)
+        self.cancel_files_button.pack(side=tk.RIGHT, padx=5)
+        self.hash_files_button = ttk.Button(button_frame, text="Hash", command=self._start_file_hashing)
+        self.hash_files_button.pack(side=tk.RIGHT)
+
+        tree_frame = ttk.Frame(parent)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=5)
+        self.file_tree = ttk.Treeview(tree_frame, show="headings", height=6)
+        file_tree_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.file_tree.yview)
+        self.file_tree.config(yscrollcommand=file_tree_scrollbar.set)
+        self.file_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        file_tree_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._set_file_columns([])
+
+        self.file_progress = ttk.Progressbar(parent, mode="determinate", maximum=1000)
+        self.file_progress.pack(fill=tk.X, padx=5, pady=(5, 0))
+        ttk.Label(parent, textvariable=self.file_status_var).pack(fill=tk.X, padx=5)
+
+        checksum_frame = ttk.LabelFrame(parent, text="Expected Checksums (sha256sum format)")
+        checksum_frame.pack(fill=tk.X, padx=5, pady=5)
+        self.checksum_text = tk.Text(checksum_frame, wrap=tk.NONE, height=3)
+        self.checksum_text.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Button(checksum_frame, text="Verify", command=self._verify_files).pack(side=tk.RIGHT, padx=5)
+
+    def _set_file_columns(self, algorithms: list[str]) -> None:
+        columns = ("file", "size", *algorithms, "status")
+        self.file_tree.config(columns=columns)
+        self.file_tree.heading("file", text="File")
+        self.file_tree.column("file", width=200)
+        self.file_tree.heading("size", text="Size")
+        self.file_tree.column("size", width=70, anchor=tk.E, stretch=False)
+        for algorithm in algorithms:
+            self.file_tree.heading(algorithm, text=algorithm)
+            self.file_tree.column(algorithm, width=150)
+        self.file_tree.heading("status", text="Status")
+        self.file_tree.column("status", width=80, stretch=False)
+
+    def _add_files(self) -> None:
+        paths = filedialog.askopenfilenames(parent=self, title="Select files to hash")
+        if paths:
+            self._collect(list(paths))
+
+    def _add_folder(self) -> None:
+        path = filedialog.askdirectory(parent=self, title="Select a folder to hash")
+        if path:
+            self._collect([path])
+
+    def _collect(self, paths: list[str]) -> None:
+        """Lists the files of the chosen paths on a worker; folders can be large."""
+        self.file_status_var.set("Collecting files...")
+        self._collect_task = run_in_background(self, collect_files, paths, on_done=self._on_files_collected, pass_cancel_check=True)
+
+    def _on_files_collected(self, files: list[tuple[str, int]] | None) -> None:
+        self._collect_task = None
+        if files is None:
+            return
+        algorithms = self._file_columns()
+        for path, size in files:
+            if path in self.file_sizes:
+                continue
+            self.file_sizes[path] = size
+            self.file_tree.insert("", tk.END, iid=path, values=(path, format_size(size), *("" for _ in algorithms), "Pending"))
+        self.file_status_var.set(f"{len(self.file_sizes)} file(s), {format_size(sum(self.file_sizes.values()))}")
+
+    def _file_columns(self) -> list[str]:
+        return [column for column in self.file_tree.cget("columns") if column not in ("file", "size", "status")]
+
+    def _clear_files(self) -> None:
+        self._cancel_file_hashing()
+        self.file_sizes.clear()
+        self.file_results.clear()
+        self.file_tree.delete(*self.file_tree.get_children())
+        self.file_progress.config(value=0)
+        self.file_status_var.set("Add files or a folder to hash.")
+
+    def _start_file_hashing(self) -> None:
+        if not self.file_sizes or self._file_job is not None:
+            return
+        algorithms = self._selected_algorithms()
+        # Also compute whatever the checksum list needs for verification
+        for entry in parse_checksum_list(self.checksum_text.get("1.0", "end-1c")):
+            if entry.algorithm not in algorithms:
+                algorithms.append(entry.algorithm)
+        if not algorithms:
+            return
+        self._set_file_columns(algorithms)
+        self.file_results.clear()
+        for path, size in self.file_sizes.items():
+            self.file_tree.item(path, values=(path, format_size(size), *("" for _ in algorithms), "Queued"))
+        self._file_job = FileHashJob(list(self.file_sizes.items()), algorithms)
+        self._reported_files = set()
+        self.hash_files_button.config(state=tk.DISABLED)
+        self.cancel_files_button.config(state=tk.NORMAL)
+        self._poll_file_job()
+
+    def _poll_file_job(self) -> None:
+        self._progress_after_id = None
+        job = self._file_job
+        if job is None:
+            return
+        for index, future in enumerate(job.futures):
+            if index not in self._reported_files and future.done():
+                self._reported_files.add(index)
+                self._show_file_result(job.result(index), job.algorithms)
+        total = job.total_bytes or 1
+        self.file_progress.config(value=1000 * job.done_bytes / total)
+        self.file_status_var.set(f"Hashed {len(self._reported_files)}/{len(job.files)} file(s), {format_size(job.done_bytes)} of {format_size(job.total_bytes)}")
+        if job.is_done():
+            self._finish_file_job()
+        else:
+            self._progress_after_id = self.after(PROGRESS_POLL_MS, self._poll_file_job)
+
+    def _show_file_result(self, result: FileHashResult, algorithms: list[str]) -> None:
+        if not self.file_tree.exists(result.path):
+            return  # The list was cleared while hashing
+        self.file_results[result.path] = result
+        status = result.error or "Done"
+        values = (result.path, format_size(result.size), *(result.digests.get(algorithm, "") for algorithm in algorithms), status)
+        self.file_tree.item(result.path, values=values)
+
+    def _finish_file_job(self) -> None:
+        cancelled = self._file_job is not None and self._file_job.is_cancelled()
+        self._file_job = None
+        self.hash_files_button.config(state=tk.NORMAL)
+        self.cancel_files_button.config(state=tk.DISABLED)
+        if cancelled:
+            self.file_status_var.set("Cancelled.")
+        elif self.checksum_text.get("1.0", "end-1c").strip():
+            self._verify_files()
+        else:
+            self.file_status_var.set(f"Hashed {len(self.file_results)} file(s).")
+
+    def _cancel_file_hashing(self) -> None:
+        if self._collect_task is not None:
+            self._collect_task.cancel()
+            self._collect_task = None
+        if self._file_job is None:
+            return
+        self._file_job.cancel()
+        # Let the poll pick up the cancelled files and finish the job
+        if self._progress_after_id is not None:
+            self.after_cancel(self._progress_after_id)
+        self._poll_file_job()
+
+    def _verify_files(self) -> None:
+        entries = parse_checksum_list(self.checksum_text.get("1.0", "end-1c"))
+        if not entries:
+            self.file_status_var.set("No checksums found in the list.")
+            return
+        counts = {"OK": 0, "FAILED": 0, "Not listed": 0}
+        for path, result in self.file_results.items():
+            if result.error:
+                continue
+            entry = find_checksum_entry(path, entries)
+            if entry is None:
+                status = "Not listed"
+            elif entry.algorithm not in result.digests:
+                status = f"Needs {entry.algorithm}"
+                counts.setdefault(status, 0)
+            else:
+                status = "OK" if result.digests[entry.algorithm] == entry.digest else "FAILED"
+            counts[status] += 1
+            self.file_tree.set(path, "status", status)
+        self.file_status_var.set(", ".join(f"{count} {status}" for status, count in counts.items() if count))
+
+    def _copy_file_results(self) -> None:
+        algorithms = self._file_columns()
+        lines = ["\t".join(("File", "Size", *algorithms, "Status"))]
+        for path in self.file_tree.get_children():
+            lines.append("\t".join(str(value) for value in self.file_tree.item(path, "values")))
+        if len(lines) == 1:
+            self.logger.info("Nothing to copy.")
+            return
+        try:
+            self.clipboard_clear()
+            self.clipboard_append("\n".join(lines))
+            self.logger.info("Copied hash results to clipboard.")
+        except tk.TclError:
+            self.logger.error("Failed to copy hash results to clipboard.")
+            messagebox.showerror("Error", "クリップボードへのコピーに失敗しました。", parent=self)
+
+    def _selected_algorithms(self) -> list[str]:
+        """The combobox algorithm first, then the checked ones."""
+        algorithms = [self.algorithm_var.get()] if self.algorithm_var.get() else []
+        algorithms.extend(algorithm for algorithm, var in self.selected_algorithm_vars.items() if var.get() and algorithm not in algorithms)
+        return algorithms
+
     def _on_text_change(self, event: Event | None = None) -> None:
-        self._calculate_hash()
+        self._content_key = None
+        if self._debounce_after_id is not None:
+            self.after_cancel(self._debounce_after_id)
+            self._debounce_after_id = None
+        if self.live_var.get():
+            self._debounce_after_id = self.after(DEBOUNCE_MS, self._calculate_hash)
 
     def _calculate_hash(self, event: Event | None = None) -> None:
-        input_data = self.input_text.get("1.0", "end-1c").encode('utf-8')
-        algorithm = self.algorithm_var.get()
+        self._debounce_after_id = None
+        algorithms = self._selected_algorithms()
+        if not algorithms:
+            return
+
+        # Same text as last time: switching algorithms is served from the cache
+        if self._content_key is not None:
+            digests = self.digest_cache.get(self._content_key)
+            if all(algorithm in digests for algorithm in algorithms):
+                self._show_digests(algorithms, digests)
+                return
 
-        if not algorithm:
+        if self._task is not None:
+            self._task.cancel()
+        text = self.input_text.get("1.0", "end-1c")
+        self._task = run_in_background(self, hash_text, text, algorithms, self.digest_cache, on_done=lambda result: self._on_hashed(algorithms, result), on_error=self._on_hash_error, pass_cancel_check=True)
+
+    def _on_hashed(self, algorithms: list[str], result: tuple[str, dict[str, str]] | None) -> None:
+        self._task = None
+        if result is None:
             return
+        self._content_key, digests = result
+        self._show_digests(algorithms, digests)
 
-        try:
-            hasher = hashlib.new(algorithm)
-            hasher.update(input_data)
-            hash_result = hasher.hexdigest()
-
-            self.output_text.config(state=tk.NORMAL)
-            self.output_text.delete("1.0", tk.END)
-            self.output_text.insert("1.0", hash_result)
-            self.output_text.config(state=tk.DISABLED)
-        except ValueError as e:
-            self.logger.error(f"Error calculating hash: {e}")
-            self.output_text.config(state=tk.NORMAL)
-            self.output_text.delete("1.0", tk.END)
-            self.output_text.insert("1.0", f"Error: {e}")
-            self.output_text.config(state=tk.DISABLED)
+    def _on_hash_error(self, error: BaseException) -> None:
+        self._task = None
+        self.logger.error(f"Error calculating hash: {error}")
+        self._set_output(f"Error: {error}")
+
+    def _show_digests(self, algorithms: list[str], digests: dict[str, str]) -> None:
+        if len(algorithms) == 1:
+            self._set_output(digests[algorithms[0]])
+        else:
+            self._set_output("\n".join(f"{algorithm}: {digests[algorithm]}" for algorithm in algorithms))
+
+    def _set_output(self, text: str) -> None:
+        self.output_text.config(state=tk.NORMAL)
+        self.output_text.delete("1.0", tk.END)
+        self.output_text.insert("1.0", text)
+        self.output_text.config(state=tk.DISABLED)
+
+    def _on_destroy(self, event: Event) -> None:
+        if event.widget != self:
+            return
+        if self._task is not None:
+            self._task.cancel()
+        if self._collect_task is not None:
+            self._collect_task.cancel()
+        if self._file_job is not None:
+            self._file_job.cancel()
+        if self._progress_after_id is not None:
+            self.after_cancel(self._progress_after_id)
+        if self._debounce_after_id is not None:
+            self.after_cancel(self._debounce_after_id)
 
 
 # The Plugin definition
@@ -102,7 +652,7 @@ class HashCalculatorPlugin(Plugin):
     def has_gui_component(self) -> bool:
         return True
 
-    def create_gui_component(self, parent: ttk.Notebook, app_instance: BaseApplication) -> ttk.Frame | None:
+    def create_gui_component(self, parent: tk.Misc, app_instance: BaseApplication) -> ttk.Frame | None:
         # Create a container frame with padding, similar to the original implementation
         tool_frame = ttk.Frame(parent, padding=config.FRAME_PADDING)
 
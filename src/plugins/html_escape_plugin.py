@@ -4,6 +4,8 @@ from .base_plugin import Plugin
 
 
 class HTMLEscapePlugin(Plugin):
+    pure = True
+
     @property
     def name(self) -> str:
         return "HTML Escape/Unescape"
@@ -4,6 +4,9 @@ from .base_plugin import Plugin
 
 
 class JSONFormatterPlugin(Plugin):
+    cpu_bound = True
+    pure = True
+
     @property
     def name(self) -> str:
         return "JSON Formatter"
@@ -1,7 +1,21 @@
+import heapq
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import IO
+
 from .base_plugin import Plugin
 
+# Runs of this many characters are sorted in memory and spilled to disk; the
+# sorted runs are then merged, so larger inputs are never held all at once.
+SORT_RUN_CHARS = 16_000_000
+
 
 class LineSorterPlugin(Plugin):
+    cpu_bound = True
+    line_oriented = True
+    streaming = True
+    pure = True
+
     @property
     def name(self) -> str:
         return "Line Sorter"
@@ -13,7 +27,44 @@ class LineSorterPlugin(Plugin):
     def process(self, text: str) -> str:
         if not isinstance(text, str):
             return text
+        return '\n'.join(self.process_lines(text.splitlines()))
+
+    def process_lines(self, lines: list[str]) -> list[str]:
+        return sorted(lines)
+
+    def process_stream(self, lines: Iterable[str]) -> Iterator[str]:
+        run: list[str] = []
+        run_chars = 0
+        spills: list[IO[str]] = []
+        try:
+            for line in lines:
+                run.append(line)
+                run_chars += len(line) + 1
+                if run_chars >= SORT_RUN_CHARS:
+                    run.sort()
+                    spills.append(_spill(run))
+                    run, run_chars = [], 0
+            run.sort()
+            if not spills:
+                yield from run
+                return
+            spills.append(_spill(run))
+            run = []
+            # heapq.merge is stable across runs, so the result equals sorted()
+            yield from heapq.merge(*(_read_spill(spill) for spill in spills))
+        finally:
+            for spill in spills:
+                spill.close()
+
+
+def _spill(lines: list[str]) -> IO[str]:
+    """Writes sorted lines to an anonymous temporary file, rewound for reading."""
+    spill = tempfile.TemporaryFile("w+", encoding="utf-8", errors="surrogatepass", newline="\n")
+    spill.writelines(line + "\n" for line in lines)
+    spill.seek(0)
+    return spill
+
 
-        lines = text.splitlines()
-        lines.sort()
-        return '\n'.join(lines)
+def _read_spill(spill: IO[str]) -> Iterator[str]:
+    # Lines from splitlines() contain no "\n", so each record is one line
+    return (line[:-1] for line in spill)
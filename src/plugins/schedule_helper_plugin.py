@@ -3,7 +3,7 @@ from __future__ import annotations
 import calendar
 import logging
 import tkinter as tk
-from datetime import datetime
+from datetime import date, datetime
 from tkinter import Event, messagebox, ttk
 from typing import TYPE_CHECKING, Any
 
@@ -27,7 +27,8 @@ class ScheduleHelperComponent(BaseFrameGUI):
         self.today = datetime.now()
         self.current_year = self.today.year
         self.current_month = self.today.month
-        self.selected_dates: list[datetime] = []
+        # Keyed by calendar date so membership checks are O(1); values carry the chosen time
+        self.selected_dates: dict[date, datetime] = {}
 
         self.hour_var = tk.StringVar(value=f"{self.today.hour:02d}")
         self.minute_var = tk.StringVar(value="00")
@@ -48,7 +49,7 @@ class ScheduleHelperComponent(BaseFrameGUI):
         self._create_widgets()
 
         # Subscribe to language changes and apply initial settings
-        self.app.event_dispatcher.subscribe("LANGUAGE_CHANGED", self._apply_locale_settings) # type: ignore
+        self.app.event_dispatcher.subscribe("LANGUAGE_CHANGED", self._apply_locale_settings, weak=True) # type: ignore
         self._apply_locale_settings()
 
         # Unsubscribe when the widget is destroyed to prevent errors.
@@ -81,7 +82,10 @@ class ScheduleHelperComponent(BaseFrameGUI):
         first_day = day_map.get(first_day_str.lower(), calendar.MONDAY)
         calendar.setfirstweekday(first_day)
 
-        # Redraw the calendar and update the text widget to reflect changes
+        # Relabel the weekday header, then redraw the calendar and the text widget
+        days: list[str] = self.app.translator("days_short") # type: ignore
+        for label, day_name in zip(self.day_header_labels, days, strict=False):
+            label.config(text=day_name)
         self._update_calendar()
         self._update_text_widget()
 
@@ -106,6 +110,7 @@ class ScheduleHelperComponent(BaseFrameGUI):
 
         self.calendar_frame = ttk.Frame(calendar_part_frame)
         self.calendar_frame.pack(pady=5)
+        self._create_calendar_grid()
 
         time_format_frame = ttk.Frame(controls_frame)
         time_format_frame.pack(fill=tk.X, pady=10)
@@ -146,31 +151,69 @@ class ScheduleHelperComponent(BaseFrameGUI):
 
         self.logger.info("ScheduleHelperComponent widgets created.")
 
-    def _update_calendar(self) -> None:
-        for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
+    def _create_calendar_grid(self) -> None:
+        """
+        Creates the weekday header and a fixed 7x6 grid of day buttons once.
+        Navigation and selection only relabel and restyle these widgets.
+        """
+        self.day_header_labels: list[ttk.Label] = []
+        for c in range(7):
+            label = ttk.Label(self.calendar_frame, text="", width=5, anchor="center")
+            label.grid(row=0, column=c, padx=2, pady=2)
+            self.day_header_labels.append(label)
+
+        self.day_buttons: list[list[ttk.Button]] = []
+        # The (day, style) currently shown by each button; day 0 means the cell is hidden
+        self._day_button_states: list[list[tuple[int, str]]] = []
+        for r in range(6):
+            row_buttons: list[ttk.Button] = []
+            for c in range(7):
+                btn = ttk.Button(self.calendar_frame, text="", width=4, command=lambda r=r, c=c: self._on_day_button(r, c)) # type: ignore
+                btn.grid(row=r + 1, column=c, padx=1, pady=1)
+                btn.grid_remove()
+                row_buttons.append(btn)
+            self.day_buttons.append(row_buttons)
+            self._day_button_states.append([(0, "TButton")] * 7)
 
+    def _update_calendar(self) -> None:
         self.month_year_label.config(text=f"{self.current_year} / {self.current_month:02d}")
 
-        days: list[str] = self.app.translator("days_short") # type: ignore
-        for i, day in enumerate(days):
-            ttk.Label(self.calendar_frame, text=day, width=5, anchor="center").grid(row=0, column=i, padx=2, pady=2)
-
+        is_current_month = self.current_year == self.today.year and self.current_month == self.today.month
         month_calendar = calendar.monthcalendar(self.current_year, self.current_month)
-        for r, week in enumerate(month_calendar, 1):
-            for c, day in enumerate(week): # type: ignore
+        for r in range(6):
+            week = month_calendar[r] if r < len(month_calendar) else [0] * 7
+            for c, day in enumerate(week):
                 if day == 0:
-                    continue
-
-                btn = ttk.Button(self.calendar_frame, text=str(day), width=4, command=lambda d=day: self._select_date(d)) # type: ignore
-                btn.grid(row=r, column=c, padx=1, pady=1)
-
-                if self.current_year == self.today.year and self.current_month == self.today.month and day == self.today.day:
-                    btn.configure(style="Today.TButton")
+                    style = "TButton"
+                elif date(self.current_year, self.current_month, day) in self.selected_dates:
+                    style = "Selected.TButton"
+                elif is_current_month and day == self.today.day:
+                    style = "Today.TButton"
+                else:
+                    style = "TButton"
+                self._set_day_button(r, c, day, style)
 
-                is_selected = any(d.year == self.current_year and d.month == self.current_month and d.day == day for d in self.selected_dates)
-                if is_selected:
-                    btn.configure(style="Selected.TButton")
+    def _set_day_button(self, row: int, column: int, day: int, style: str) -> None:
+        """Updates one grid cell, touching the widget only if its state changed."""
+        old_day, old_style = self._day_button_states[row][column]
+        if (old_day, old_style) == (day, style):
+            return
+        btn = self.day_buttons[row][column]
+        if day == 0:
+            btn.grid_remove()
+        else:
+            if old_day != day:
+                btn.configure(text=str(day))
+            if old_style != style:
+                btn.configure(style=style)
+            if old_day == 0:
+                btn.grid()
+        self._day_button_states[row][column] = (day, style)
+
+    def _on_day_button(self, row: int, column: int) -> None:
+        day = self._day_button_states[row][column][0]
+        if day:
+            self._select_date(day)
 
     def _go_to_today(self) -> None:
         self.current_year = self.today.year
@@ -199,21 +242,12 @@ class ScheduleHelperComponent(BaseFrameGUI):
         except ValueError:
             hour, minute = self.today.hour, self.today.minute
 
-        new_date_for_check = datetime(self.current_year, self.current_month, day)
-
-        found_date: datetime | None = None
-        for d in self.selected_dates:
-            if d.year == new_date_for_check.year and d.month == new_date_for_check.month and d.day == new_date_for_check.day:
-                found_date = d
-                break
-
-        if found_date:
-            self.selected_dates.remove(found_date)
+        selected_day = date(self.current_year, self.current_month, day)
+        if selected_day in self.selected_dates:
+            del self.selected_dates[selected_day]
         else:
-            new_date_with_time = new_date_for_check.replace(hour=hour, minute=minute)
-            self.selected_dates.append(new_date_with_time)
+            self.selected_dates[selected_day] = datetime(self.current_year, self.current_month, day, hour, minute)
 
-        self.selected_dates.sort()
         self._update_calendar()
         self._update_text_widget()
         self.logger.info(f"Selected dates: {len(self.selected_dates)}")
@@ -245,7 +279,7 @@ class ScheduleHelperComponent(BaseFrameGUI):
             self.text_widget.delete(1.0, tk.END)
 
             output_lines = []
-            for full_date in self.selected_dates:
+            for full_date in sorted(self.selected_dates.values()):
                 if "%a" in format_str:
                     weekdays: list[str] = self.app.translator("weekdays_full") # type: ignore
                     day_of_week = weekdays[full_date.weekday()]
@@ -275,5 +309,5 @@ class ScheduleHelperPlugin(Plugin):
     def has_gui_component(self) -> bool:
         return True
 
-    def create_gui_component(self, parent: ttk.Notebook, app_instance: BaseApplication) -> ttk.Frame | None:
+    def create_gui_component(self, parent: tk.Misc, app_instance: BaseApplication) -> ttk.Frame | None:
         return ScheduleHelperComponent(parent, app_instance) # type: ignore
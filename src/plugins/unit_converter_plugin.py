@@ -1,59 +1,250 @@
 from __future__ import annotations
 
+import ast
 import logging
+import operator
 import tkinter as tk
+from collections.abc import Callable
 from datetime import datetime
 from tkinter import ttk
 from typing import TYPE_CHECKING, Any
 
 from src.gui.base.base_frame_gui import BaseFrameGUI
 from src.plugins.base_plugin import Plugin
+from src.utils.tk_async import BackgroundTask, run_in_background
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional; batches are converted with plain Python without it
+    np = None
 
 if TYPE_CHECKING:
     from src.core.base_application import BaseApplication
 
 
+CONVERSIONS: dict[str, dict[str, Any]] = {
+    "Length": {
+        "Meter": 1,
+        "Centimeter": 0.01,
+        "Inch": 0.0254,
+        "Foot": 0.3048,
+        "Yard": 0.9144,
+        "Kilometer": 1000,
+        "Mile": 1609.34
+    },
+    "Weight": {
+        "Kilogram": 1,
+        "Gram": 0.001,
+        "Pound (lbs)": 0.453592,
+        "Ounce": 0.0283495
+    },
+    "Temperature": {
+        "Celsius": "celsius",
+        "Fahrenheit": "fahrenheit",
+        "Kelvin": "kelvin"
+    },
+    "Time": {
+        "Unix Timestamp": "unix",
+        "Datetime String": "datetime"
+    }
+}
+
+# Temperatures as (scale, offset) to and from Celsius
+_TO_CELSIUS = {"Celsius": (1.0, 0.0), "Fahrenheit": (5 / 9, -32 * 5 / 9), "Kelvin": (1.0, -273.15)}
+_FROM_CELSIUS = {"Celsius": (1.0, 0.0), "Fahrenheit": (9 / 5, 32.0), "Kelvin": (1.0, 273.15)}
+
+DATETIME_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M',
+    '%Y-%m-%d',
+    '%Y/%m/%d %H:%M:%S',
+    '%Y/%m/%d %H:%M',
+    '%Y/%m/%d',
+)
+DATETIME_OUTPUT_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _build_conversion_table() -> dict[tuple[str, str, str], tuple[float, float]]:
+    """
+    Precomputes every numeric conversion as result = value * scale + offset,
+    keyed by (category, from unit, to unit).
+    """
+    table: dict[tuple[str, str, str], tuple[float, float]] = {}
+    for category, units in CONVERSIONS.items():
+        if category == "Temperature":
+            for from_unit, (scale_in, offset_in) in _TO_CELSIUS.items():
+                for to_unit, (scale_out, offset_out) in _FROM_CELSIUS.items():
+                    table[category, from_unit, to_unit] = (scale_in * scale_out, offset_in * scale_out + offset_out)
+        elif category != "Time":
+            for from_unit, from_factor in units.items():
+                for to_unit, to_factor in units.items():
+                    table[category, from_unit, to_unit] = (from_factor / to_factor, 0.0)
+    return table
+
+
+CONVERSION_TABLE = _build_conversion_table()
+
+_BINARY_OPERATORS: dict[type[ast.operator], Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPERATORS: dict[type[ast.unaryop], Callable[[Any], Any]] = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+# Keeps "9**9**9" style inputs from freezing the GUI
+MAX_EXPONENT = 1000
+
+
+def evaluate_expression(text: str) -> float:
+    """
+    Evaluates an arithmetic expression such as "3 * 12 + 5" or "(72 - 32) / 1.8".
+    Only numbers, parentheses and + - * / // % ** are allowed; anything else
+    raises ValueError, as do numbers too large for a float and input nested
+    too deeply to parse. The expression is never passed to eval().
+    """
+    try:
+        tree = ast.parse(text.strip(), mode="eval")
+    except (SyntaxError, RecursionError, MemoryError) as e:
+        raise ValueError(f"Invalid expression: {text}") from e
+
+    def evaluate(node: ast.AST) -> float:
+        if isinstance(node, ast.Expression):
+            return evaluate(node.body)
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return float(node.value)
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+            left, right = evaluate(node.left), evaluate(node.right)
+            if isinstance(node.op, ast.Pow) and abs(right) > MAX_EXPONENT:
+                raise ValueError("Exponent is too large")
+            try:
+                return float(_BINARY_OPERATORS[type(node.op)](left, right))
+            except (ArithmeticError, TypeError) as e:
+                raise ValueError(str(e)) from e
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+            return float(_UNARY_OPERATORS[type(node.op)](evaluate(node.operand)))
+        raise ValueError(f"Unsupported expression: {text}")
+
+    try:
+        return evaluate(tree)
+    except (OverflowError, RecursionError, MemoryError) as e:
+        raise ValueError(f"Invalid expression: {text}") from e
+
+
+def parse_number(text: str) -> float:
+    """Parses a plain number, falling back to an arithmetic expression."""
+    try:
+        return float(text)
+    except ValueError:
+        return evaluate_expression(text)
+
+
+def detect_datetime_format(text: str) -> str | None:
+    """Returns the first of DATETIME_FORMATS that parses text, or None."""
+    for fmt in DATETIME_FORMATS:
+        try:
+            datetime.strptime(text, fmt)
+            return fmt
+        except ValueError:
+            continue
+    return None
+
+
+def format_number(value: float) -> str:
+    return f"{value:.4f}"
+
+
+def convert_numbers(values: list[str], scale: float, offset: float) -> list[str]:
+    """
+    Converts a column of numbers with one affine transform. Values that are
+    not numbers become "Error"; empty lines stay empty.
+    """
+    parsed: list[float] = []
+    for value in values:
+        try:
+            parsed.append(parse_number(value) if value else float("nan"))
+        except ValueError:
+            parsed.append(float("nan"))
+
+    if np is not None:
+        results = (np.asarray(parsed, dtype=float) * scale + offset).tolist()
+    else:
+        results = [number * scale + offset for number in parsed]
+    return [
+        "" if not value else ("Error" if result != result else format_number(result))  # NaN marks a failed parse
+        for value, result in zip(values, results, strict=True)
+    ]
+
+
+def convert_times(values: list[str], from_unit: str, to_unit: str) -> list[str]:
+    """
+    Converts a column of timestamps or datetime strings. The datetime format
+    is detected once from the first value and reused for the rest of the
+    batch; only values that do not match it are detected again.
+    """
+    if from_unit == to_unit:
+        return list(values)
+    results: list[str] = []
+    batch_format: str | None = None
+    for value in values:
+        if not value:
+            results.append("")
+            continue
+        try:
+            if from_unit == "Unix Timestamp":
+                results.append(datetime.fromtimestamp(parse_number(value)).strftime(DATETIME_OUTPUT_FORMAT))
+                continue
+            if batch_format is None:
+                batch_format = detect_datetime_format(value)
+            try:
+                dt_obj = datetime.strptime(value, batch_format or "")
+            except ValueError:
+                fmt = detect_datetime_format(value)
+                if fmt is None:
+                    raise
+                dt_obj = datetime.strptime(value, fmt)
+            results.append(str(dt_obj.timestamp()))
+        except (ValueError, TypeError, OverflowError, OSError):
+            results.append("Error")
+    return results
+
+
+def convert_batch(values: list[str], category: str, from_unit: str, to_unit: str) -> list[str]:
+    """Converts a column of values in one pass; one result per input line."""
+    values = [value.strip() for value in values]
+    if category == "Time":
+        return convert_times(values, from_unit, to_unit)
+    scale, offset = CONVERSION_TABLE[category, from_unit, to_unit]
+    return convert_numbers(values, scale, offset)
+
+
 class UnitConverterComponent(BaseFrameGUI):
     """
     A GUI component for converting units, including time.
+
+    The single value accepts arithmetic expressions; the batch mode converts
+    a whole column (e.g. pasted from the clipboard) in one pass on a worker
+    thread, vectorized with NumPy when it is installed.
     """
     def __init__(self, master: tk.Misc, app_instance: BaseApplication) -> None:
         super().__init__(master, app_instance)
         self.logger = logging.getLogger(__name__)
         self.logger.info("Initializing UnitConverterComponent.")
 
-        self.conversions: dict[str, dict[str, Any]] = {
-            "Length": {
-                "Meter": 1,
-                "Centimeter": 0.01,
-                "Inch": 0.0254,
-                "Foot": 0.3048,
-                "Yard": 0.9144,
-                "Kilometer": 1000,
-                "Mile": 1609.34
-            },
-            "Weight": {
-                "Kilogram": 1,
-                "Gram": 0.001,
-                "Pound (lbs)": 0.453592,
-                "Ounce": 0.0283495
-            },
-            "Temperature": {
-                "Celsius": "celsius",
-                "Fahrenheit": "fahrenheit",
-                "Kelvin": "kelvin"
-            },
-            "Time": {
-                "Unix Timestamp": "unix",
-                "Datetime String": "datetime"
-            }
-        }
+        self.conversions: dict[str, dict[str, Any]] = CONVERSIONS
 
         self.category_var = tk.StringVar(value="Length")
         self.from_unit_var = tk.StringVar()
         self.to_unit_var = tk.StringVar()
         self.input_var = tk.StringVar()
         self.output_var = tk.StringVar(value="Result:")
+        self._batch_task: BackgroundTask[list[str]] | None = None
 
         self._create_widgets()
         self._on_category_change()
@@ -95,6 +286,23 @@ class UnitConverterComponent(BaseFrameGUI):
         output_label = ttk.Label(to_frame, textvariable=self.output_var, anchor="w")
         output_label.pack(fill=tk.X, padx=5, pady=5)
 
+        # Batch mode: one value per line, converted with the units selected above
+        batch_frame = ttk.LabelFrame(main_frame, text="Batch (one value per line)")
+        batch_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        batch_buttons = ttk.Frame(batch_frame)
+        batch_buttons.pack(fill=tk.X, padx=5, pady=5)
+        ttk.Button(batch_buttons, text="Paste from Clipboard", command=self._paste_batch).pack(side=tk.LEFT)
+        ttk.Button(batch_buttons, text="Convert", command=self._convert_batch).pack(side=tk.LEFT, padx=5)
+        ttk.Button(batch_buttons, text="Copy Results", command=self._copy_batch_results).pack(side=tk.LEFT)
+
+        batch_texts = ttk.Frame(batch_frame)
+        batch_texts.pack(fill=tk.BOTH, expand=True, padx=5, pady=(0, 5))
+        self.batch_input_text = tk.Text(batch_texts, wrap=tk.NONE, height=8, width=20)
+        self.batch_input_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
+        self.batch_output_text = tk.Text(batch_texts, wrap=tk.NONE, height=8, width=20, state=tk.DISABLED)
+        self.batch_output_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
     def _on_category_change(self, event: tk.Event | None = None) -> None:
         category = self.category_var.get()
         units = list(self.conversions[category].keys()) # type: ignore
@@ -120,76 +328,61 @@ class UnitConverterComponent(BaseFrameGUI):
             return
 
         try:
-            value = float(input_str)
+            value = parse_number(input_str)
         except ValueError:
             self.output_var.set("Result: Invalid number")
             return
 
-        if category == "Temperature":
-            result = self._convert_temperature(value, from_unit, to_unit)
-            self.output_var.set(f"Result: {result:.4f}")
-        else: # Length and Weight
-            base_value = value * self.conversions[category][from_unit] # type: ignore
-            result = base_value / self.conversions[category][to_unit] # type: ignore
-            self.output_var.set(f"Result: {result:.4f}")
-
-    def _convert_temperature(self, value: float, from_unit: str, to_unit: str) -> float:
-        if from_unit == to_unit:
-            return value
-        # Convert to Celsius first
-        if from_unit == "Fahrenheit":
-            celsius = (value - 32) * 5/9
-        elif from_unit == "Kelvin":
-            celsius = value - 273.15
-        else: # from_unit is Celsius
-            celsius = value
-        # Convert from Celsius to target unit
-        if to_unit == "Fahrenheit":
-            return (celsius * 9/5) + 32
-        elif to_unit == "Kelvin":
-            return celsius + 273.15
-        else: # to_unit is Celsius
-            return celsius
+        conversion = CONVERSION_TABLE.get((category, from_unit, to_unit))
+        if conversion is None:
+            self.output_var.set("Result: Error")
+            return
+        scale, offset = conversion
+        self.output_var.set(f"Result: {format_number(value * scale + offset)}")
 
     def _convert_time(self, input_str: str, from_unit: str, to_unit: str) -> None:
-        if from_unit == to_unit:
-            self.output_var.set(f"Result: {input_str}")
-            return
+        result = convert_times([input_str.strip()], from_unit, to_unit)[0]
+        if result == "Error":
+            self.logger.error(f"Time conversion error: {input_str!r}")
+        self.output_var.set(f"Result: {result}")
 
+    def _paste_batch(self) -> None:
         try:
-            if from_unit == "Unix Timestamp":
-                # From Timestamp to Datetime
-                ts = float(input_str)
-                dt_obj = datetime.fromtimestamp(ts)
-                result = dt_obj.strftime('%Y-%m-%d %H:%M:%S')
-                self.output_var.set(f"Result: {result}")
-            elif from_unit == "Datetime String":
-                # From Datetime to Timestamp
-                # Try a few common formats
-                dt_obj = None
-                formats_to_try = [
-                    '%Y-%m-%d %H:%M:%S',
-                    '%Y-%m-%d %H:%M',
-                    '%Y-%m-%d',
-                    '%Y/%m/%d %H:%M:%S',
-                    '%Y/%m/%d %H:%M',
-                    '%Y/%m/%d',
-                ]
-                for fmt in formats_to_try:
-                    try:
-                        dt_obj = datetime.strptime(input_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-
-                if dt_obj is None:
-                    raise ValueError("Invalid datetime format")
-
-                result: float = dt_obj.timestamp() # type: ignore
-                self.output_var.set(f"Result: {result}")
-        except (ValueError, TypeError) as e:
-            self.output_var.set("Result: Error")
-            self.logger.error(f"Time conversion error: {e}")
+            content = self.clipboard_get()
+        except tk.TclError:
+            self.logger.info("Nothing to paste.")
+            return
+        self.batch_input_text.delete("1.0", tk.END)
+        self.batch_input_text.insert("1.0", content)
+        self._convert_batch()
+
+    def _convert_batch(self) -> None:
+        category = self.category_var.get()
+        from_unit = self.from_unit_var.get()
+        to_unit = self.to_unit_var.get()
+        if (category, from_unit, to_unit) not in CONVERSION_TABLE and category != "Time":
+            return
+        values = self.batch_input_text.get("1.0", "end-1c").splitlines()
+        if self._batch_task is not None:
+            self._batch_task.cancel()
+        self._batch_task = run_in_background(self, convert_batch, values, category, from_unit, to_unit, on_done=self._show_batch_results)
+
+    def _show_batch_results(self, results: list[str]) -> None:
+        self._batch_task = None
+        self.batch_output_text.config(state=tk.NORMAL)
+        self.batch_output_text.delete("1.0", tk.END)
+        self.batch_output_text.insert("1.0", "\n".join(results))
+        self.batch_output_text.config(state=tk.DISABLED)
+
+    def _copy_batch_results(self) -> None:
+        content = self.batch_output_text.get("1.0", "end-1c")
+        if not content:
+            self.logger.info("Nothing to copy.")
+            return
+        self.clipboard_clear()
+        self.clipboard_append(content)
+        self.logger.info("Copied converted values to clipboard.")
+
 
 class UnitConverterPlugin(Plugin):
     """
@@ -206,5 +399,5 @@ class UnitConverterPlugin(Plugin):
     def has_gui_component(self) -> bool:
         return True
 
-    def create_gui_component(self, parent: ttk.Notebook, app_instance: BaseApplication) -> ttk.Frame | None:
+    def create_gui_component(self, parent: tk.Misc, app_instance: BaseApplication) -> ttk.Frame | None:
         return UnitConverterComponent(parent, app_instance) # type: ignore
@@ -2,6 +2,8 @@ from .base_plugin import Plugin
 
 
 class UppercaseConverterPlugin(Plugin):
+    pure = True
+
     @property
     def name(self) -> str:
         return "Uppercase Converter"
@@ -4,6 +4,8 @@ from .base_plugin import Plugin
 
 
 class URLConverterPlugin(Plugin):
+    pure = True
+
     @property
     def name(self) -> str:
         return "URL Encode/Decode"
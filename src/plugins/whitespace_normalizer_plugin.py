@@ -1,7 +1,13 @@
+from collections.abc import Iterable, Iterator
+
 from .base_plugin import Plugin
 
 
 class WhitespaceNormalizerPlugin(Plugin):
+    line_oriented = True
+    streaming = True
+    pure = True
+
     @property
     def name(self) -> str:
         return "Whitespace Normalizer"
@@ -13,17 +19,12 @@ class WhitespaceNormalizerPlugin(Plugin):
     def process(self, text: str) -> str:
         if not isinstance(text, str):
             return text
+        # Join lines with normalized line endings
+        return '\n'.join(self.process_lines(text.splitlines()))
 
-        lines = text.splitlines()
-        normalized_lines = []
-        for line in lines:
-            # Remove leading/trailing whitespace from the line
-            line = line.strip()
-            # Replace multiple spaces with a single space
-            line = ' '.join(line.split())
-            # Replace tabs with spaces
-            line = line.replace('	', ' ')
-            normalized_lines.append(line)
+    def process_lines(self, lines: list[str]) -> list[str]:
+        return list(self.process_stream(lines))
 
-        # Join lines with normalized line endings
-        return '\n'.join(normalized_lines)
+    def process_stream(self, lines: Iterable[str]) -> Iterator[str]:
+        # split() drops leading/trailing whitespace and collapses runs of spaces and tabs
+        return (' '.join(line.split()) for line in lines)
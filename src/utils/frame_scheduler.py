@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import threading
+import tkinter as tk
+from collections.abc import Callable
+
+# Roughly one frame at 60 Hz
+FRAME_INTERVAL_MS = 16
+
+
+class FrameScheduler:
+    """
+    Coalesces repeated refresh requests into at most one callback per frame.
+
+    request() only marks the target dirty; the callback runs on the Tk thread
+    after the frame interval, so it should read the latest state itself
+    instead of receiving a snapshot taken at request time.
+    """
+    def __init__(self, tk_root: tk.Misc, callback: Callable[[], None], interval_ms: int = FRAME_INTERVAL_MS) -> None:
+        self.tk_root = tk_root
+        self.callback = callback
+        self.interval_ms = interval_ms
+        self._lock = threading.Lock()
+        self._after_id: str | None = None
+
+    @property
+    def is_pending(self) -> bool:
+        return self._after_id is not None
+
+    def request(self) -> None:
+        """Marks the target dirty and schedules a flush if none is pending."""
+        with self._lock:
+            if self._after_id is not None:
+                return
+            self._after_id = self.tk_root.after(self.interval_ms, self._flush)
+
+    def flush_now(self) -> None:
+        """Runs a pending flush immediately (e.g. before shutdown)."""
+        if self.cancel():
+            self.callback()
+
+    def cancel(self) -> bool:
+        """Drops a pending flush. Returns True if one was pending."""
+        with self._lock:
+            after_id, self._after_id = self._after_id, None
+        if after_id is None:
+            return False
+        try:
+            self.tk_root.after_cancel(after_id)
+        except tk.TclError:
+            pass  # The root has already been destroyed
+        return True
+
+    def _flush(self) -> None:
+        with self._lock:
+            self._after_id = None
+        self.callback()
@@ -5,6 +5,8 @@ import logging
 import os
 from typing import TYPE_CHECKING, Any
 
+from src.core.event_dispatcher import PRIORITY_HIGH
+
 if TYPE_CHECKING:
     from src.core.config.settings_manager import SettingsManager
 
@@ -24,31 +26,37 @@ class Translator:
         """
         self.settings_manager = settings_manager
         self.default_lang = default_lang
-        self.translations: dict[str, dict[str, str]] = self._load_translations(locales_dir)
+        self.locales_dir = locales_dir
+        # Locale files are loaded on first use, so only the languages in use are parsed
+        self.translations: dict[str, dict[str, str]] = {}
         self.current_lang: str = self.settings_manager.get_setting("language", self.default_lang)
 
-        self.settings_manager.event_dispatcher.subscribe("SETTINGS_CHANGED", self._update_language)
+        # The language must be switched before other listeners refresh their labels
+        self.settings_manager.event_dispatcher.subscribe("SETTINGS_CHANGED", self._update_language, priority=PRIORITY_HIGH)
         logger.info(f"Translator initialized. Current language: {self.current_lang}")
 
-    def _load_translations(self, locales_dir: str) -> dict[str, dict[str, str]]:
-        """Loads all .json translation files from the specified directory."""
-        translations: dict[str, dict[str, str]] = {}
-        if not os.path.isdir(locales_dir):
-            logger.error(f"Locales directory not found: {locales_dir}")
-            return translations
-
-        for filename in os.listdir(locales_dir):
-            if filename.endswith(".json"):
-                lang_code = os.path.splitext(filename)[0]
-                filepath = os.path.join(locales_dir, filename)
-                try:
-                    with open(filepath, encoding="utf-8") as f:
-                        translations[lang_code] = json.load(f)
-                    logger.info(f"Loaded translation file: {filename}")
-                except (OSError, json.JSONDecodeError) as e:
-                    logger.error(f"Failed to load or parse {filepath}: {e}")
+    def _get_translations(self, lang_code: str) -> dict[str, str]:
+        """Returns the translations of a language, loading its .json file on first use."""
+        translations = self.translations.get(lang_code)
+        if translations is None:
+            translations = self.translations[lang_code] = self._load_translation_file(lang_code)
         return translations
 
+    def _load_translation_file(self, lang_code: str) -> dict[str, str]:
+        """Loads a single .json translation file from the locales directory."""
+        filepath = os.path.join(self.locales_dir, f"{lang_code}.json")
+        if not os.path.isfile(filepath):
+            logger.error(f"Translation file not found: {filepath}")
+            return {}
+        try:
+            with open(filepath, encoding="utf-8") as f:
+                translations: dict[str, str] = json.load(f)
+            logger.info(f"Loaded translation file: {lang_code}.json")
+            return translations
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to load or parse {filepath}: {e}")
+            return {}
+
     def _update_language(self, settings: dict[str, Any]) -> None:
         """Callback for when settings change."""
         new_lang = settings.get("language", self.default_lang)
@@ -63,8 +71,10 @@ class Translator:
         Falls back to the default language if the key is not found in the current one.
         Returns the key itself if not found in the default language either.
         """
-        return self.translations.get(self.current_lang, {}).get(key,
-               self.translations.get(self.default_lang, {}).get(key, key))
+        translation = self._get_translations(self.current_lang).get(key)
+        if translation is None and self.current_lang != self.default_lang:
+            translation = self._get_translations(self.default_lang).get(key)
+        return translation if translation is not None else key
 
     # Alias for translate for shorter calls
     def __call__(self, key: str) -> str:
@@ -0,0 +1,81 @@
+"""
+Latency statistics for the event bus diagnostics.
+
+Count, total and max are exact; percentiles are computed from the most recent
+SAMPLE_WINDOW samples, so recording stays O(1) and memory stays bounded.
+"""
+from __future__ import annotations
+
+import json
+import math
+import threading
+from collections import deque
+from typing import Any
+
+# Number of most recent samples kept per key for percentiles
+SAMPLE_WINDOW = 2048
+
+
+class LatencyStats:
+    """Durations recorded for one key, in seconds. Not thread-safe on its own."""
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: deque[float] = deque(maxlen=SAMPLE_WINDOW)
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.samples.append(seconds)
+
+    def summary(self) -> dict[str, float | int]:
+        """Returns count and the timings in milliseconds."""
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "p50_ms": _percentile(ordered, 0.50) * 1000,
+            "p95_ms": _percentile(ordered, 0.95) * 1000,
+            "p99_ms": _percentile(ordered, 0.99) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples; 0.0 if there are none."""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+class LatencyRegistry:
+    """Thread-safe LatencyStats by key (an event type or a listener name)."""
+    def __init__(self) -> None:
+        self._stats: dict[str, LatencyStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float) -> None:
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = LatencyStats()
+            stats.record(seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def summaries(self) -> dict[str, dict[str, float | int]]:
+        """Returns the summary of every key, slowest total first."""
+        with self._lock:
+            summaries = {key: stats.summary() for key, stats in self._stats.items()}
+        return dict(sorted(summaries.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+
+def dump_json(report: dict[str, Any], file_path: str) -> None:
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=4)
@@ -0,0 +1,97 @@
+"""
+Startup profiling enabled with ``clip_watcher.py --startup-profile``.
+
+Module imports are timed by a meta path finder that wraps every loader, which
+gives a report in the spirit of ``python -X importtime`` (self and cumulative
+time per module, nested by import depth) without restarting the interpreter.
+Startup phases are recorded with mark() and printed together with the report.
+"""
+from __future__ import annotations
+
+import importlib.abc
+import importlib.machinery
+import sys
+import time
+from types import ModuleType
+from typing import Any
+
+_enabled: bool = False
+_start: float = time.perf_counter()
+_marks: list[tuple[str, float]] = []
+# (module name, depth, self seconds, cumulative seconds) in completion order
+_imports: list[tuple[str, int, float, float]] = []
+_stack: list[list[float]] = []  # [start, time spent in nested imports] per active import
+
+
+class _TimedLoader(importlib.abc.Loader):
+    def __init__(self, loader: importlib.abc.Loader) -> None:
+        self._loader = loader
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        depth = len(_stack)
+        frame = [time.perf_counter(), 0.0]
+        _stack.append(frame)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            _stack.pop()
+            cumulative = time.perf_counter() - frame[0]
+            if _stack:
+                _stack[-1][1] += cumulative
+            _imports.append((module.__name__, depth, cumulative - frame[1], cumulative))
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    def find_spec(self, fullname: str, path: Any, target: ModuleType | None = None) -> importlib.machinery.ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader) # type: ignore[arg-type]
+                return spec
+        return None
+
+
+def enable() -> None:
+    """Starts timing imports and phases. Call before importing the application."""
+    global _enabled, _start
+    if _enabled:
+        return
+    _enabled = True
+    _start = time.perf_counter()
+    sys.meta_path.insert(0, _ImportTimer())
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def mark(phase: str) -> None:
+    """Records the time since startup at which a phase was reached."""
+    if _enabled:
+        _marks.append((phase, time.perf_counter() - _start))
+
+
+def format_report() -> str:
+    lines = ["import time: self [us] | cumulative | imported package"]
+    for name, depth, self_time, cumulative in _imports:
+        lines.append(f"import time: {self_time * 1e6:9.0f} | {cumulative * 1e6:10.0f} | {'  ' * depth}{name}")
+    lines.append("")
+    lines.append("startup phases [ms since start]:")
+    for phase, elapsed in _marks:
+        lines.append(f"  {elapsed * 1000:9.1f}  {phase}")
+    return "\n".join(lines)
+
+
+def report() -> None:
+    """Prints the import and phase report to stderr (only when enabled)."""
+    if _enabled:
+        print(format_report(), file=sys.stderr)
@@ -0,0 +1,158 @@
+"""
+Regex lexers for highlighting clipboard content.
+
+Each language is a single precompiled pattern with one named group per token
+type, so tokenizing is one finditer() pass. tokenize() is pure and meant to
+run on a worker thread; its results are cached by content hash.
+"""
+from __future__ import annotations
+
+import bisect
+import hashlib
+import keyword
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple
+
+# Inputs larger than this are not highlighted at all
+MAX_HIGHLIGHT_CHARS = 1_000_000
+# Only the head is inspected to detect the language
+DETECTION_SAMPLE_CHARS = 4_000
+CACHE_SIZE = 32
+
+# Token types; the GUI maps each to a text tag
+TOKEN_TYPES = ("keyword", "string", "number", "comment", "key", "tag", "timestamp", "error", "warning", "info")
+
+_SQL_KEYWORDS = (
+    "SELECT", "FROM", "WHERE", "INSERT", "INTO", "VALUES", "UPDATE", "SET", "DELETE", "CREATE", "ALTER", "DROP",
+    "TABLE", "INDEX", "VIEW", "JOIN", "INNER", "LEFT", "RIGHT", "FULL", "OUTER", "CROSS", "ON", "AS", "AND", "OR",
+    "NOT", "NULL", "IS", "IN", "EXISTS", "BETWEEN", "LIKE", "GROUP", "BY", "ORDER", "HAVING", "LIMIT", "OFFSET",
+    "UNION", "ALL", "DISTINCT", "CASE", "WHEN", "THEN", "ELSE", "END", "WITH", "PRIMARY", "KEY", "FOREIGN",
+    "REFERENCES", "DEFAULT", "ASC", "DESC", "BEGIN", "COMMIT", "ROLLBACK",
+)
+
+_LEXERS: dict[str, re.Pattern[str]] = {
+    "json": re.compile(r"""
+        (?P<key>"(?:[^"\\\n]|\\.)*"(?=\s*:))
+        |(?P<string>"(?:[^"\\\n]|\\.)*")
+        |(?P<number>-?\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b)
+        |(?P<keyword>\b(?:true|false|null)\b)
+    """, re.VERBOSE),
+    "xml": re.compile(r"""
+        (?P<comment><!--.*?-->)
+        |(?P<tag></?[\w:.-]+|/?>|<\?[\w:.-]+|\?>)
+        |(?P<key>\b[\w:.-]+(?=\s*=\s*["']))
+        |(?P<string>"[^"\n]*"|'[^'\n]*')
+    """, re.VERBOSE | re.DOTALL),
+    "sql": re.compile(rf"""
+        (?P<comment>--[^\n]*|/\*.*?\*/)
+        |(?P<string>'(?:[^']|'')*')
+        |(?P<keyword>\b(?:{"|".join(_SQL_KEYWORDS)})\b)
+        |(?P<number>\b\d+(?:\.\d+)?\b)
+    """, re.VERBOSE | re.DOTALL | re.IGNORECASE),
+    "python": re.compile(rf"""
+        (?P<comment>\#[^\n]*)
+        |(?P<string>[rRbBuUfF]{{0,2}}(?:\"\"\".*?\"\"\"|'''.*?'''|"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'))
+        |(?P<tag>^[ \t]*@[\w.]+)
+        |(?P<keyword>\b(?:{"|".join(keyword.kwlist)})\b)
+        |(?P<number>\b\d+(?:\.\d+)?\b)
+    """, re.VERBOSE | re.DOTALL | re.MULTILINE),
+    "log": re.compile(r"""
+        (?P<timestamp>\b\d{4}[-/]\d{2}[-/]\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?\b)
+        |(?P<error>\b(?:ERROR|CRITICAL|FATAL|Traceback)\b)
+        |(?P<warning>\bWARN(?:ING)?\b)
+        |(?P<info>\b(?:INFO|DEBUG|TRACE)\b)
+    """, re.VERBOSE),
+}
+
+_JSON_START = re.compile(r"\s*[{\[]\s*[\"{\[\]}\d-]")
+_XML_START = re.compile(r"\s*<[?!\w]")
+_LOG_LINE = re.compile(r"^\S*\s*(?:\[?\d{4}[-/]\d{2}[-/]\d{2}[ T]\d{2}:\d{2}|\[?(?:ERROR|WARN(?:ING)?|INFO|DEBUG)\b)", re.MULTILINE)
+_SQL_START = re.compile(r"\s*(?:SELECT|INSERT|UPDATE|DELETE|CREATE|ALTER|DROP|WITH)\b", re.IGNORECASE)
+_PYTHON_LINE = re.compile(r"^[ \t]*(?:def \w+\(|class \w+[:(]|import \w|from [\w.]+ import |@\w|if __name__)", re.MULTILINE)
+
+
+class HighlightResult(NamedTuple):
+    """Token spans per line: {1-based line: [(token type, start column, end column), ...]}."""
+    language: str | None
+    lines: dict[int, list[tuple[str, int, int]]]
+
+
+_NO_HIGHLIGHT = HighlightResult(None, {})
+_cache: OrderedDict[str, HighlightResult] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def detect_language(text: str) -> str | None:
+    """Guesses the language of a text from its head; returns None for plain text."""
+    sample = text[:DETECTION_SAMPLE_CHARS]
+    if _JSON_START.match(sample):
+        return "json"
+    if _XML_START.match(sample) and ">" in sample:
+        return "xml"
+    if len(_LOG_LINE.findall(sample)) >= 2:
+        return "log"
+    if _SQL_START.match(sample):
+        return "sql"
+    if _PYTHON_LINE.search(sample):
+        return "python"
+    return None
+
+
+def content_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8", errors="surrogatepass"), digest_size=16).hexdigest()
+
+
+def tokenize(text: str, language: str, is_cancelled: Callable[[], bool] | None = None) -> HighlightResult | None:
+    """
+    Tokenizes text with the lexer of a language and splits tokens into per-line
+    spans. Returns None if is_cancelled() became true while tokenizing.
+    """
+    pattern = _LEXERS[language]
+    line_starts = [0] + [match.end() for match in re.finditer("\n", text)]
+    lines: dict[int, list[tuple[str, int, int]]] = {}
+    for count, match in enumerate(pattern.finditer(text)):
+        if is_cancelled is not None and count % 1000 == 0 and is_cancelled():
+            return None
+        token_type = match.lastgroup
+        start, end = match.span()
+        if token_type is None or start == end:
+            continue
+        line_index = bisect.bisect_right(line_starts, start) - 1
+        # Tokens spanning several lines (comments, triple-quoted strings) are split per line
+        while True:
+            line_start = line_starts[line_index]
+            line_end = line_starts[line_index + 1] - 1 if line_index + 1 < len(line_starts) else len(text)
+            lines.setdefault(line_index + 1, []).append((token_type, start - line_start, min(end, line_end) - line_start))
+            if end <= line_end:
+                break
+            line_index += 1
+            start = line_starts[line_index]
+    return HighlightResult(language, lines)
+
+
+def highlight(text: str, is_cancelled: Callable[[], bool] | None = None) -> HighlightResult | None:
+    """
+    Detects the language of text and tokenizes it, reusing cached results for
+    content seen before. Returns None if cancelled.
+    """
+    if not text or len(text) > MAX_HIGHLIGHT_CHARS:
+        return _NO_HIGHLIGHT
+    key = content_hash(text)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            return cached
+
+    language = detect_language(text)
+    result = tokenize(text, language, is_cancelled) if language is not None else _NO_HIGHLIGHT
+    if result is None:
+        return None
+    with _cache_lock:
+        _cache[key] = result
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return result
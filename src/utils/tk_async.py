@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import logging
+import threading
+import tkinter as tk
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# How often a pending task is checked for completion from the Tk thread
+POLL_INTERVAL_MS = 20
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Returns the shared worker pool, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="clipwatcher-worker")
+        return _executor
+
+
+class BackgroundTask(Generic[T]):
+    """
+    A function running on the shared worker pool whose result is delivered on
+    the Tk thread.
+
+    Tk must only be touched from the thread running mainloop, so completion is
+    polled with after() instead of calling back from the worker thread. After
+    cancel() neither callback runs; long-running work can poll is_cancelled()
+    to stop early.
+    """
+    def __init__(self, tk_widget: tk.Misc, on_done: Callable[[T], None], on_error: Callable[[BaseException], None] | None = None) -> None:
+        self.tk_widget = tk_widget
+        self.on_done = on_done
+        self.on_error = on_error
+        self._cancelled = threading.Event()
+        self._future: Future[T] | None = None
+        self._after_id: str | None = None
+
+    def is_cancelled(self) -> bool:
+        """Thread-safe; meant to be polled by the running function."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        if self._future is not None:
+            self._future.cancel()
+        if self._after_id is not None:
+            try:
+                self.tk_widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass  # The widget has already been destroyed
+            self._after_id = None
+
+    def _start(self, future: Future[T]) -> None:
+        self._future = future
+        self._after_id = self.tk_widget.after(POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self) -> None:
+        self._after_id = None
+        if self.is_cancelled() or self._future is None:
+            return
+        if not self._future.done():
+            self._after_id = self.tk_widget.after(POLL_INTERVAL_MS, self._poll)
+            return
+        error = self._future.exception()
+        if error is None:
+            self.on_done(self._future.result())
+        elif self.on_error is not None:
+            self.on_error(error)
+        else:
+            logger.error("Background task failed", exc_info=error)
+
+
+def run_in_background(tk_widget: tk.Misc, func: Callable[..., T], *args: Any, on_done: Callable[[T], None], on_error: Callable[[BaseException], None] | None = None, pass_cancel_check: bool = False) -> BackgroundTask[T]:
+    """
+    Runs func(*args) on the worker pool and calls on_done(result) on the Tk thread.
+    With pass_cancel_check, func also receives is_cancelled=task.is_cancelled.
+    """
+    task: BackgroundTask[T] = BackgroundTask(tk_widget, on_done, on_error)
+    kwargs: dict[str, Any] = {"is_cancelled": task.is_cancelled} if pass_cancel_check else {}
+    task._start(get_executor().submit(func, *args, **kwargs))
+    return task
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from src.core.event_dispatcher import EventDispatcher
+from src.utils.frame_scheduler import FRAME_INTERVAL_MS
 
 
 class UndoableCommand(ABC):
@@ -21,6 +22,8 @@ class UndoManager:
         self.undo_stack: list[UndoableCommand] = []
         self.redo_stack: list[UndoableCommand] = []
         self.event_dispatcher = event_dispatcher
+        # Batched commands change the stacks many times; the buttons only need the final state
+        self.event_dispatcher.set_coalescing("UNDO_REDO_STACK_CHANGED", FRAME_INTERVAL_MS)
 
     def execute_command(self, command: UndoableCommand) -> None:
         """Executes a command and adds it to the undo stack."""
@@ -0,0 +1,29 @@
+"""A stand-in for a Tk root that runs after() callbacks only when asked."""
+from __future__ import annotations
+
+from collections.abc import Callable
+
+
+class FakeTkRoot:
+    def __init__(self) -> None:
+        self.pending: dict[str, tuple[int, Callable[..., object], tuple[object, ...]]] = {}
+        self._next_id = 0
+
+    def after(self, ms: int, func: Callable[..., object], *args: object) -> str:
+        self._next_id += 1
+        after_id = f"after#{self._next_id}"
+        self.pending[after_id] = (ms, func, args)
+        return after_id
+
+    def after_idle(self, func: Callable[..., object], *args: object) -> str:
+        return self.after(0, func, *args)
+
+    def after_cancel(self, after_id: str) -> None:
+        self.pending.pop(after_id, None)
+
+    def run_pending(self) -> int:
+        """Runs the callbacks scheduled so far (not those they schedule); returns how many ran."""
+        pending, self.pending = self.pending, {}
+        for _, func, args in pending.values():
+            func(*args)
+        return len(pending)
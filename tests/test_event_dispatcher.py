@@ -0,0 +1,153 @@
+import gc
+import threading
+
+from src.core.event_dispatcher import PRIORITY_HIGH, PRIORITY_LOW, EventDispatcher
+from tests.fake_tk import FakeTkRoot
+
+
+def test_listeners_run_by_priority_then_subscription_order() -> None:
+    dispatcher, calls = EventDispatcher(), []
+    dispatcher.subscribe("EVENT", lambda: calls.append("normal 1"))
+    dispatcher.subscribe("EVENT", lambda: calls.append("low"), priority=PRIORITY_LOW)
+    dispatcher.subscribe("EVENT", lambda: calls.append("high"), priority=PRIORITY_HIGH)
+    dispatcher.subscribe("EVENT", lambda: calls.append("normal 2"))
+    dispatcher.dispatch("EVENT")
+    assert calls == ["high", "normal 1", "normal 2", "low"]
+
+
+def test_unsubscribe() -> None:
+    dispatcher, calls = EventDispatcher(), []
+    dispatcher.subscribe("EVENT", calls.append)
+    dispatcher.unsubscribe("EVENT", calls.append)
+    dispatcher.dispatch("EVENT", 1)
+    assert calls == []
+    assert dispatcher.listener_counts() == {}
+
+
+def test_dispatch_from_another_thread_is_delivered_on_the_tk_thread() -> None:
+    dispatcher, root, calls = EventDispatcher(), FakeTkRoot(), []
+    dispatcher.attach_tk(root)
+    dispatcher.subscribe("EVENT", lambda value: calls.append((value, threading.get_ident())))
+    worker = threading.Thread(target=dispatcher.dispatch, args=("EVENT", 1))
+    worker.start()
+    worker.join()
+    assert calls == []
+    root.run_pending()
+    assert calls == [(1, threading.get_ident())]
+
+
+def test_dispatch_async_waits_for_the_next_tick() -> None:
+    dispatcher, root, calls = EventDispatcher(), FakeTkRoot(), []
+    dispatcher.attach_tk(root)
+    dispatcher.subscribe("EVENT", calls.append)
+    dispatcher.dispatch_async("EVENT", 1)
+    dispatcher.dispatch("EVENT", 2)
+    root.run_pending()
+    assert calls == [2, 1]
+
+
+class Listener:
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def on_event(self, value: int) -> None:
+        self.calls.append(value)
+
+
+def test_weak_subscription_is_removed_when_the_listener_is_collected() -> None:
+    dispatcher = EventDispatcher()
+    listener = Listener()
+    dispatcher.subscribe("EVENT", listener.on_event, weak=True)
+    dispatcher.dispatch("EVENT", 1)
+    assert listener.calls == [1]
+    assert dispatcher.listener_counts() == {"EVENT": 1}
+    del listener
+    gc.collect()
+    assert dispatcher.listener_counts() == {}
+    dispatcher.dispatch("EVENT", 2)
+
+
+def test_weak_subscription_can_be_unsubscribed() -> None:
+    dispatcher = EventDispatcher()
+    listener = Listener()
+    dispatcher.subscribe("EVENT", listener.on_event, weak=True)
+    dispatcher.unsubscribe("EVENT", listener.on_event)
+    dispatcher.dispatch("EVENT", 1)
+    assert listener.calls == []
+
+
+def test_coalesced_event_is_delivered_once_with_the_latest_arguments() -> None:
+    dispatcher, root, calls = EventDispatcher(), FakeTkRoot(), []
+    dispatcher.attach_tk(root)
+    dispatcher.subscribe("EVENT", lambda value, tag=None: calls.append((value, tag)))
+    dispatcher.set_coalescing("EVENT", 50)
+    dispatcher.dispatch("EVENT", 1, tag="a")
+    dispatcher.dispatch("EVENT", 2, tag="b")
+    dispatcher.dispatch("EVENT", 3)
+    assert calls == []
+    root.run_pending()
+    assert calls == [(3, None)]
+
+
+def test_coalesced_arguments_are_merged() -> None:
+    dispatcher, root, calls = EventDispatcher(), FakeTkRoot(), []
+    dispatcher.attach_tk(root)
+    dispatcher.subscribe("EVENT", calls.append)
+    dispatcher.set_coalescing("EVENT", 50, merge=lambda pending, new: (pending[0] | new[0],))
+    for ids in ({1}, {2}, {1, 3}):
+        dispatcher.dispatch("EVENT", ids)
+    root.run_pending()
+    assert calls == [{1, 2, 3}]
+
+
+def test_flush_and_clear_coalescing_deliver_pending_events() -> None:
+    dispatcher, root, calls = EventDispatcher(), FakeTkRoot(), []
+    dispatcher.attach_tk(root)
+    dispatcher.subscribe("EVENT", calls.append)
+    dispatcher.set_coalescing("EVENT", 50)
+    dispatcher.dispatch("EVENT", 1)
+    dispatcher.flush_coalesced()
+    assert calls == [1]
+    dispatcher.dispatch("EVENT", 2)
+    dispatcher.clear_coalescing("EVENT")
+    dispatcher.dispatch("EVENT", 3)
+    assert calls == [1, 2, 3]
+
+
+def test_coalescing_before_attach_tk_delivers_immediately() -> None:
+    dispatcher, calls = EventDispatcher(), []
+    dispatcher.subscribe("EVENT", calls.append)
+    dispatcher.set_coalescing("EVENT", 50)
+    dispatcher.dispatch("EVENT", 1)
+    assert calls == [1]
+
+
+def test_queue_is_drained_only_when_something_was_queued() -> None:
+    dispatcher, root, calls = EventDispatcher(), FakeTkRoot(), []
+    dispatcher.attach_tk(root)
+    assert root.pending == {}
+    dispatcher.call_in_main_thread(calls.append, 1)
+    dispatcher.call_in_main_thread(calls.append, 2)
+    assert len(root.pending) == 1
+    root.run_pending()
+    assert calls == [1, 2]
+    assert root.pending == {}
+
+
+def test_calls_queued_while_draining_run_in_the_next_tick() -> None:
+    dispatcher, root, calls = EventDispatcher(), FakeTkRoot(), []
+    dispatcher.attach_tk(root)
+    dispatcher.call_in_main_thread(lambda: dispatcher.call_in_main_thread(calls.append, "later"))
+    root.run_pending()
+    assert calls == []
+    root.run_pending()
+    assert calls == ["later"]
+    assert root.pending == {}
+
+
+def test_calls_queued_before_attach_tk_run_after_it() -> None:
+    dispatcher, root, calls = EventDispatcher(), FakeTkRoot(), []
+    dispatcher.call_in_main_thread(calls.append, 1)
+    dispatcher.attach_tk(root)
+    root.run_pending()
+    assert calls == [1]
@@ -0,0 +1,45 @@
+from src.utils.frame_scheduler import FrameScheduler
+from tests.fake_tk import FakeTkRoot
+
+
+def test_requests_coalesce_into_one_flush() -> None:
+    root, calls = FakeTkRoot(), []
+    scheduler = FrameScheduler(root, lambda: calls.append(1))
+    for _ in range(100):
+        scheduler.request()
+    assert len(root.pending) == 1
+    assert scheduler.is_pending
+    root.run_pending()
+    assert calls == [1]
+    assert not scheduler.is_pending
+
+
+def test_request_after_flush_schedules_again() -> None:
+    root, calls = FakeTkRoot(), []
+    scheduler = FrameScheduler(root, lambda: calls.append(1))
+    scheduler.request()
+    root.run_pending()
+    scheduler.request()
+    root.run_pending()
+    assert calls == [1, 1]
+
+
+def test_cancel_drops_the_pending_flush() -> None:
+    root, calls = FakeTkRoot(), []
+    scheduler = FrameScheduler(root, lambda: calls.append(1))
+    scheduler.request()
+    assert scheduler.cancel()
+    assert not scheduler.cancel()
+    assert root.run_pending() == 0
+    assert calls == []
+
+
+def test_flush_now_runs_only_a_pending_flush() -> None:
+    root, calls = FakeTkRoot(), []
+    scheduler = FrameScheduler(root, lambda: calls.append(1))
+    scheduler.flush_now()
+    assert calls == []
+    scheduler.request()
+    scheduler.flush_now()
+    assert calls == [1]
+    assert root.pending == {}
@@ -0,0 +1,55 @@
+import hashlib
+
+from src.plugins import hash_calculator_plugin
+from src.plugins.hash_calculator_plugin import (
+    ChecksumEntry,
+    compute_digests,
+    parse_checksum_list,
+)
+
+
+def test_compute_digests_matches_hashlib() -> None:
+    data = b"clipboard" * 50_000
+    chunks = [data[i:i + 100_000] for i in range(0, len(data), 100_000)]
+    assert len(chunks[0]) >= hash_calculator_plugin.PARALLEL_MIN_BYTES
+    digests = compute_digests(chunks, ["md5", "sha256", "shake_128"])
+    assert digests == {
+        "md5": hashlib.md5(data).hexdigest(),
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "shake_128": hashlib.shake_128(data).hexdigest(hash_calculator_plugin.SHAKE_DIGEST_BYTES),
+    }
+
+
+def test_compute_digests_of_small_chunks_and_unknown_algorithms() -> None:
+    digests = compute_digests([b"ab", memoryview(b"c")], ["sha1", "no-such-hash"])
+    assert digests is not None
+    assert digests["sha1"] == hashlib.sha1(b"abc").hexdigest()
+    assert digests["no-such-hash"].startswith("Error: ")
+
+
+def test_compute_digests_returns_none_when_cancelled() -> None:
+    assert compute_digests([b"data"], ["md5"], lambda: True) is None
+
+
+def test_parse_checksum_list() -> None:
+    md5 = hashlib.md5(b"a").hexdigest()
+    sha256 = hashlib.sha256(b"b").hexdigest()
+    text = "\n".join([
+        f"{md5}  file one.txt",
+        f"{sha256.upper()} *bin/app.exe",
+        f"\\{md5}  escaped\\name",
+        f"SHA256 (dir/file.txt) = {sha256}",
+        f"SHA-512 (other) = {'ab' * 64}",
+        f"BLAKE2b (x) = {'cd' * 64}",
+        "# comment",
+        f"{'0' * 20}  unknown length",
+        "",
+    ])
+    assert parse_checksum_list(text) == [
+        ChecksumEntry("file one.txt", "md5", md5),
+        ChecksumEntry("bin/app.exe", "sha256", sha256),
+        ChecksumEntry("escaped\\name", "md5", md5),
+        ChecksumEntry("dir/file.txt", "sha256", sha256),
+        ChecksumEntry("other", "sha512", "ab" * 64),
+        ChecksumEntry("x", "blake2b", "cd" * 64),
+    ]
@@ -0,0 +1,43 @@
+import random
+
+from src.core.history_preview import HistoryPreview, format_size, make_preview
+
+
+def collapsed(content: str) -> str:
+    return " ".join(content.split())
+
+
+def test_short_content_is_not_truncated() -> None:
+    assert make_preview("  hello \n\t world ") == HistoryPreview("hello world", False, 2, 17)
+
+
+def test_empty_content() -> None:
+    assert make_preview("") == HistoryPreview("", False, 0, 0)
+
+
+def test_matches_collapsing_the_whole_content() -> None:
+    rng = random.Random(0)
+    for _ in range(2000):
+        content = "".join(rng.choice("ab \n\t") for _ in range(rng.randint(0, 300)))
+        length = rng.choice([1, 5, 100])
+        preview = make_preview(content, length)
+        assert preview.text == collapsed(content)[:length]
+        assert preview.truncated == (len(collapsed(content)) > length)
+
+
+def test_long_unbroken_word_is_cut() -> None:
+    preview = make_preview("x" * 10_000)
+    assert preview.text == "x" * 100
+    assert preview.truncated
+    assert preview.label() == "x" * 100 + "..."
+
+
+def test_size_counts_utf8_bytes() -> None:
+    assert make_preview("あい").size == 6
+
+
+def test_badge() -> None:
+    assert make_preview("one line").badge == ""
+    assert make_preview("a\nb").badge == "[2 lines]"
+    assert make_preview("a" * 2048).badge == "[2.0 KB]"
+    assert format_size(3 * 1024 * 1024) == "3.0 MB"
@@ -0,0 +1,48 @@
+import pytest
+
+from src.utils import latency_stats
+from src.utils.latency_stats import LatencyRegistry, LatencyStats
+
+
+def test_nearest_rank_percentiles() -> None:
+    stats = LatencyStats()
+    for ms in range(100, 0, -1):
+        stats.record(ms / 1000)
+    summary = stats.summary()
+    assert summary["count"] == 100
+    assert summary["total_ms"] == pytest.approx(5050)
+    assert summary["p50_ms"] == pytest.approx(50)
+    assert summary["p95_ms"] == pytest.approx(95)
+    assert summary["p99_ms"] == pytest.approx(99)
+    assert summary["max_ms"] == pytest.approx(100)
+
+
+def test_single_sample_and_empty_stats() -> None:
+    stats = LatencyStats()
+    assert stats.summary()["p50_ms"] == 0.0
+    stats.record(0.002)
+    summary = stats.summary()
+    assert summary["p50_ms"] == summary["p99_ms"] == summary["max_ms"] == pytest.approx(2)
+
+
+def test_percentiles_use_only_the_recent_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(latency_stats, "SAMPLE_WINDOW", 4)
+    stats = LatencyStats()
+    for seconds in (9.0, 1.0, 1.0, 1.0, 1.0):
+        stats.record(seconds)
+    summary = stats.summary()
+    assert summary["count"] == 5
+    assert summary["p99_ms"] == pytest.approx(1000)
+    assert summary["max_ms"] == pytest.approx(9000)
+
+
+def test_registry_sorts_by_total() -> None:
+    registry = LatencyRegistry()
+    registry.record("fast", 0.001)
+    registry.record("slow", 0.5)
+    registry.record("fast", 0.001)
+    summaries = registry.summaries()
+    assert list(summaries) == ["slow", "fast"]
+    assert summaries["fast"]["count"] == 2
+    registry.reset()
+    assert registry.summaries() == {}
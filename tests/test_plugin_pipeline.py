@@ -0,0 +1,105 @@
+import random
+from typing import Any
+
+import pytest
+
+from src.core import plugin_pipeline
+from src.core.exceptions import PluginError
+from src.core.plugin_pipeline import (
+    PluginPipeline,
+    build_pipeline,
+    get_presets,
+    load_pipelines,
+)
+from src.plugins.base_plugin import Plugin
+from src.plugins.duplicate_line_remover_plugin import DuplicateLineRemoverPlugin
+from src.plugins.html_escape_plugin import HTMLEscapePlugin
+from src.plugins.line_sorter_plugin import LineSorterPlugin
+from src.plugins.uppercase_converter_plugin import UppercaseConverterPlugin
+from src.plugins.whitespace_normalizer_plugin import WhitespaceNormalizerPlugin
+
+
+class ReversePlugin(Plugin):
+    """Not pure: its results must not be cached."""
+    @property
+    def name(self) -> str:
+        return "Reverse"
+
+    @property
+    def description(self) -> str:
+        return "Reverses text"
+
+    def process(self, text: str) -> str:
+        return text[::-1]
+
+
+class FakeSettingsManager:
+    def __init__(self, presets: Any) -> None:
+        self.settings = {plugin_pipeline.SETTING_KEY: presets}
+
+    def get_setting(self, key: str, default: Any = None) -> Any:
+        return self.settings.get(key, default)
+
+
+PLUGINS: list[Plugin] = [WhitespaceNormalizerPlugin(), DuplicateLineRemoverPlugin(), LineSorterPlugin(), UppercaseConverterPlugin(), HTMLEscapePlugin(), ReversePlugin()]
+
+
+def random_text(rng: random.Random) -> str:
+    return "".join(rng.choice(["a", "B", " ", "\t", "\n", "\r\n", "<", "&", "é"]) for _ in range(rng.randint(0, 60)))
+
+
+def test_fused_stages_give_the_same_result_as_each_stage_in_turn() -> None:
+    rng = random.Random(0)
+    for _ in range(300):
+        stages = rng.sample(PLUGINS, rng.randint(1, len(PLUGINS)))
+        pipeline = PluginPipeline("Random", stages)
+        text = random_text(rng)
+        expected = text
+        for stage in stages:
+            expected = stage.process(expected)
+        assert pipeline.process(text) == expected, [stage.name for stage in stages]
+
+
+def test_consecutive_line_stages_are_fused() -> None:
+    whitespace, duplicates, sorter, upper, escape = PLUGINS[:5]
+    groups = plugin_pipeline._fuse_line_stages([whitespace, duplicates, upper, sorter, escape, upper])
+    assert groups == [[whitespace, duplicates], upper, [sorter], escape, upper]
+    assert plugin_pipeline._fuse_line_stages([upper]) == [upper]
+
+
+def test_flags_follow_the_stages() -> None:
+    whitespace, duplicates, sorter, upper = PLUGINS[:4]
+    lines = PluginPipeline("Lines", [whitespace, duplicates, sorter])
+    assert (lines.cpu_bound, lines.line_oriented, lines.streaming, lines.pure) == (True, True, True, True)
+    mixed = PluginPipeline("Mixed", [whitespace, upper])
+    assert (mixed.cpu_bound, mixed.line_oriented, mixed.streaming, mixed.pure) == (False, False, False, True)
+
+
+def test_cache_key_is_none_if_a_stage_is_not_cacheable() -> None:
+    whitespace, upper, reverse = PLUGINS[0], PLUGINS[3], PLUGINS[5]
+    key = PluginPipeline("A", [whitespace, upper]).cache_key()
+    assert key is not None
+    assert key == PluginPipeline("Renamed", [whitespace, upper]).cache_key()
+    assert key != PluginPipeline("A", [upper, whitespace]).cache_key()
+    assert PluginPipeline("B", [whitespace, reverse]).cache_key() is None
+
+
+def test_build_pipeline_rejects_unknown_or_missing_stages() -> None:
+    pipeline = build_pipeline("Clean", ["Whitespace Normalizer", "Line Sorter"], PLUGINS)
+    assert [stage.name for stage in pipeline.stages] == ["Whitespace Normalizer", "Line Sorter"]
+    with pytest.raises(PluginError, match="No Such Plugin"):
+        build_pipeline("Broken", ["Line Sorter", "No Such Plugin"], PLUGINS)
+    with pytest.raises(PluginError):
+        build_pipeline("Empty", [], PLUGINS)
+
+
+def test_bad_presets_are_skipped() -> None:
+    settings = FakeSettingsManager({
+        "Good": ["Whitespace Normalizer", "Line Sorter"],
+        "Unknown": ["No Such Plugin"],
+        "Empty": [],
+        "Not A List": "Line Sorter",
+    })
+    assert get_presets(settings) == {"Good": ["Whitespace Normalizer", "Line Sorter"], "Unknown": ["No Such Plugin"], "Empty": []}
+    assert [pipeline.name for pipeline in load_pipelines(settings, PLUGINS)] == ["Good"]
+    assert get_presets(FakeSettingsManager(["not", "a", "dict"])) == {}
@@ -0,0 +1,69 @@
+import sys
+
+from src.core.plugin_result_cache import PluginResultCache
+from src.plugins.base_plugin import Plugin
+
+
+class UpperPlugin(Plugin):
+    pure = True
+
+    @property
+    def name(self) -> str:
+        return "Upper"
+
+    @property
+    def description(self) -> str:
+        return "Uppercases text"
+
+    def process(self, text: str) -> str:
+        return text.upper()
+
+
+class ImpurePlugin(UpperPlugin):
+    pure = False
+
+
+def entry_size(text: str) -> int:
+    return sys.getsizeof(text)
+
+
+def test_least_recently_used_entries_are_evicted_first() -> None:
+    results = {key: f"result {key}" for key in "abc"}
+    cache = PluginResultCache(max_bytes=sum(entry_size(text) for text in results.values()))
+    for key, text in results.items():
+        cache.put(("plugin", key), text)
+    assert cache.get(("plugin", "a")) == "result a"
+    cache.put(("plugin", "d"), "result d")
+    assert cache.get(("plugin", "b")) is None
+    assert cache.get(("plugin", "a")) == "result a"
+    assert cache.get(("plugin", "c")) == "result c"
+    assert cache.size_bytes <= cache.max_bytes
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_replacing_an_entry_keeps_the_size_in_step() -> None:
+    cache = PluginResultCache()
+    cache.put(("plugin", "a"), "short")
+    cache.put(("plugin", "a"), "a much longer result")
+    assert len(cache) == 1
+    assert cache.size_bytes == entry_size("a much longer result")
+    cache.clear()
+    assert (len(cache), cache.size_bytes) == (0, 0)
+
+
+def test_result_larger_than_the_cache_is_not_stored() -> None:
+    cache = PluginResultCache(max_bytes=entry_size("x" * 10))
+    cache.put(("plugin", "small"), "x")
+    cache.put(("plugin", "large"), "x" * 1000)
+    assert cache.get(("plugin", "large")) is None
+    assert cache.get(("plugin", "small")) == "x"
+
+
+def test_keys_depend_on_plugin_version_and_content() -> None:
+    plugin = UpperPlugin()
+    key = PluginResultCache.make_key(plugin, "text")
+    assert key == PluginResultCache.make_key(UpperPlugin(), "text")
+    assert key != PluginResultCache.make_key(plugin, "other text")
+    plugin.version = 2
+    assert key != PluginResultCache.make_key(plugin, "text")
+    assert PluginResultCache.make_key(ImpurePlugin(), "text") is None
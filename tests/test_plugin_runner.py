@@ -0,0 +1,49 @@
+import threading
+import time
+
+from src.core.plugin_result_cache import CacheKey, PluginResultCache
+from src.core.plugin_runner import ItemResult, PluginRunner
+from src.plugins.base_plugin import Plugin
+from src.plugins.uppercase_converter_plugin import UppercaseConverterPlugin
+from tests.fake_tk import FakeTkRoot
+
+
+def run_until_done(root: FakeTkRoot, results: list[list[ItemResult]], timeout: float = 10.0) -> list[ItemResult]:
+    deadline = time.monotonic() + timeout
+    while not results and time.monotonic() < deadline:
+        root.run_pending()
+        time.sleep(0.01)
+    assert results, "the job did not finish"
+    return results[0]
+
+
+class RecordingCache(PluginResultCache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.key_threads: set[int] = set()
+
+    def make_key(self, plugin: Plugin, text: str) -> CacheKey | None:  # type: ignore[override]
+        self.key_threads.add(threading.get_ident())
+        return super().make_key(plugin, text)
+
+
+def test_batch_serves_repeated_and_cached_texts() -> None:
+    root, cache = FakeTkRoot(), RecordingCache()
+    runner = PluginRunner(cache=cache)
+    for expected_hits in (0, 3):
+        results: list[list[ItemResult]] = []
+        runner.run_batch(root, UppercaseConverterPlugin(), ["a", "b", "a", "c"], on_done=results.append, on_error=results.append)
+        assert run_until_done(root, results) == ["A", "B", "A", "C"]
+        assert (cache.hits, cache.misses) == (expected_hits, 3)
+    assert threading.get_ident() not in cache.key_threads
+
+
+def test_cancelled_batch_reports_nothing() -> None:
+    root = FakeTkRoot()
+    results: list[list[ItemResult]] = []
+    job = PluginRunner().run_batch(root, UppercaseConverterPlugin(), ["a"] * 100, on_done=results.append, on_error=results.append)
+    job.cancel()
+    time.sleep(0.1)
+    root.run_pending()
+    assert results == []
+    assert not job.is_running
@@ -0,0 +1,88 @@
+import os
+import random
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import pytest
+
+from src.core import plugin_stream
+from src.core.exceptions import PluginCancelledError
+from src.core.plugin_pipeline import PluginPipeline
+from src.plugins import line_sorter_plugin
+from src.plugins.base_plugin import Plugin
+from src.plugins.duplicate_line_remover_plugin import DuplicateLineRemoverPlugin
+from src.plugins.line_sorter_plugin import LineSorterPlugin
+from src.plugins.whitespace_normalizer_plugin import WhitespaceNormalizerPlugin
+
+# Every line boundary str.splitlines() knows, including "\r\n" split across chunks
+ALPHABET = ["a", "b", " ", "\t", "\n", "\r", "\r\n", "\x0b", "\x0c", "\x1c", "\x85", " ", "é"]
+
+
+def random_texts(count: int) -> list[str]:
+    rng = random.Random(0)
+    return ["".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 40))) for _ in range(count)]
+
+
+def streaming_plugins() -> list[Plugin]:
+    plugins: list[Plugin] = [LineSorterPlugin(), DuplicateLineRemoverPlugin(), WhitespaceNormalizerPlugin()]
+    return [*plugins, PluginPipeline("All", plugins[::-1])]
+
+
+def test_iter_lines_matches_splitlines() -> None:
+    for text in random_texts(2000):
+        for size in (1, 2, 3, 7):
+            assert list(plugin_stream.iter_lines(plugin_stream.iter_text_chunks(text, size))) == text.splitlines()
+
+
+def test_write_lines_matches_join(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(plugin_stream, "WRITE_BATCH_LINES", 3)
+    for count in range(10):
+        lines = [f"line {i}" for i in range(count)] + [""] * (count % 3)
+        parts: list[str] = []
+        plugin_stream.write_lines(parts.append, lines)
+        assert "".join(parts) == "\n".join(lines)
+
+
+def test_streaming_gives_the_same_result_as_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(plugin_stream, "STREAM_MIN_CHARS", 0)
+    monkeypatch.setattr(plugin_stream, "CHUNK_CHARS", 5)
+    monkeypatch.setattr(line_sorter_plugin, "SORT_RUN_CHARS", 7)  # Spill and merge several runs
+    for text in random_texts(300):
+        for plugin in streaming_plugins():
+            assert plugin_stream.process_text(plugin, text) == plugin.process(text)
+
+
+def test_process_file_replaces_the_input_in_place(tmp_path: Path) -> None:
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"b\r\na\n\nc")
+    assert plugin_stream.process_file(LineSorterPlugin(), str(path), str(path)) == str(path)
+    assert path.read_bytes() == LineSorterPlugin().process("b\r\na\n\nc").encode()
+    assert os.listdir(tmp_path) == ["lines.txt"]
+
+
+def test_cancelled_process_file_leaves_the_output_untouched(tmp_path: Path) -> None:
+    input_path, output_path = tmp_path / "in.txt", tmp_path / "out.txt"
+    input_path.write_text("\n".join(str(i) for i in range(10_000)), encoding="utf-8")
+    output_path.write_text("original", encoding="utf-8")
+    cancel_event = threading.Event()
+    cancel_event.set()
+    with pytest.raises(PluginCancelledError):
+        plugin_stream.process_file(WhitespaceNormalizerPlugin(), str(input_path), str(output_path), cancel_event=cancel_event)
+    assert output_path.read_text(encoding="utf-8") == "original"
+    assert sorted(os.listdir(tmp_path)) == ["in.txt", "out.txt"]
+
+
+class FailingPlugin(WhitespaceNormalizerPlugin):
+    def process_stream(self, lines: Iterable[str]) -> Iterator[str]:
+        yield from lines
+        raise RuntimeError("plugin failed")
+
+
+def test_failed_process_file_removes_the_partial_output(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(plugin_stream, "WRITE_BATCH_LINES", 1)
+    input_path, output_path = tmp_path / "in.txt", tmp_path / "out.txt"
+    input_path.write_text("a\nb\nc", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        plugin_stream.process_file(FailingPlugin(), str(input_path), str(output_path))
+    assert os.listdir(tmp_path) == ["in.txt"]
@@ -0,0 +1,48 @@
+import tkinter as tk
+from collections.abc import Iterator
+
+import pytest
+
+from src.gui.custom_widgets import SearchableCombobox
+
+
+@pytest.fixture
+def root() -> Iterator[tk.Tk]:
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+def make_combobox(root: tk.Tk, value: str) -> tuple[SearchableCombobox, tk.StringVar]:
+    var = tk.StringVar(root, value=value)
+    return SearchableCombobox(root, values=["Arial", "Courier New"], extra_values=["TkDefaultFont"], textvariable=var), var
+
+
+def test_typed_text_is_matched_or_reverted(root: tk.Tk) -> None:
+    combobox, var = make_combobox(root, "Arial")
+    var.set("courier new")
+    assert combobox.commit() == "Courier New"
+    var.set("Not A Font")
+    assert combobox.commit() == "Courier New"
+    assert var.get() == "Courier New"
+
+
+def test_restored_values_survive_save(root: tk.Tk) -> None:
+    # Restore Defaults / Import Settings, then _save_settings_logic()
+    combobox, var = make_combobox(root, "Arial")
+    combobox.set_committed("TkDefaultFont")
+    assert combobox.commit() == "TkDefaultFont"
+    combobox.set_committed("Font Installed Elsewhere")
+    assert combobox.commit() == "Font Installed Elsewhere"
+    var.set("typo")
+    assert combobox.commit() == "Font Installed Elsewhere"
+
+
+def test_named_fonts_are_accepted_when_typed(root: tk.Tk) -> None:
+    combobox, var = make_combobox(root, "Arial")
+    var.set("tkdefaultfont")
+    assert combobox.commit() == "TkDefaultFont"
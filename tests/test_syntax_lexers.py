@@ -0,0 +1,57 @@
+import pytest
+
+from src.utils.syntax_lexers import detect_language, highlight, tokenize
+
+
+@pytest.mark.parametrize(("text", "language"), [
+    ('{"name": "value", "count": 3}', "json"),
+    ("  [1, 2, 3]", "json"),
+    ('<?xml version="1.0"?>\n<root/>', "xml"),
+    ("2024-01-02 03:04:05 INFO started\n2024-01-02 03:04:06 ERROR failed", "log"),
+    ("select id from users where id = 1", "sql"),
+    ("import os\n\ndef main():\n    pass", "python"),
+    ("just some plain text", None),
+    ("{not json}", None),
+    ("ERROR only once", None),
+])
+def test_detect_language(text: str, language: str | None) -> None:
+    assert detect_language(text) == language
+
+
+def test_tokenize_columns_are_relative_to_each_line() -> None:
+    result = tokenize('{\n  "key": 12,\n  "flag": true\n}', "json")
+    assert result is not None
+    assert result.language == "json"
+    assert result.lines == {
+        2: [("key", 2, 7), ("number", 9, 11)],
+        3: [("key", 2, 8), ("keyword", 10, 14)],
+    }
+
+
+def test_multi_line_tokens_are_split_per_line() -> None:
+    text = 'x = 1\ns = """first\nsecond\n"""  # done'
+    result = tokenize(text, "python")
+    assert result is not None
+    assert result.lines == {
+        1: [("number", 4, 5)],
+        2: [("string", 4, 12)],
+        3: [("string", 0, 6)],
+        4: [("string", 0, 3), ("comment", 5, 11)],
+    }
+
+
+def test_multi_line_token_ending_at_the_end_of_text() -> None:
+    result = tokenize("SELECT 1 /* a\nb */", "sql")
+    assert result is not None
+    assert result.lines == {1: [("keyword", 0, 6), ("number", 7, 8), ("comment", 9, 13)], 2: [("comment", 0, 4)]}
+
+
+def test_tokenize_returns_none_when_cancelled() -> None:
+    assert tokenize('{"a": 1}', "json", lambda: True) is None
+
+
+def test_highlight_skips_plain_text() -> None:
+    result = highlight("hello world")
+    assert result is not None
+    assert result.language is None
+    assert result.lines == {}
@@ -0,0 +1,41 @@
+import pytest
+
+from src.plugins.unit_converter_plugin import convert_batch, evaluate_expression
+
+
+@pytest.mark.parametrize(("text", "expected"), [
+    ("3 * 12 + 5", 41.0),
+    ("(72 - 32) / 1.8", 40 / 1.8),
+    ("-2 ** 2", -4.0),
+    ("7 // 2 + 7 % 2", 4.0),
+    (" 1.5 ", 1.5),
+])
+def test_evaluates_arithmetic(text: str, expected: float) -> None:
+    assert evaluate_expression(text) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("text", [
+    "__import__('os')",
+    "abs(-1)",
+    "x + 1",
+    "True + 1",
+    "'a' * 3",
+    "1 +",
+    "1 / 0",
+    "9 ** 9 ** 9",
+    "1" * 400 + " + 1",
+    "(" * 300 + "1" + ")" * 300,
+    "-" * 100_000 + "1",
+])
+def test_rejects_unsafe_or_invalid_input(text: str) -> None:
+    with pytest.raises(ValueError):
+        evaluate_expression(text)
+
+
+def test_batch_marks_only_failed_lines() -> None:
+    values = ["1", "", "2 * 50", "abc", "1" * 400 + " + 1"]
+    assert convert_batch(values, "Length", "Meter", "Centimeter") == ["100.0000", "", "10000.0000", "Error", "Error"]
+
+
+def test_batch_converts_temperatures() -> None:
+    assert convert_batch(["100", "-40"], "Temperature", "Celsius", "Fahrenheit") == ["212.0000", "-40.0000"]
@@ -0,0 +1,72 @@
+import random
+from collections.abc import Hashable, Sequence
+
+from src.gui.custom_widgets import VirtualListbox
+
+ROW_HEIGHT = 20
+
+
+def make_listbox(item_ids: Sequence[Hashable], top: int = 0, selected: set[Hashable] | None = None) -> VirtualListbox:
+    # edit_items() only touches the row model, so the widget itself is not created
+    listbox = VirtualListbox.__new__(VirtualListbox)
+    listbox._row_height = ROW_HEIGHT
+    listbox._item_ids = list(item_ids)
+    listbox._index_by_id = None
+    listbox._top = top
+    listbox._selected_ids = set(selected or ())
+    return listbox
+
+
+def edit_one_by_one(item_ids: list[Hashable], top: int, removed: set[Hashable], inserted: list[tuple[int, Hashable]]) -> tuple[list[Hashable], int]:
+    for item_id in removed:
+        if item_id in item_ids:
+            if item_ids.index(item_id) * ROW_HEIGHT < top:
+                top -= ROW_HEIGHT
+            item_ids.remove(item_id)
+    for index, item_id in inserted:
+        index = max(0, min(index, len(item_ids)))
+        if top > 0 and index * ROW_HEIGHT < top:
+            top += ROW_HEIGHT
+        item_ids.insert(index, item_id)
+    return item_ids, top
+
+
+def test_insert_only_shifts_the_offset_for_rows_above_the_viewport() -> None:
+    listbox = make_listbox(["a", "b", "c", "d"], top=2 * ROW_HEIGHT)
+    listbox.edit_items((), [(0, "x"), (3, "y"), (10, "z")])
+    assert listbox.item_ids == ["x", "a", "b", "y", "c", "d", "z"]
+    assert listbox._top == 3 * ROW_HEIGHT
+
+
+def test_inserting_at_the_top_keeps_a_list_scrolled_to_the_top() -> None:
+    listbox = make_listbox(["a", "b"])
+    listbox.edit_items((), [(0, "x")])
+    assert listbox.item_ids == ["x", "a", "b"]
+    assert listbox._top == 0
+
+
+def test_removed_rows_lose_their_selection_unless_kept() -> None:
+    listbox = make_listbox(["a", "b", "c", "d"], top=3 * ROW_HEIGHT, selected={"a", "b", "d"})
+    listbox.edit_items({"a", "b", "missing"}, [(1, "b")], keep_selection={"b"})
+    assert listbox.item_ids == ["c", "b", "d"]
+    assert listbox._selected_ids == {"b", "d"}
+    assert listbox._top == ROW_HEIGHT
+    assert listbox._get_index_by_id() == {"c": 0, "b": 1, "d": 2}
+
+
+def test_merge_matches_inserting_one_by_one() -> None:
+    rng = random.Random(1234)
+    for _ in range(500):
+        item_ids = list(range(rng.randint(0, 30)))
+        top = rng.randint(0, len(item_ids)) * ROW_HEIGHT
+        removed = set(rng.sample(range(40), rng.randint(0, 8)))
+        # Distinct target indexes, some past the end of the list
+        indexes = sorted(rng.sample(range(len(item_ids) + 8), rng.randint(0, 8)))
+        inserted = [(index, f"new{n}") for n, index in enumerate(indexes)]
+
+        listbox = make_listbox(item_ids, top=top)
+        listbox.edit_items(removed, inserted)
+
+        expected_ids, expected_top = edit_one_by_one(list(item_ids), top, removed, inserted)
+        assert listbox.item_ids == expected_ids
+        assert listbox._top == expected_top
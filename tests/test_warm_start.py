@@ -0,0 +1,35 @@
+import json
+from pathlib import Path
+
+from src.core.history_preview import make_preview
+from src.core.warm_start import (
+    SNAPSHOT_VERSION,
+    WarmStartRow,
+    read_snapshot,
+    write_snapshot,
+)
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    path = str(tmp_path / "snapshot.jsonl")
+    history = [("pinned\nitem", True, 3.0), ("  spaced   text ", False, 2.0), ("あ" * 500, False, 1.0)]
+    previews = {3.0: make_preview("pinned\nitem")}
+    write_snapshot(path, history, previews)
+    assert read_snapshot(path) == [WarmStartRow(item_id, is_pinned, make_preview(content)) for content, is_pinned, item_id in history]
+
+
+def test_only_the_first_rows_are_written(tmp_path: Path) -> None:
+    path = str(tmp_path / "snapshot.jsonl")
+    history = [(f"item {i}", False, float(i)) for i in range(10)]
+    write_snapshot(path, history, {}, rows=3)
+    assert [row.item_id for row in read_snapshot(path)] == [0.0, 1.0, 2.0]
+    assert not (tmp_path / "snapshot.jsonl.tmp").exists()
+
+
+def test_missing_stale_or_corrupt_snapshot_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "snapshot.jsonl"
+    assert read_snapshot(str(path)) == []
+    path.write_text(json.dumps({"version": SNAPSHOT_VERSION + 1}) + "\n" + json.dumps([1.0, False, "a", False, 1, 1]) + "\n", encoding="utf-8")
+    assert read_snapshot(str(path)) == []
+    path.write_text(json.dumps({"version": SNAPSHOT_VERSION}) + "\n[1.0, false\n", encoding="utf-8")
+    assert read_snapshot(str(path)) == []